@@ -5,4 +5,9 @@ Module de configuration pour TerraGenesis PC
 from .settings import GameSettings
 from .constants import *
 
-__all__ = ['GameSettings', 'WINDOW_WIDTH', 'WINDOW_HEIGHT', 'GAME_TITLE']
+__all__ = ['GameSettings', 'WINDOW_WIDTH', 'WINDOW_HEIGHT', 'GAME_TITLE',
+           'COLORS', 'HABITABILITY_TOLERANCE',
+           'TOLERANCE_TEMPERATURE', 'TOLERANCE_PRESSURE', 'TOLERANCE_OXYGEN',
+           'COLOR_BACKGROUND', 'COLOR_PANEL', 'COLOR_TEXT', 'COLOR_ACCENT',
+           'COLOR_SUCCESS', 'COLOR_WARNING', 'COLOR_DANGER',
+           'COLOR_TEMPERATURE', 'COLOR_PRESSURE', 'COLOR_OXYGEN']
@@ -2,6 +2,8 @@
 Constantes globales pour TerraGenesis PC
 """
 
+from types import MappingProxyType as _MappingProxyType
+
 # Configuration de la fenêtre
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
@@ -19,6 +21,10 @@ INITIAL_SCIENCE = 0
 
 # Vitesse de simulation (en millisecondes)
 SIMULATION_TICK_RATE = 1000  # 1 seconde
+MIN_TICK_DELTA = 1 / 30      # Durée réelle minimale (en secondes) d'un pas de simulation
+
+# Nombre maximal d'entrées conservées dans les historiques (graphiques)
+HISTORY_LENGTH = 100
 
 # Limites des paramètres planétaires
 MIN_TEMPERATURE = -273.15  # Zéro absolu en Celsius
@@ -33,15 +39,20 @@ TARGET_TEMPERATURE = 15.0   # 15°C
 TARGET_PRESSURE = 1.0       # 1 atmosphère
 TARGET_OXYGEN = 21.0        # 21% d'oxygène
 
-# Tolérance pour considérer une planète comme habitable
-HABITABILITY_TOLERANCE = {
+# Tolérance pour considérer une planète comme habitable (lecture seule)
+HABITABILITY_TOLERANCE = _MappingProxyType({
     'temperature': 20.0,  # ±20°C
     'pressure': 0.3,      # ±0.3 atm
     'oxygen': 5.0         # ±5%
-}
+})
+
+# Accès direct aux tolérances pour les calculs fréquents
+TOLERANCE_TEMPERATURE = HABITABILITY_TOLERANCE['temperature']
+TOLERANCE_PRESSURE = HABITABILITY_TOLERANCE['pressure']
+TOLERANCE_OXYGEN = HABITABILITY_TOLERANCE['oxygen']
 
-# Couleurs de l'interface (format RGB)
-COLORS = {
+# Couleurs de l'interface (format RGB, lecture seule)
+COLORS = _MappingProxyType({
     'background': (20, 25, 40),
     'panel': (40, 45, 60),
     'text': (255, 255, 255),
@@ -52,14 +63,38 @@ COLORS = {
     'temperature': (255, 100, 100),
     'pressure': (100, 150, 255),
     'oxygen': (100, 255, 150)
-}
+})
+
+# Accès direct aux couleurs pour le rendu
+COLOR_BACKGROUND = COLORS['background']
+COLOR_PANEL = COLORS['panel']
+COLOR_TEXT = COLORS['text']
+COLOR_ACCENT = COLORS['accent']
+COLOR_SUCCESS = COLORS['success']
+COLOR_WARNING = COLORS['warning']
+COLOR_DANGER = COLORS['danger']
+COLOR_TEMPERATURE = COLORS['temperature']
+COLOR_PRESSURE = COLORS['pressure']
+COLOR_OXYGEN = COLORS['oxygen']
 
 # Chemins des fichiers
 PLANETS_DATA_FILE = "data/planets.json"
 TECHNOLOGIES_DATA_FILE = "data/technologies.json"
 EVENTS_DATA_FILE = "data/events.json"
+EVENTS_CACHE_FILE = "data/events.pkl"  # Cache généré à partir de EVENTS_DATA_FILE
 SAVES_DIRECTORY = "data/saves"
+SAVES_INDEX_FILE = "data/saves_index.json"  # Métadonnées des sauvegardes, par fichier
 
 # Configuration audio
 DEFAULT_MUSIC_VOLUME = 0.7
-DEFAULT_SFX_VOLUME = 0.8
\ No newline at end of file
+DEFAULT_SFX_VOLUME = 0.8
+SFX_CHANNELS = 16  # Canaux du mixeur, dont le premier est réservé au clic des boutons
+
+# Taille du tampon du mixeur (échantillons) selon la plateforme: trop petit, il
+# provoque des sous-alimentations (craquements) sous Linux; trop grand, de la latence
+AUDIO_BUFFER_SIZES = {
+    'win32': 512,
+    'linux': 1024,
+    'darwin': 2048
+}
+DEFAULT_AUDIO_BUFFER = 1024
\ No newline at end of file
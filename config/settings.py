@@ -2,16 +2,58 @@
 Gestionnaire des paramètres du jeu TerraGenesis PC
 """
 
-import json
 import os
+import sys
+from types import MappingProxyType
 from typing import Dict, Any
 
+from utils import json_io
+from config.constants import AUDIO_BUFFER_SIZES, DEFAULT_AUDIO_BUFFER
+
+# Paramètres par défaut (lecture seule, copiés pour chaque instance)
+_DEFAULT_SETTINGS = MappingProxyType({
+    # Paramètres d'affichage
+    "fullscreen": False,
+    "window_width": 1200,
+    "window_height": 800,
+    "vsync": True,
+    
+    # Paramètres audio
+    "music_enabled": True,
+    "music_volume": 0.7,
+    "sfx_enabled": True,
+    "sfx_volume": 0.8,
+    "audio_buffer": AUDIO_BUFFER_SIZES.get(sys.platform, DEFAULT_AUDIO_BUFFER),
+    
+    # Paramètres de gameplay
+    "auto_save": True,
+    "auto_save_interval": 300,  # 5 minutes
+    "simulation_speed": 1.0,
+    "show_tooltips": True,
+    "difficulty": "normal",  # easy, normal, hard
+    
+    # Paramètres de langue
+    "language": "fr",
+    
+    # Paramètres avancés
+    "debug_mode": False,
+    "show_fps": False
+})
+
 class GameSettings:
     """
     Classe pour gérer les paramètres du jeu
     Sauvegarde et charge automatiquement depuis un fichier JSON
+    
+    Les paramètres connus sont aussi exposés comme attributs (slots),
+    synchronisés avec le dictionnaire à chaque chargement ou modification
     """
     
+    # Paramètres exposés directement comme attributs
+    _ATTRIBUTE_KEYS = tuple(_DEFAULT_SETTINGS)
+    
+    __slots__ = ("settings_file", "settings", "_dirty") + _ATTRIBUTE_KEYS
+    
     def __init__(self, settings_file: str = "settings.json"):
         """
         Initialise les paramètres du jeu
@@ -21,6 +63,8 @@ class GameSettings:
         """
         self.settings_file = settings_file
         self.settings = self._load_default_settings()
+        self._sync_attributes()
+        self._dirty = True  # Rien n'est encore écrit sur le disque
         self.load_settings()
     
     def _load_default_settings(self) -> Dict[str, Any]:
@@ -30,33 +74,7 @@ class GameSettings:
         Returns:
             Dictionnaire des paramètres par défaut
         """
-        return {
-            # Paramètres d'affichage
-            "fullscreen": False,
-            "window_width": 1200,
-            "window_height": 800,
-            "vsync": True,
-            
-            # Paramètres audio
-            "music_enabled": True,
-            "music_volume": 0.7,
-            "sfx_enabled": True,
-            "sfx_volume": 0.8,
-            
-            # Paramètres de gameplay
-            "auto_save": True,
-            "auto_save_interval": 300,  # 5 minutes
-            "simulation_speed": 1.0,
-            "show_tooltips": True,
-            "difficulty": "normal",  # easy, normal, hard
-            
-            # Paramètres de langue
-            "language": "fr",
-            
-            # Paramètres avancés
-            "debug_mode": False,
-            "show_fps": False
-        }
+        return dict(_DEFAULT_SETTINGS)
     
     def load_settings(self):
         """
@@ -64,11 +82,12 @@ class GameSettings:
         """
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    # Fusionner avec les paramètres par défaut
-                    self.settings.update(loaded_settings)
-                    print(f"Paramètres chargés depuis {self.settings_file}")
+                loaded_settings = json_io.load_file(self.settings_file)
+                # Fusionner avec les paramètres par défaut
+                self.settings.update(loaded_settings)
+                self._sync_attributes()
+                self._dirty = False
+                print(f"Paramètres chargés depuis {self.settings_file}")
             else:
                 print("Fichier de paramètres non trouvé, utilisation des valeurs par défaut")
                 self.save_settings()  # Créer le fichier avec les valeurs par défaut
@@ -79,10 +98,14 @@ class GameSettings:
     def save_settings(self):
         """
         Sauvegarde les paramètres dans le fichier JSON
+        N'écrit rien si aucun paramètre n'a changé depuis la dernière écriture
         """
+        if not self._dirty:
+            return
+        
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+            json_io.dump_file(self.settings, self.settings_file, atomic=True)
+            self._dirty = False
             print(f"Paramètres sauvegardés dans {self.settings_file}")
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des paramètres: {e}")
@@ -94,7 +117,7 @@ class GameSettings:
         Args:
             key: Clé du paramètre
             default: Valeur par défaut si la clé n'existe pas
-            
+        
         Returns:
             Valeur du paramètre
         """
@@ -108,45 +131,17 @@ class GameSettings:
             key: Clé du paramètre
             value: Nouvelle valeur
         """
+        if key in self.settings and self.settings[key] == value:
+            return
+        
         self.settings[key] = value
+        self._dirty = True
+        if key in self._ATTRIBUTE_KEYS:
+            setattr(self, key, value)
     
-    # Propriétés pour un accès facile aux paramètres courants
-    @property
-    def fullscreen(self) -> bool:
-        return self.settings["fullscreen"]
-    
-    @property
-    def window_width(self) -> int:
-        return self.settings["window_width"]
-    
-    @property
-    def window_height(self) -> int:
-        return self.settings["window_height"]
-    
-    @property
-    def music_enabled(self) -> bool:
-        return self.settings["music_enabled"]
-    
-    @property
-    def music_volume(self) -> float:
-        return self.settings["music_volume"]
-    
-    @property
-    def sfx_enabled(self) -> bool:
-        return self.settings["sfx_enabled"]
-    
-    @property
-    def sfx_volume(self) -> float:
-        return self.settings["sfx_volume"]
-    
-    @property
-    def auto_save(self) -> bool:
-        return self.settings["auto_save"]
-    
-    @property
-    def simulation_speed(self) -> float:
-        return self.settings["simulation_speed"]
-    
-    @property
-    def difficulty(self) -> str:
-        return self.settings["difficulty"]
\ No newline at end of file
+    def _sync_attributes(self):
+        """
+        Recopie les paramètres connus du dictionnaire vers les attributs
+        """
+        for key in self._ATTRIBUTE_KEYS:
+            setattr(self, key, self.settings[key])
\ No newline at end of file
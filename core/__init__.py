@@ -1,11 +1,28 @@
 """
 Module principal du moteur de jeu TerraGenesis PC
+Les classes sont importées à la demande (PEP 562) pour alléger l'import du paquet
 """
 
-from .game_engine import GameEngine
-from .planet import Planet
-from .resources import ResourceManager
-from .technology import TechnologyTree
-from .events import EventManager
+import importlib
 
-__all__ = ['GameEngine', 'Planet', 'ResourceManager', 'TechnologyTree', 'EventManager']
+_LAZY_IMPORTS = {
+    'GameEngine': '.game_engine',
+    'Planet': '.planet',
+    'PlanetPool': '.planet',
+    'ResourceManager': '.resources',
+    'TechnologyTree': '.technology',
+    'EventManager': '.events'
+}
+
+__all__ = ['GameEngine', 'Planet', 'PlanetPool', 'ResourceManager', 'TechnologyTree', 'EventManager']
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,26 @@
+"""
+Compilation optionnelle des noyaux de calcul avec Numba
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba est optionnel
+    njit = None
+
+# True si les noyaux sont réellement compilés
+JIT_ENABLED = njit is not None
+
+def jit_kernel(func):
+    """
+    Compile une fonction avec Numba si disponible
+    
+    Args:
+        func: Fonction à compiler
+    
+    Returns:
+        Fonction compilée, ou la fonction d'origine sans Numba
+    """
+    if njit is None:
+        return func
+    # cache=True évite de recompiler à chaque lancement du jeu
+    return njit(cache=True, fastmath=True)(func)
@@ -0,0 +1,94 @@
+"""
+Noyaux de calcul de la simulation planétaire
+Compilés avec Numba lorsqu'il est installé, sinon exécutés en Python pur
+"""
+
+import numpy as np
+
+from config.constants import (
+    MIN_TEMPERATURE, MAX_TEMPERATURE, MIN_PRESSURE, MAX_PRESSURE,
+    MIN_OXYGEN, MAX_OXYGEN, TARGET_TEMPERATURE, TARGET_PRESSURE, TARGET_OXYGEN,
+    TOLERANCE_TEMPERATURE, TOLERANCE_PRESSURE, TOLERANCE_OXYGEN
+)
+
+from ._jit import JIT_ENABLED, jit_kernel
+
+@jit_kernel
+def habitability_kernel(temperature, pressure, oxygen):
+    """
+    Calcule le pourcentage d'habitabilité pour des paramètres donnés
+    
+    Args:
+        temperature: Température en °C
+        pressure: Pression en atm
+        oxygen: Taux d'oxygène en %
+    
+    Returns:
+        Pourcentage d'habitabilité (0-100)
+    """
+    # Calculer les scores individuels (0-1)
+    temp_score = 1.0 - abs(temperature - TARGET_TEMPERATURE) / TOLERANCE_TEMPERATURE
+    pressure_score = 1.0 - abs(pressure - TARGET_PRESSURE) / TOLERANCE_PRESSURE
+    oxygen_score = 1.0 - abs(oxygen - TARGET_OXYGEN) / TOLERANCE_OXYGEN
+    temp_score = 0.0 if temp_score < 0.0 else temp_score
+    pressure_score = 0.0 if pressure_score < 0.0 else pressure_score
+    oxygen_score = 0.0 if oxygen_score < 0.0 else oxygen_score
+    
+    # Score global (moyenne pondérée)
+    habitability = (temp_score * 0.4 + pressure_score * 0.3 + oxygen_score * 0.3) * 100.0
+    
+    return 0.0 if habitability < 0.0 else (100.0 if habitability > 100.0 else habitability)
+
+@jit_kernel
+def tick_kernel(base_temperature, base_pressure, base_oxygen,
+                temperature_modifier, pressure_modifier, oxygen_modifier):
+    """
+    Calcule les paramètres atmosphériques bornés et l'habitabilité en une passe
+    
+    Args:
+        base_temperature: Température de base de la planète
+        base_pressure: Pression de base de la planète
+        base_oxygen: Taux d'oxygène de base de la planète
+        temperature_modifier: Modificateur de température des bâtiments
+        pressure_modifier: Modificateur de pression des bâtiments
+        oxygen_modifier: Modificateur d'oxygène des bâtiments
+    
+    Returns:
+        Tuple (température, pression, oxygène, habitabilité)
+    """
+    # Bornes écrites en expressions conditionnelles: pas d'appel à min/max en
+    # Python pur, et un motif que LLVM compile en MINSD/MAXSD sans branchement
+    temperature = base_temperature + temperature_modifier
+    temperature = (MIN_TEMPERATURE if temperature < MIN_TEMPERATURE
+                   else (MAX_TEMPERATURE if temperature > MAX_TEMPERATURE else temperature))
+    pressure = base_pressure + pressure_modifier
+    pressure = (MIN_PRESSURE if pressure < MIN_PRESSURE
+                else (MAX_PRESSURE if pressure > MAX_PRESSURE else pressure))
+    oxygen = base_oxygen + oxygen_modifier
+    oxygen = (MIN_OXYGEN if oxygen < MIN_OXYGEN
+              else (MAX_OXYGEN if oxygen > MAX_OXYGEN else oxygen))
+    
+    return temperature, pressure, oxygen, habitability_kernel(temperature, pressure, oxygen)
+
+_TARGETS = np.array([TARGET_TEMPERATURE, TARGET_PRESSURE, TARGET_OXYGEN])
+_TOLERANCES = np.array([TOLERANCE_TEMPERATURE, TOLERANCE_PRESSURE, TOLERANCE_OXYGEN])
+_WEIGHTS = np.array([0.4, 0.3, 0.3]) * 100.0
+
+def habitability_array(values: np.ndarray) -> np.ndarray:
+    """
+    Calcule l'habitabilité de plusieurs planètes à la fois
+    
+    Args:
+        values: Tableau (N, 3) des températures, pressions et taux d'oxygène
+    
+    Returns:
+        Tableau (N,) des pourcentages d'habitabilité (0-100)
+    """
+    # Scores individuels (0-1), puis moyenne pondérée
+    scores = 1.0 - np.abs(values - _TARGETS) / _TOLERANCES
+    np.maximum(scores, 0.0, out=scores)
+    return np.clip(scores @ _WEIGHTS, 0.0, 100.0)
+
+# Préchauffer les noyaux compilés pour que le premier tick ne bloque pas
+if JIT_ENABLED:
+    tick_kernel(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
@@ -0,0 +1,67 @@
+"""
+Noyaux de calcul des ressources
+Compilés avec Numba lorsqu'il est installé, sinon exécutés en Python pur
+"""
+
+from ._jit import JIT_ENABLED, jit_kernel
+
+@jit_kernel
+def resource_tick_kernel(credits, energy, science,
+                         credits_rate, energy_rate, science_rate,
+                         max_energy, max_science, delta_time):
+    """
+    Applique la production d'un tick et borne les ressources
+    
+    Args:
+        credits: Crédits actuels
+        energy: Énergie actuelle
+        science: Science actuelle
+        credits_rate: Production nette de crédits par seconde
+        energy_rate: Production nette d'énergie par seconde
+        science_rate: Production nette de science par seconde
+        max_energy: Capacité maximale d'énergie
+        max_science: Capacité maximale de science
+        delta_time: Temps écoulé (en secondes)
+    
+    Returns:
+        Tuple (crédits, énergie, science)
+    """
+    credits += credits_rate * delta_time
+    energy += energy_rate * delta_time
+    science += science_rate * delta_time
+    
+    # Les crédits ne peuvent pas être négatifs, les autres ressources sont plafonnées
+    credits = 0.0 if credits < 0.0 else credits
+    energy = 0.0 if energy < 0.0 else (max_energy if energy > max_energy else energy)
+    science = 0.0 if science < 0.0 else (max_science if science > max_science else science)
+    
+    return credits, energy, science
+
+@jit_kernel
+def production_kernel(credits, energy, science, consumption, habitability):
+    """
+    Calcule les taux de production finaux à partir des totaux des bâtiments
+    
+    Args:
+        credits: Production de crédits des bâtiments
+        energy: Production d'énergie des bâtiments
+        science: Production de science des bâtiments
+        consumption: Consommation d'énergie des bâtiments
+        habitability: Habitabilité de la planète (0-100)
+    
+    Returns:
+        Tuple (crédits/s, énergie/s, science/s, consommation/s)
+    """
+    habitability_bonus = habitability / 100.0
+    
+    # Production de base (1 crédit par seconde), puis bonus d'habitabilité:
+    # plus la planète est habitable, plus elle génère de revenus
+    credits_per_second = (1.0 + credits) * (1.0 + habitability_bonus * 0.5)
+    science_per_second = science * (1.0 + habitability_bonus * 0.3)
+    
+    return credits_per_second, energy, science_per_second, consumption
+
+# Préchauffer les noyaux compilés pour que le premier tick ne bloque pas
+if JIT_ENABLED:
+    resource_tick_kernel(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0)
+    production_kernel(0.0, 0.0, 0.0, 0.0, 0.0)
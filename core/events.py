@@ -2,17 +2,76 @@
 Système d'événements aléatoires pour TerraGenesis PC
 """
 
-import json
-import random
+import bisect
+import logging
+import os
+import pickle
 import time
+from functools import partial
 from typing import Dict, List, Optional
-from config.constants import EVENTS_DATA_FILE
+from config.constants import EVENTS_DATA_FILE, EVENTS_CACHE_FILE
+from utils import json_io
+
+logger = logging.getLogger(__name__)
+
+# Vérifications des prérequis d'événements: check(seuil, planète, ressources) -> bool
+def _check_min_buildings(minimum, planet, resource_manager) -> bool:
+    return sum(planet.buildings.values()) >= minimum
+
+def _check_planets(planets, planet, resource_manager) -> bool:
+    return planet.name in planets
+
+def _check_min_habitability(minimum, planet, resource_manager) -> bool:
+    return planet.calculate_habitability() >= minimum
+
+def _check_min_science(minimum, planet, resource_manager) -> bool:
+    return resource_manager.science >= minimum
+
+def _check_min_research_labs(minimum, planet, resource_manager) -> bool:
+    return planet.buildings.get('research_lab', 0) >= minimum
+
+def _check_min_mining_facilities(minimum, planet, resource_manager) -> bool:
+    return planet.buildings.get('mining_facility', 0) >= minimum
+
+def _check_min_pressure(minimum, planet, resource_manager) -> bool:
+    return planet.pressure >= minimum
+
+# Ordre d'évaluation des prérequis (les moins coûteux d'abord)
+_REQUIREMENT_CHECKS = {
+    'min_buildings': _check_min_buildings,
+    'planets': _check_planets,
+    'min_habitability': _check_min_habitability,
+    'min_science': _check_min_science,
+    'min_research_labs': _check_min_research_labs,
+    'min_mining_facilities': _check_min_mining_facilities,
+    'min_pressure': _check_min_pressure
+}
+
+# Effets instantanés sur les ressources: (clé d'effet, ressource, est un coût)
+_INSTANT_RESOURCE_EFFECTS = (
+    ('credits_bonus', 'credits', False),
+    ('credits_cost', 'credits', True),
+    ('energy_bonus', 'energy', False),
+    ('energy_cost', 'energy', True),
+    ('science_bonus', 'science', False)
+)
+
+# Nombre de tirages à partir duquel les probabilités sont testées en bloc avec numpy
+_VECTORIZED_ROLL_THRESHOLD = 32
+
+# Facteur d'application graduelle des modificateurs atmosphériques par tick
+_CONTINUOUS_EFFECT_SCALE = 0.001
 
 class GameEvent:
     """
     Classe représentant un événement de jeu
     """
     
+    __slots__ = ('id', 'name', 'description', 'type', 'probability', 'duration',
+                 'effects', 'requirements', '_req_checks', 'instant_effects',
+                 'damage_chance', 'temp_mod', 'pressure_mod', 'oxygen_mod',
+                 'start_time', 'is_active', 'has_been_applied')
+    
     def __init__(self, event_id: str, event_data: Dict):
         """
         Initialise un événement
@@ -30,8 +89,28 @@ class GameEvent:
         self.effects = event_data.get("effects", {})
         self.requirements = event_data.get("requirements", {})
         
+        # Prérequis précompilés en une liste de vérifications (les données sont figées)
+        self._req_checks = []
+        for key, check in _REQUIREMENT_CHECKS.items():
+            if key in self.requirements:
+                value = self.requirements[key]
+                if key == 'planets':
+                    value = frozenset(value)
+                self._req_checks.append(partial(check, value))
+        
+        # Effets précalculés pour éviter les accès au dictionnaire à chaque tick
+        self.instant_effects = [
+            ({resource: self.effects[key]}, is_cost)
+            for key, resource, is_cost in _INSTANT_RESOURCE_EFFECTS
+            if key in self.effects
+        ]
+        self.damage_chance = min(1.0, self.effects.get('building_damage_chance', 0))
+        self.temp_mod = self.effects.get('temperature_modifier', 0) * _CONTINUOUS_EFFECT_SCALE
+        self.pressure_mod = self.effects.get('pressure_modifier', 0) * _CONTINUOUS_EFFECT_SCALE
+        self.oxygen_mod = self.effects.get('oxygen_modifier', 0) * _CONTINUOUS_EFFECT_SCALE
+        
         # État de l'événement
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.is_active = True
         self.has_been_applied = False
 
@@ -40,6 +119,8 @@ class ActiveEvent:
     Classe pour un événement actif sur une planète
     """
     
+    __slots__ = ('event', 'start_time', 'duration', '_end_time', 'rates', 'effects_applied')
+    
     def __init__(self, event: GameEvent):
         """
         Initialise un événement actif
@@ -48,81 +129,90 @@ class ActiveEvent:
             event: Événement de base
         """
         self.event = event
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.duration = event.duration
+        self._end_time = self.start_time + self.duration
         self.effects_applied = False
+        
+        # Effets continus appliqués à chaque tick (température, pression, oxygène)
+        if self.duration > 0:
+            self.rates = (event.temp_mod, event.pressure_mod, event.oxygen_mod)
+        else:
+            self.rates = (0.0, 0.0, 0.0)
+    
+    @property
+    def end_time(self) -> float:
+        """
+        Instant de fin de l'événement (time.monotonic)
+        """
+        return self._end_time
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """
         Vérifie si l'événement a expiré
         
+        Args:
+            now: Instant courant (time.monotonic), calculé si absent
+            
         Returns:
             True si l'événement a expiré
         """
         if self.duration == 0:
             return self.effects_applied  # Événement instantané
         
-        return time.time() - self.start_time >= self.duration
+        if now is None:
+            now = time.monotonic()
+        return now >= self._end_time
     
-    def get_remaining_time(self) -> float:
+    def get_remaining_time(self, now: Optional[float] = None) -> float:
         """
         Retourne le temps restant de l'événement
         
+        Args:
+            now: Instant courant (time.monotonic), calculé si absent
+            
         Returns:
             Temps restant en secondes
         """
         if self.duration == 0:
             return 0.0
         
-        remaining = self.duration - (time.time() - self.start_time)
-        return max(0.0, remaining)
+        if now is None:
+            now = time.monotonic()
+        return max(0.0, self._end_time - now)
     
     def apply_effects(self, planet, resource_manager):
         """
-        Applique les effets de l'événement
+        Applique les effets instantanés de l'événement
+        Les effets continus (rates) sont appliqués par la planète à chaque tick
         
         Args:
             planet: Planète affectée
             resource_manager: Gestionnaire de ressources
         """
-        effects = self.event.effects
+        event = self.event
         
         # Effets instantanés (appliqués une seule fois)
         if not self.effects_applied:
             # Bonus/malus de ressources
-            if 'credits_bonus' in effects:
-                resource_manager.add_resources({'credits': effects['credits_bonus']})
-            if 'credits_cost' in effects:
-                resource_manager.spend_resources({'credits': effects['credits_cost']})
-            if 'energy_bonus' in effects:
-                resource_manager.add_resources({'energy': effects['energy_bonus']})
-            if 'energy_cost' in effects:
-                resource_manager.spend_resources({'energy': effects['energy_cost']})
-            if 'science_bonus' in effects:
-                resource_manager.add_resources({'science': effects['science_bonus']})
+            for resources, is_cost in event.instant_effects:
+                if is_cost:
+                    resource_manager.spend_resources(resources)
+                else:
+                    resource_manager.add_resources(resources)
             
-            # Dégâts aux bâtiments
-            if 'building_damage_chance' in effects:
-                damage_chance = effects['building_damage_chance']
-                for building_type in list(planet.buildings.keys()):
-                    if random.random() < damage_chance:
-                        planet.remove_building(building_type, 1)
-                        print(f"Événement '{self.event.name}': {building_type} endommagé!")
+            # Dégâts aux bâtiments: chaque type de bâtiment a la même probabilité
+            # d'être touché, donc le nombre de types touchés suit une loi binomiale
+            if event.damage_chance > 0 and planet.buildings:
+                import random
+                import numpy as np
+                building_types = list(planet.buildings)
+                damaged_count = int(np.random.binomial(len(building_types), event.damage_chance))
+                for building_type in random.sample(building_types, damaged_count):
+                    planet.remove_building(building_type, 1)
+                    logger.info("Événement '%s': %s endommagé!", event.name, building_type)
             
             self.effects_applied = True
-        
-        # Effets continus (appliqués pendant toute la durée)
-        if self.duration > 0 and not self.is_expired():
-            # Modificateurs atmosphériques temporaires
-            temp_modifier = effects.get('temperature_modifier', 0)
-            pressure_modifier = effects.get('pressure_modifier', 0)
-            oxygen_modifier = effects.get('oxygen_modifier', 0)
-            
-            # Ces modificateurs sont appliqués directement aux valeurs de base
-            # (ils seront automatiquement supprimés quand l'événement expire)
-            planet.base_temperature += temp_modifier * 0.001  # Application graduelle
-            planet.base_pressure += pressure_modifier * 0.001
-            planet.base_oxygen += oxygen_modifier * 0.001
 
 class EventManager:
     """
@@ -134,31 +224,91 @@ class EventManager:
         Initialise le gestionnaire d'événements
         """
         self.event_templates: Dict[str, GameEvent] = {}
-        self.last_event_check = time.time()
+        self._template_list: List[GameEvent] = []
+        self._first_hit_thresholds: List[float] = []
+        self._probabilities = None  # Tableau numpy, uniquement pour les grands ensembles
+        self.last_event_check = time.monotonic()
         self.event_check_interval = 60.0  # Vérifier les événements toutes les 60 secondes
         
-        # Charger les événements depuis le fichier JSON
-        self.load_events()
+        # Les événements sont chargés depuis le fichier JSON au premier besoin
+        self._loaded = False
     
     def load_events(self):
         """
         Charge les événements depuis le fichier JSON
         """
+        self._loaded = True  # Ne pas réessayer à chaque tick en cas d'erreur
+        
         try:
-            with open(EVENTS_DATA_FILE, 'r', encoding='utf-8') as f:
-                events_data = json.load(f)
+            events_data = self._read_events_data()
             
             for event_id, data in events_data.items():
                 self.event_templates[event_id] = GameEvent(event_id, data)
             
-            print(f"Chargé {len(self.event_templates)} types d'événements")
+            self._build_probability_table()
+            
+            logger.info("Chargé %d types d'événements", len(self.event_templates))
             
         except FileNotFoundError:
-            print(f"Fichier {EVENTS_DATA_FILE} non trouvé")
-        except json.JSONDecodeError as e:
-            print(f"Erreur de décodage JSON: {e}")
+            logger.error("Fichier %s non trouvé", EVENTS_DATA_FILE)
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
+            logger.error("Erreur de décodage JSON: %s", e)
         except Exception as e:
-            print(f"Erreur lors du chargement des événements: {e}")
+            logger.error("Erreur lors du chargement des événements: %s", e)
+    
+    def reset(self):
+        """
+        Réinitialise le gestionnaire pour une nouvelle partie
+        Les modèles d'événements déjà chargés sont conservés
+        """
+        self.last_event_check = time.monotonic()
+    
+    def _build_probability_table(self):
+        """
+        Précalcule, pour chaque modèle, la probabilité qu'au moins un des
+        modèles jusqu'à lui inclus se déclenche lors d'une vérification
+        """
+        self._template_list = list(self.event_templates.values())
+        self._first_hit_thresholds = []
+        
+        none_fired = 1.0
+        for event_template in self._template_list:
+            probability = min(1.0, max(0.0, event_template.probability))
+            none_fired *= 1.0 - probability
+            self._first_hit_thresholds.append(1.0 - none_fired)
+        
+        self._probabilities = None
+        if len(self._template_list) > _VECTORIZED_ROLL_THRESHOLD:
+            import numpy as np
+            self._probabilities = np.asarray(
+                [event_template.probability for event_template in self._template_list],
+                dtype=np.float64)
+    
+    def _read_events_data(self) -> Dict:
+        """
+        Lit les données brutes des événements
+        Utilise le cache pickle s'il est plus récent que le fichier JSON,
+        sinon parse le JSON et régénère le cache
+        
+        Returns:
+            Dictionnaire des données d'événements
+        """
+        try:
+            if os.stat(EVENTS_CACHE_FILE).st_mtime >= os.stat(EVENTS_DATA_FILE).st_mtime:
+                with open(EVENTS_CACHE_FILE, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass  # Cache absent ou invalide: relire le JSON
+        
+        events_data = json_io.load_mapped_file(EVENTS_DATA_FILE)
+        
+        try:
+            with open(EVENTS_CACHE_FILE, 'wb') as f:
+                pickle.dump(events_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning("Impossible d'écrire le cache des événements: %s", e)
+        
+        return events_data
     
     def update(self, planet, resource_manager, delta_time: float):
         """
@@ -169,20 +319,16 @@ class EventManager:
             resource_manager: Gestionnaire de ressources
             delta_time: Temps écoulé depuis la dernière mise à jour
         """
-        current_time = time.time()
+        if not self._loaded:
+            self.load_events()
+        
+        now = time.monotonic()
         
         # Vérifier s'il faut déclencher de nouveaux événements
-        if current_time - self.last_event_check >= self.event_check_interval:
+        # (l'expiration et les effets continus sont gérés par Planet.update)
+        if now - self.last_event_check >= self.event_check_interval:
             self._check_for_new_events(planet, resource_manager)
-            self.last_event_check = current_time
-        
-        # Mettre à jour les événements actifs
-        for active_event in planet.active_events[:]:  # Copie de la liste
-            if active_event.is_expired():
-                planet.active_events.remove(active_event)
-                print(f"Événement '{active_event.event.name}' terminé")
-            else:
-                active_event.apply_effects(planet, resource_manager)
+            self.last_event_check = now
     
     def _check_for_new_events(self, planet, resource_manager):
         """
@@ -192,17 +338,36 @@ class EventManager:
             planet: Planète actuelle
             resource_manager: Gestionnaire de ressources
         """
-        for event_template in self.event_templates.values():
-            # Vérifier la probabilité
-            if random.random() > event_template.probability:
-                continue
+        import random
+        
+        # Un seul tirage désigne le premier modèle déclenché; dans le cas le
+        # plus fréquent (aucun événement) la boucle n'est pas parcourue
+        templates = self._template_list
+        count = len(templates)
+        first = bisect.bisect_right(self._first_hit_thresholds, random.random())
+        if first >= count:
+            return
+        
+        # Tirer les modèles suivants indépendamment (en bloc s'ils sont nombreux)
+        hits = [first]
+        rest = first + 1
+        if self._probabilities is not None and count - rest >= _VECTORIZED_ROLL_THRESHOLD:
+            import numpy as np
+            rolls = np.random.random(count - rest)
+            hits.extend((np.flatnonzero(rolls <= self._probabilities[rest:]) + rest).tolist())
+        else:
+            hits.extend(index for index in range(rest, count)
+                        if random.random() <= templates[index].probability)
+        
+        for index in hits:
+            event_template = templates[index]
             
             # Vérifier les prérequis
             if not self._check_event_requirements(event_template, planet, resource_manager):
                 continue
             
             # Vérifier qu'un événement du même type n'est pas déjà actif
-            if any(ae.event.id == event_template.id for ae in planet.active_events):
+            if event_template.id in planet.active_event_ids:
                 continue
             
             # Déclencher l'événement
@@ -220,43 +385,8 @@ class EventManager:
         Returns:
             True si les prérequis sont remplis
         """
-        req = event.requirements
-        
-        # Vérifier le nombre minimum de bâtiments
-        if 'min_buildings' in req:
-            total_buildings = sum(planet.buildings.values())
-            if total_buildings < req['min_buildings']:
-                return False
-        
-        # Vérifier les planètes spécifiques
-        if 'planets' in req:
-            if planet.name not in req['planets']:
-                return False
-        
-        # Vérifier l'habitabilité minimale
-        if 'min_habitability' in req:
-            if planet.calculate_habitability() < req['min_habitability']:
-                return False
-        
-        # Vérifier les ressources minimales
-        if 'min_science' in req:
-            if resource_manager.science < req['min_science']:
-                return False
-        
-        # Vérifier les bâtiments spécifiques
-        if 'min_research_labs' in req:
-            labs = planet.buildings.get('research_lab', 0)
-            if labs < req['min_research_labs']:
-                return False
-        
-        if 'min_mining_facilities' in req:
-            mines = planet.buildings.get('mining_facility', 0)
-            if mines < req['min_mining_facilities']:
-                return False
-        
-        # Vérifier la pression minimale
-        if 'min_pressure' in req:
-            if planet.pressure < req['min_pressure']:
+        for check in event._req_checks:
+            if not check(planet, resource_manager):
                 return False
         
         return True
@@ -273,15 +403,19 @@ class EventManager:
         Returns:
             True si l'événement a été déclenché
         """
+        if not self._loaded:
+            self.load_events()
+        
         if event_id not in self.event_templates:
             return False
         
         event_template = self.event_templates[event_id]
         active_event = ActiveEvent(event_template)
-        planet.active_events.append(active_event)
+        planet.apply_event(active_event)
+        active_event.apply_effects(planet, resource_manager)
         
-        print(f"Événement déclenché: {event_template.name}")
-        print(f"Description: {event_template.description}")
+        logger.info("Événement déclenché: %s", event_template.name)
+        logger.info("Description: %s", event_template.description)
         
         return True
     
@@ -296,13 +430,15 @@ class EventManager:
             Liste des événements actifs avec leurs informations
         """
         summary = []
+        now = time.monotonic()
         
         for active_event in planet.active_events:
             event_info = {
+                'id': active_event.event.id,
                 'name': active_event.event.name,
                 'description': active_event.event.description,
                 'type': active_event.event.type,
-                'remaining_time': active_event.get_remaining_time(),
+                'remaining_time': active_event.get_remaining_time(now),
                 'duration': active_event.duration
             }
             summary.append(event_info)
@@ -2,16 +2,127 @@
 Moteur principal du jeu TerraGenesis PC
 """
 
-import json
 import time
+from types import MappingProxyType
 from typing import Dict, Optional
-from PyQt5.QtCore import QTimer, QObject, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from .planet import Planet
 from .resources import ResourceManager
 from .technology import TechnologyTree
 from .events import EventManager
 from config.constants import *
+from utils import json_io
+from utils.save_manager import (resolve_delta_save, write_delta_save, complete_delta_save,
+                                build_save_header, SAVE_HEADER_KEY)
+
+# Horloge monotone pour la simulation, insensible aux réglages de l'heure système
+# (time.time() reste réservé aux dates affichées ou sauvegardées)
+_monotonic = time.monotonic
+
+# Coût unitaire des bâtiments: (crédits, énergie)
+BUILDING_COSTS = MappingProxyType({
+    'solar_panel': (100, 10),
+    'heater': (150, 20),
+    'cooler': (150, 20),
+    'atmosphere_processor': (300, 50),
+    'oxygen_generator': (200, 30),
+    'greenhouse': (250, 25),
+    'research_lab': (400, 40),
+    'mining_facility': (350, 35)
+})
+
+def _read_save(save_path: str) -> Dict:
+    """
+    Lit une sauvegarde complète ou différentielle
+    
+    Args:
+        save_path: Chemin du fichier de sauvegarde
+        
+    Returns:
+        Données complètes de la sauvegarde
+    """
+    complete_delta_save(save_path)  # Rotation interrompue d'une sauvegarde automatique
+    return resolve_delta_save(json_io.load_file(save_path), save_path)
+
+class _SaveJob(QRunnable):
+    """
+    Écriture d'une sauvegarde dans un thread du pool, hors du thread de l'interface
+    """
+    
+    def __init__(self, engine, filename: str, save_data: Dict, save_path: str, indent: bool,
+                 delta_state: Optional[Dict] = None):
+        """
+        Initialise la tâche d'écriture
+        
+        Args:
+            engine: Moteur de jeu à notifier une fois la sauvegarde écrite
+            filename: Nom du fichier de sauvegarde, transmis avec les signaux
+            save_data: Instantané de la partie (ne doit plus être modifié)
+            save_path: Chemin du fichier de sauvegarde
+            indent: Si True, indente le fichier
+            delta_state: État des sauvegardes différentielles, None pour une sauvegarde complète
+        """
+        super().__init__()
+        self.engine = engine
+        self.filename = filename
+        self.save_data = save_data
+        self.save_path = save_path
+        self.indent = indent
+        self.delta_state = delta_state
+    
+    def run(self):
+        """
+        Sérialise et écrit la sauvegarde
+        """
+        try:
+            if self.delta_state is not None:
+                write_delta_save(self.save_data, self.save_path, self.delta_state)
+            else:
+                # Écriture atomique: un fichier interrompu ne remplace jamais l'ancien
+                json_io.dump_file(self.save_data, self.save_path, indent=self.indent, atomic=True)
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde: {e}")
+            self.engine.save_failed.emit(self.filename)
+            return
+        
+        # Émis depuis le pool, le signal est livré dans le thread de l'interface
+        self.engine.game_saved.emit(self.filename)
+        print(f"Partie sauvegardée: {self.save_path}")
+
+class _LoadJob(QRunnable):
+    """
+    Lecture d'une sauvegarde dans un thread du pool, hors du thread de l'interface
+    Seuls la lecture et le décodage quittent ce thread: les objets du jeu
+    sont recréés dans le thread de l'interface
+    """
+    
+    def __init__(self, engine, filename: str, save_path: str):
+        """
+        Initialise la tâche de lecture
+        
+        Args:
+            engine: Moteur de jeu auquel transmettre les données lues
+            filename: Nom du fichier de sauvegarde
+            save_path: Chemin du fichier de sauvegarde
+        """
+        super().__init__()
+        self.engine = engine
+        self.filename = filename
+        self.save_path = save_path
+    
+    def run(self):
+        """
+        Lit et décode la sauvegarde
+        """
+        try:
+            save_data = _read_save(self.save_path)
+        except Exception as e:
+            print(f"Erreur lors du chargement: {e}")
+            save_data = None
+        
+        # Livré dans le thread de l'interface, comme game_saved
+        self.engine._save_data_read.emit(self.filename, save_data)
 
 class GameEngine(QObject):
     """
@@ -23,7 +134,17 @@ class GameEngine(QObject):
     resources_updated = pyqtSignal()
     technology_updated = pyqtSignal()
     event_triggered = pyqtSignal(str, str)  # nom, description
-    game_saved = pyqtSignal()
+    game_saved = pyqtSignal(str)  # nom du fichier
+    save_failed = pyqtSignal(str)  # nom du fichier
+    game_loaded = pyqtSignal(bool, str)  # succès, nom du fichier
+    _save_data_read = pyqtSignal(str, object)  # nom du fichier, données (None si erreur)
+    building_count_changed = pyqtSignal(str, int)  # type, nouveau nombre (construction ou destruction)
+    tick_completed = pyqtSignal(int)  # masque des composants modifiés (CHANGED_*)
+    
+    # Bits du masque émis par tick_completed
+    CHANGED_PLANET = 1
+    CHANGED_RESOURCES = 2
+    CHANGED_TECHNOLOGY = 4
     
     def __init__(self):
         """
@@ -50,14 +171,43 @@ class GameEngine(QObject):
         # Timer pour la simulation
         self.simulation_timer = QTimer()
         self.simulation_timer.timeout.connect(self.update_simulation)
-        self.last_update_time = time.time()
+        self.last_update_time = _monotonic()
+        self._pending_dt = 0.0  # Temps accumulé par les ticks trop courts
+        
+        # Compteurs de changement (planète, ressources, technologies) au dernier signal émis
+        self._emitted_epochs = (-1, -1, -1)
         
-        # Timer pour la sauvegarde automatique
+        # Timer pour la sauvegarde automatique: à la seconde près, le système
+        # peut regrouper ses réveils avec ceux des autres timers
         self.autosave_timer = QTimer()
+        self.autosave_timer.setTimerType(Qt.VeryCoarseTimer)
         self.autosave_timer.timeout.connect(self.autosave)
         
-        # Statistiques de jeu
-        self.game_stats = {
+        # Pool d'un seul thread pour les sauvegardes en arrière-plan,
+        # afin que deux écritures du même fichier ne se chevauchent pas
+        self.save_pool = QThreadPool()
+        self.save_pool.setMaxThreadCount(1)
+        self._save_data_read.connect(self._on_save_data_read)
+        
+        # Empreintes des sections de la dernière sauvegarde automatique différentielle
+        self._autosave_state = {}
+        
+        # Squelette réutilisé par save_game, seules ses valeurs sont remplacées
+        # L'en-tête est la première clé, pour être lu sans le reste du fichier
+        self._save_skeleton = {
+            SAVE_HEADER_KEY: None,
+            'version': GAME_VERSION,
+            'save_time': 0.0,
+            'game_time': 0.0,
+            'planet': None,
+            'resources': None,
+            'technology': None,
+            'stats': None,
+            'simulation_speed': 1.0
+        }
+        
+        # Statistiques de jeu, exposées en lecture seule via game_stats
+        self._game_stats = {
             'start_time': time.time(),
             'total_credits_earned': 0,
             'total_science_generated': 0,
@@ -65,14 +215,14 @@ class GameEngine(QObject):
             'technologies_researched': 0,
             'events_encountered': 0
         }
+        self.game_stats = MappingProxyType(self._game_stats)
     
     def load_planet_data(self):
         """
         Charge les données des planètes disponibles
         """
         try:
-            with open(PLANETS_DATA_FILE, 'r', encoding='utf-8') as f:
-                self.available_planets = json.load(f)
+            self.available_planets = json_io.load_file(PLANETS_DATA_FILE)
             print(f"Chargé {len(self.available_planets)} planètes")
         except Exception as e:
             print(f"Erreur lors du chargement des planètes: {e}")
@@ -94,21 +244,23 @@ class GameEngine(QObject):
         # Créer la planète
         planet_data = self.available_planets[planet_name]
         self.current_planet = Planet(planet_name, planet_data)
+        self.current_planet.building_listener = self.building_count_changed.emit
         
-        # Réinitialiser les composants
-        self.resource_manager = ResourceManager()
-        self.technology_tree = TechnologyTree()
-        self.event_manager = EventManager()
+        # Réinitialiser les composants sur place, sans relire leurs données
+        self.resource_manager.reset()
+        self.technology_tree.reset()
+        self.event_manager.reset()
         
-        # Réinitialiser les statistiques
-        self.game_stats = {
+        # Réinitialiser les statistiques (sur place, la vue game_stats reste valide)
+        self._game_stats.clear()
+        self._game_stats.update({
             'start_time': time.time(),
             'total_credits_earned': 0,
             'total_science_generated': 0,
             'buildings_built': 0,
             'technologies_researched': 0,
             'events_encountered': 0
-        }
+        })
         
         # Démarrer la simulation
         self.start_simulation()
@@ -125,7 +277,10 @@ class GameEngine(QObject):
         
         self.is_running = True
         self.is_paused = False
-        self.last_update_time = time.time()
+        self.last_update_time = _monotonic()
+        self._pending_dt = 0.0
+        self._emitted_epochs = (-1, -1, -1)  # Tout réafficher au premier tick
+        self._autosave_state = {}  # Nouvelle partie: la prochaine sauvegarde auto est complète
         
         # Démarrer les timers
         self.simulation_timer.start(SIMULATION_TICK_RATE)
@@ -153,27 +308,56 @@ class GameEngine(QObject):
         """
         Met à jour la simulation du jeu
         """
-        if not self.is_running or self.is_paused or not self.current_planet:
+        planet = self.current_planet
+        if not self.is_running or self.is_paused or not planet:
             return
         
-        current_time = time.time()
-        delta_time = (current_time - self.last_update_time) * self.simulation_speed
+        speed = self.simulation_speed
+        current_time = _monotonic()
+        delta_time = (current_time - self.last_update_time) * speed
         self.last_update_time = current_time
         self.game_time += delta_time
         
+        # Accumuler les ticks trop courts pour ne pas refaire tout le calcul
+        # sur des variations négligeables
+        pending_dt = self._pending_dt + delta_time
+        if pending_dt < MIN_TICK_DELTA * speed:
+            self._pending_dt = pending_dt
+            return
+        delta_time = pending_dt
+        self._pending_dt = 0.0
+        
+        # Composants liés à des variables locales pour le reste du tick
+        resource_manager = self.resource_manager
+        technology_tree = self.technology_tree
+        
         # Calculer la production de ressources basée sur les bâtiments
-        self.resource_manager.calculate_production(self.current_planet, self.current_planet.buildings)
+        resource_manager.calculate_production(planet, planet.buildings)
         
         # Mettre à jour les composants
-        self.current_planet.update(delta_time)
-        self.resource_manager.update(delta_time)
-        self.technology_tree.update_research(self.resource_manager.science_per_second, delta_time)
-        self.event_manager.update(self.current_planet, self.resource_manager, delta_time)
-        
-        # Émettre les signaux de mise à jour
-        self.planet_updated.emit()
-        self.resources_updated.emit()
-        self.technology_updated.emit()
+        planet.update(delta_time)
+        resource_manager.update(delta_time)
+        technology_tree.update_research(resource_manager.science_per_second, delta_time)
+        self.event_manager.update(planet, resource_manager, delta_time)
+        
+        # Émettre les signaux de mise à jour, uniquement pour ce qui a changé
+        epochs = (planet.epoch, resource_manager.epoch, technology_tree.epoch)
+        planet_epoch, resources_epoch, technology_epoch = self._emitted_epochs
+        self._emitted_epochs = epochs
+        
+        changed = 0
+        if epochs[0] != planet_epoch:
+            changed |= self.CHANGED_PLANET
+            self.planet_updated.emit()
+        if epochs[1] != resources_epoch:
+            changed |= self.CHANGED_RESOURCES
+            self.resources_updated.emit()
+        if epochs[2] != technology_epoch:
+            changed |= self.CHANGED_TECHNOLOGY
+            self.technology_updated.emit()
+        
+        if changed:
+            self.tick_completed.emit(changed)
     
     def build_structure(self, building_type: str, count: int = 1) -> bool:
         """
@@ -195,32 +379,21 @@ class GameEngine(QObject):
             return False
         
         # Calculer le coût
-        building_costs = {
-            'solar_panel': {'credits': 100, 'energy': 10},
-            'heater': {'credits': 150, 'energy': 20},
-            'cooler': {'credits': 150, 'energy': 20},
-            'atmosphere_processor': {'credits': 300, 'energy': 50},
-            'oxygen_generator': {'credits': 200, 'energy': 30},
-            'greenhouse': {'credits': 250, 'energy': 25},
-            'research_lab': {'credits': 400, 'energy': 40},
-            'mining_facility': {'credits': 350, 'energy': 35}
-        }
-        
-        if building_type not in building_costs:
+        base_cost = BUILDING_COSTS.get(building_type)
+        if base_cost is None:
             print(f"Type de bâtiment '{building_type}' inconnu")
             return False
         
-        base_cost = building_costs[building_type]
-        total_cost = {resource: cost * count for resource, cost in base_cost.items()}
+        credits_cost, energy_cost = base_cost
         
         # Vérifier et dépenser les ressources
-        if not self.resource_manager.spend_resources(total_cost):
+        if not self.resource_manager.spend(credits_cost * count, energy_cost * count):
             print(f"Ressources insuffisantes pour construire {count} {building_type}")
             return False
         
         # Construire le bâtiment
         self.current_planet.add_building(building_type, count)
-        self.game_stats['buildings_built'] += count
+        self._game_stats['buildings_built'] += count
         
         print(f"Construit {count} {building_type}")
         return True
@@ -258,7 +431,7 @@ class GameEngine(QObject):
             'game_time': self.game_time,
             'is_paused': self.is_paused,
             'simulation_speed': self.simulation_speed,
-            'stats': self.game_stats.copy()
+            'stats': self.game_stats
         }
     
     def set_simulation_speed(self, speed: float):
@@ -277,39 +450,58 @@ class GameEngine(QObject):
         """
         if self.current_planet:
             filename = f"autosave_{self.current_planet.name.lower()}.json"
-            if self.save_game(filename):
-                print("Sauvegarde automatique effectuée")
+            # Sauvegarde compacte et différentielle, écrite en arrière-plan
+            # pour ne pas bloquer l'interface
+            if self.save_game(filename, indent=False, background=True, delta=True):
+                print("Sauvegarde automatique lancée")
     
-    def save_game(self, filename: str) -> bool:
+    def save_game(self, filename: str, indent: bool = True, background: bool = False,
+                  delta: bool = False) -> bool:
         """
         Sauvegarde la partie actuelle
         
         Args:
             filename: Nom du fichier de sauvegarde
+            indent: Si True, indente le fichier pour qu'il reste lisible
+            background: Si True, l'écriture est faite dans un thread du pool
+                et game_saved (ou save_failed) est émis quand elle est terminée
+            delta: Si True, les sections inchangées depuis la sauvegarde
+                précédente de ce fichier ne sont pas réécrites
             
         Returns:
-            True si la sauvegarde a réussi
+            True si la sauvegarde a réussi (ou a été lancée en arrière-plan)
         """
         if not self.current_planet:
             return False
         
         try:
-            save_data = {
-                'version': GAME_VERSION,
-                'save_time': time.time(),
-                'game_time': self.game_time,
-                'planet': self.current_planet.to_dict(),
-                'resources': self.resource_manager.to_dict(),
-                'technology': self.technology_tree.to_dict(),
-                'stats': self.game_stats.copy(),
-                'simulation_speed': self.simulation_speed
-            }
+            save_data = self._save_skeleton
+            save_data['save_time'] = time.time()
+            save_data['game_time'] = self.game_time
+            save_data['planet'] = self.current_planet.to_dict()
+            save_data['resources'] = self.resource_manager.to_dict()
+            save_data['technology'] = self.technology_tree.to_dict()
+            save_data['stats'] = dict(self._game_stats)
+            save_data['simulation_speed'] = self.simulation_speed
+            save_data[SAVE_HEADER_KEY] = build_save_header(save_data)
             
             save_path = f"{SAVES_DIRECTORY}/{filename}"
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
             
-            self.game_saved.emit()
+            delta_state = self._autosave_state if delta else None
+            
+            if background:
+                # L'instantané est construit ici, seule l'écriture quitte ce thread.
+                # Les sections sont des objets neufs: une copie superficielle du
+                # squelette suffit pour que la prochaine sauvegarde ne le modifie pas
+                self.save_pool.start(_SaveJob(self, filename, dict(save_data), save_path, indent, delta_state))
+                return True
+            
+            if delta_state is not None:
+                write_delta_save(save_data, save_path, delta_state)
+            else:
+                json_io.dump_file(save_data, save_path, indent=indent, atomic=True)
+            
+            self.game_saved.emit(filename)
             print(f"Partie sauvegardée: {save_path}")
             return True
             
@@ -317,21 +509,57 @@ class GameEngine(QObject):
             print(f"Erreur lors de la sauvegarde: {e}")
             return False
     
-    def load_game(self, filename: str) -> bool:
+    def load_game(self, filename: str, background: bool = False) -> bool:
         """
         Charge une partie sauvegardée
         
         Args:
             filename: Nom du fichier de sauvegarde
+            background: Si True, le fichier est lu dans un thread du pool
+                et game_loaded est émis quand la partie est chargée
             
         Returns:
-            True si le chargement a réussi
+            True si le chargement a réussi (ou a été lancé en arrière-plan)
         """
+        save_path = f"{SAVES_DIRECTORY}/{filename}"
+        
+        if background:
+            # Même pool que les sauvegardes: une écriture en cours du même
+            # fichier est terminée avant sa lecture
+            self.save_pool.start(_LoadJob(self, filename, save_path))
+            return True
+        
         try:
-            save_path = f"{SAVES_DIRECTORY}/{filename}"
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = _read_save(save_path)
+        except Exception as e:
+            print(f"Erreur lors du chargement: {e}")
+            return False
+        
+        return self._apply_save_data(filename, save_data)
+    
+    def _on_save_data_read(self, filename: str, save_data):
+        """
+        Termine un chargement en arrière-plan dans le thread de l'interface
+        
+        Args:
+            filename: Nom du fichier de sauvegarde
+            save_data: Données lues, None si la lecture a échoué
+        """
+        success = save_data is not None and self._apply_save_data(filename, save_data)
+        self.game_loaded.emit(success, filename)
+    
+    def _apply_save_data(self, filename: str, save_data: Dict) -> bool:
+        """
+        Recrée la partie à partir des données d'une sauvegarde
+        
+        Args:
+            filename: Nom du fichier de sauvegarde
+            save_data: Données complètes de la sauvegarde
             
+        Returns:
+            True si le chargement a réussi
+        """
+        try:
             # Vérifier la version
             if save_data.get('version') != GAME_VERSION:
                 print("Attention: Version de sauvegarde différente")
@@ -346,12 +574,14 @@ class GameEngine(QObject):
             
             # Recréer les objets
             self.current_planet = Planet.from_dict(planet_data, self.available_planets[planet_name])
+            self.current_planet.building_listener = self.building_count_changed.emit
             self.resource_manager = ResourceManager.from_dict(save_data['resources'])
             self.technology_tree = TechnologyTree.from_dict(save_data['technology'])
             
             # Restaurer l'état du jeu
             self.game_time = save_data.get('game_time', 0.0)
-            self.game_stats = save_data.get('stats', {})
+            self._game_stats.clear()
+            self._game_stats.update(save_data.get('stats', {}))
             self.simulation_speed = save_data.get('simulation_speed', 1.0)
             
             # Redémarrer la simulation
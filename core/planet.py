@@ -2,9 +2,111 @@
 Classe Planet - Représente une planète à terraformer
 """
 
+import logging
 import math
-from typing import Dict, List, Optional
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from numpy.lib import recfunctions
+
 from config.constants import *
+from ._planet_kernels import habitability_array, habitability_kernel, tick_kernel
+
+logger = logging.getLogger(__name__)
+
+# Index de chaque type de bâtiment dans les vecteurs de comptage
+BUILDING_INDEX = {
+    'solar_panel': 0,
+    'heater': 1,
+    'cooler': 2,
+    'atmosphere_processor': 3,
+    'oxygen_generator': 4,
+    'greenhouse': 5,
+    'research_lab': 6,
+    'mining_facility': 7
+}
+
+# Effets atmosphériques par bâtiment, un enregistrement par type indexé par
+# BUILDING_INDEX (les bâtiments absents n'ont pas d'effet atmosphérique:
+# panneaux solaires, laboratoires, mines)
+_BUILDING_EFFECTS = np.zeros(len(BUILDING_INDEX), dtype=[
+    ('temperature', np.float64),
+    ('pressure', np.float64),
+    ('oxygen', np.float64)
+])
+_BUILDING_EFFECTS[BUILDING_INDEX['heater']] = (5.0, 0.0, 0.0)
+_BUILDING_EFFECTS[BUILDING_INDEX['cooler']] = (-5.0, 0.0, 0.0)
+_BUILDING_EFFECTS[BUILDING_INDEX['atmosphere_processor']] = (0.0, 0.1, 0.0)
+_BUILDING_EFFECTS[BUILDING_INDEX['oxygen_generator']] = (0.0, 0.0, 2.0)
+_BUILDING_EFFECTS[BUILDING_INDEX['greenhouse']] = (2.0, 0.0, 1.0)
+_BUILDING_EFFECTS.flags.writeable = False
+
+# Même table en matrice contiguë (bâtiments × température, pression, oxygène)
+# pour calculer tous les modificateurs en un seul produit
+EFFECT_MATRIX = recfunctions.structured_to_unstructured(_BUILDING_EFFECTS)
+EFFECT_MATRIX.flags.writeable = False
+
+# Bornes des paramètres (température, pression, oxygène) pour les calculs vectorisés
+_LOWER_LIMITS = np.array([MIN_TEMPERATURE, MIN_PRESSURE, MIN_OXYGEN])
+_UPPER_LIMITS = np.array([MAX_TEMPERATURE, MAX_PRESSURE, MAX_OXYGEN])
+
+# Gabarit des valeurs affichées (habitabilité, température, pression, oxygène)
+_STATUS_FMT = "{0:.1f}%|{1:.1f}°C|{2:.2f} atm|{3:.1f}%"
+
+@dataclass(slots=True)
+class PlanetStatus:
+    """
+    Résumé numérique du statut d'une planète
+    Les textes ne sont formatés que lorsqu'ils sont affichés
+    """
+    status: str
+    habitability: float
+    temperature: float
+    pressure: float
+    oxygen: float
+    buildings: int
+    
+    def formatted(self) -> Dict[str, str]:
+        """
+        Met en forme les valeurs pour l'affichage
+        
+        Returns:
+            Dictionnaire des valeurs formatées
+        """
+        habitability, temperature, pressure, oxygen = _STATUS_FMT.format(
+            self.habitability, self.temperature, self.pressure, self.oxygen).split('|')
+        
+        return {
+            'status': self.status,
+            'habitability': habitability,
+            'temperature': temperature,
+            'pressure': pressure,
+            'oxygen': oxygen,
+            'buildings': self.buildings
+        }
+
+class _AtmosphereParameter:
+    """
+    Paramètre atmosphérique dont l'écriture invalide l'habitabilité en cache
+    """
+    
+    __slots__ = ('slot',)
+    
+    def __set_name__(self, owner, name):
+        self.slot = '_' + name
+    
+    def __get__(self, planet, owner=None):
+        if planet is None:
+            return self
+        return getattr(planet, self.slot)
+    
+    def __set__(self, planet, value):
+        setattr(planet, self.slot, value)
+        planet.habitability_cached = None
 
 class Planet:
     """
@@ -12,6 +114,23 @@ class Planet:
     et ses capacités de terraformation
     """
     
+    __slots__ = (
+        'name', 'description', 'image_path',
+        '_temperature', '_pressure', '_oxygen',
+        'base_temperature', 'base_pressure', 'base_oxygen',
+        'temperature_modifier', 'pressure_modifier', 'oxygen_modifier',
+        'mass', 'distance_from_sun', 'day_length',
+        'buildings', 'building_counts', 'building_listener',
+        'habitability_cached',
+        'history', 'active_events', 'active_event_ids',
+        'event_end_times', 'event_rates', 'epoch'
+    )
+    
+    # Paramètres actuels: calculate_habitability se recalcule seul après une écriture
+    temperature = _AtmosphereParameter()
+    pressure = _AtmosphereParameter()
+    oxygen = _AtmosphereParameter()
+    
     def __init__(self, name: str, planet_data: Dict):
         """
         Initialise une planète
@@ -46,17 +165,34 @@ class Planet:
         
         # Bâtiments construits sur la planète
         self.buildings = {}  # {building_type: count}
+        self.building_counts = np.zeros(len(BUILDING_INDEX), dtype=np.int32)  # Aligné sur BUILDING_INDEX
         
-        # Historique des valeurs (pour les graphiques)
+        # Appelé avec (type, nouveau nombre) à chaque ajout ou retrait de bâtiments
+        self.building_listener: Optional[Callable[[str, int], None]] = None
+        
+        # Cache de l'habitabilité, remis à None quand les paramètres changent
+        self.habitability_cached: Optional[float] = None
+        
+        # Historique des valeurs (pour les graphiques), les plus anciennes
+        # entrées sont évincées automatiquement
         self.history = {
-            'temperature': [self.temperature],
-            'pressure': [self.pressure],
-            'oxygen': [self.oxygen],
-            'habitability': [self.calculate_habitability()]
+            'temperature': deque([self.temperature], maxlen=HISTORY_LENGTH),
+            'pressure': deque([self.pressure], maxlen=HISTORY_LENGTH),
+            'oxygen': deque([self.oxygen], maxlen=HISTORY_LENGTH),
+            'habitability': deque([self.calculate_habitability()], maxlen=HISTORY_LENGTH)
         }
         
         # Événements actifs sur la planète
         self.active_events = []
+        self.active_event_ids = set()  # Identifiants des événements actifs
+        
+        # Colonnes alignées sur active_events: instant de fin et effets continus
+        # (température, pression, oxygène) de chaque événement
+        self.event_end_times = np.empty(0, dtype=np.float64)
+        self.event_rates = np.empty((0, 3), dtype=np.float64)
+        
+        # Compteur incrémenté à chaque changement visible de l'état
+        self.epoch = 0
     
     def update(self, delta_time: float):
         """
@@ -65,28 +201,45 @@ class Planet:
         Args:
             delta_time: Temps écoulé depuis la dernière mise à jour (en secondes)
         """
-        # Calculer les nouveaux paramètres basés sur les modificateurs
-        self.temperature = self.base_temperature + self.temperature_modifier
-        self.pressure = self.base_pressure + self.pressure_modifier
-        self.oxygen = self.base_oxygen + self.oxygen_modifier
+        # Calculer les nouveaux paramètres basés sur les modificateurs,
+        # bornés, ainsi que l'habitabilité en un seul appel au noyau
+        temperature, pressure, oxygen, habitability = tick_kernel(
+            self.base_temperature, self.base_pressure, self.base_oxygen,
+            self.temperature_modifier, self.pressure_modifier, self.oxygen_modifier
+        )
+        
+        self._apply_tick(temperature, pressure, oxygen, habitability, time.monotonic())
+    
+    def _apply_tick(self, temperature: float, pressure: float, oxygen: float,
+                    habitability: float, now: float):
+        """
+        Enregistre les valeurs calculées pour un tick et met à jour les événements
+        
+        Args:
+            temperature: Nouvelle température (déjà bornée)
+            pressure: Nouvelle pression (déjà bornée)
+            oxygen: Nouveau taux d'oxygène (déjà borné)
+            habitability: Habitabilité correspondante
+            now: Instant courant (time.monotonic)
+        """
+        if (temperature, pressure, oxygen) != (self.temperature, self.pressure, self.oxygen):
+            self.epoch += 1
         
-        # Appliquer les limites
-        self.temperature = max(MIN_TEMPERATURE, min(MAX_TEMPERATURE, self.temperature))
-        self.pressure = max(MIN_PRESSURE, min(MAX_PRESSURE, self.pressure))
-        self.oxygen = max(MIN_OXYGEN, min(MAX_OXYGEN, self.oxygen))
+        self.temperature = temperature
+        self.pressure = pressure
+        self.oxygen = oxygen
         
-        # Ajouter à l'historique (limiter à 100 entrées)
-        if len(self.history['temperature']) >= 100:
-            for key in self.history:
-                self.history[key].pop(0)
+        # Ajouter à l'historique (limité à HISTORY_LENGTH entrées)
+        history = self.history
+        history['temperature'].append(temperature)
+        history['pressure'].append(pressure)
+        history['oxygen'].append(oxygen)
+        history['habitability'].append(habitability)
         
-        self.history['temperature'].append(self.temperature)
-        self.history['pressure'].append(self.pressure)
-        self.history['oxygen'].append(self.oxygen)
-        self.history['habitability'].append(self.calculate_habitability())
+        self.habitability_cached = habitability
         
         # Mettre à jour les événements actifs
-        self._update_events(delta_time)
+        self._update_events(now)
     
     def calculate_habitability(self) -> float:
         """
@@ -95,20 +248,20 @@ class Planet:
         Returns:
             Pourcentage d'habitabilité (0-100)
         """
-        # Calculer la distance par rapport aux valeurs cibles
-        temp_diff = abs(self.temperature - TARGET_TEMPERATURE)
-        pressure_diff = abs(self.pressure - TARGET_PRESSURE)
-        oxygen_diff = abs(self.oxygen - TARGET_OXYGEN)
-        
-        # Calculer les scores individuels (0-1)
-        temp_score = max(0, 1 - (temp_diff / HABITABILITY_TOLERANCE['temperature']))
-        pressure_score = max(0, 1 - (pressure_diff / HABITABILITY_TOLERANCE['pressure']))
-        oxygen_score = max(0, 1 - (oxygen_diff / HABITABILITY_TOLERANCE['oxygen']))
-        
-        # Score global (moyenne pondérée)
-        habitability = (temp_score * 0.4 + pressure_score * 0.3 + oxygen_score * 0.3) * 100
+        habitability = self.habitability_cached
+        if habitability is None:
+            habitability = self._refresh_habitability()
+        return habitability
+    
+    def _refresh_habitability(self) -> float:
+        """
+        Recalcule l'habitabilité et la met en cache
         
-        return min(100, max(0, habitability))
+        Returns:
+            Pourcentage d'habitabilité (0-100)
+        """
+        self.habitability_cached = habitability_kernel(self.temperature, self.pressure, self.oxygen)
+        return self.habitability_cached
     
     def is_habitable(self) -> bool:
         """
@@ -131,8 +284,13 @@ class Planet:
             self.buildings[building_type] = 0
         self.buildings[building_type] += count
         
+        index = BUILDING_INDEX.get(building_type)
+        if index is not None:
+            self.building_counts[index] = self.buildings[building_type]
+        
         # Recalculer les modificateurs
         self._update_modifiers()
+        self._notify_building(building_type)
     
     def remove_building(self, building_type: str, count: int = 1):
         """
@@ -144,53 +302,85 @@ class Planet:
         """
         if building_type in self.buildings:
             self.buildings[building_type] = max(0, self.buildings[building_type] - count)
+            
+            index = BUILDING_INDEX.get(building_type)
+            if index is not None:
+                self.building_counts[index] = self.buildings[building_type]
+            
             if self.buildings[building_type] == 0:
                 del self.buildings[building_type]
         
         # Recalculer les modificateurs
         self._update_modifiers()
+        self._notify_building(building_type)
+    
+    def _notify_building(self, building_type: str):
+        """
+        Signale le nouveau nombre de bâtiments d'un type à building_listener
+        (constructions comme destructions par les événements)
+        
+        Args:
+            building_type: Type de bâtiment modifié
+        """
+        if self.building_listener is not None:
+            self.building_listener(building_type, self.buildings.get(building_type, 0))
+    
+    def _sync_building_counts(self):
+        """
+        Reconstruit le vecteur de comptage depuis le dictionnaire des bâtiments
+        """
+        self.building_counts[:] = 0
+        for building_type, count in self.buildings.items():
+            index = BUILDING_INDEX.get(building_type)
+            if index is not None:
+                self.building_counts[index] = count
     
     def _update_modifiers(self):
         """
         Met à jour les modificateurs basés sur les bâtiments
+        Un seul produit matriciel remplace le parcours des bâtiments
         """
-        # Réinitialiser les modificateurs
-        self.temperature_modifier = 0.0
-        self.pressure_modifier = 0.0
-        self.oxygen_modifier = 0.0
-        
-        # Effets des bâtiments (à personnaliser selon les bâtiments)
-        building_effects = {
-            'heater': {'temperature': 5.0},
-            'cooler': {'temperature': -5.0},
-            'atmosphere_processor': {'pressure': 0.1},
-            'oxygen_generator': {'oxygen': 2.0},
-            'greenhouse': {'temperature': 2.0, 'oxygen': 1.0},
-            'solar_panel': {},  # Génère de l'énergie mais pas d'effet atmosphérique
-            'research_lab': {}  # Génère de la science
-        }
-        
-        for building_type, count in self.buildings.items():
-            if building_type in building_effects:
-                effects = building_effects[building_type]
-                self.temperature_modifier += effects.get('temperature', 0) * count
-                self.pressure_modifier += effects.get('pressure', 0) * count
-                self.oxygen_modifier += effects.get('oxygen', 0) * count
+        temperature, pressure, oxygen = self.building_counts @ EFFECT_MATRIX
+        self.temperature_modifier = float(temperature)
+        self.pressure_modifier = float(pressure)
+        self.oxygen_modifier = float(oxygen)
+        self.habitability_cached = None
+        self.epoch += 1
     
-    def _update_events(self, delta_time: float):
+    def _update_events(self, now: float):
         """
         Met à jour les événements actifs
+        L'expiration et les effets continus sont calculés sur les colonnes
+        event_end_times et event_rates plutôt qu'événement par événement
         
         Args:
-            delta_time: Temps écoulé
+            now: Instant courant (time.monotonic)
         """
-        # Retirer les événements expirés
-        self.active_events = [event for event in self.active_events 
-                            if not event.is_expired()]
+        if not self.active_events:
+            return
         
-        # Appliquer les effets des événements actifs
-        for event in self.active_events:
-            event.apply_effects(self, delta_time)
+        # Retirer les événements expirés
+        alive = self.event_end_times > now
+        if not alive.all():
+            for index in np.flatnonzero(~alive):
+                logger.info("Événement '%s' terminé", self.active_events[index].event.name)
+            
+            self.active_events = [event for event, keep in zip(self.active_events, alive.tolist())
+                                  if keep]
+            self.active_event_ids = {event.event.id for event in self.active_events}
+            self.event_end_times = self.event_end_times[alive]
+            self.event_rates = self.event_rates[alive]
+            self.epoch += 1
+            
+            if not self.active_events:
+                return
+        
+        # Appliquer les effets continus de tous les événements en une fois.
+        # Ils s'ajoutent aux valeurs de base tant que l'événement est actif
+        temperature, pressure, oxygen = self.event_rates.sum(axis=0)
+        self.base_temperature += float(temperature)
+        self.base_pressure += float(pressure)
+        self.base_oxygen += float(oxygen)
     
     def apply_event(self, event):
         """
@@ -200,13 +390,18 @@ class Planet:
             event: Événement à appliquer
         """
         self.active_events.append(event)
+        self.active_event_ids.add(event.event.id)
+        self.event_end_times = np.append(self.event_end_times, event.end_time)
+        self.event_rates = np.vstack((self.event_rates, event.rates))
+        self.habitability_cached = None
+        self.epoch += 1
     
-    def get_status_summary(self) -> Dict[str, str]:
+    def get_status_summary(self) -> PlanetStatus:
         """
         Retourne un résumé du statut de la planète
         
         Returns:
-            Dictionnaire avec les informations de statut
+            Résumé numérique (voir PlanetStatus.formatted pour l'affichage)
         """
         habitability = self.calculate_habitability()
         
@@ -219,14 +414,8 @@ class Planet:
         else:
             status = "Inhabitable"
         
-        return {
-            'status': status,
-            'habitability': f"{habitability:.1f}%",
-            'temperature': f"{self.temperature:.1f}°C",
-            'pressure': f"{self.pressure:.2f} atm",
-            'oxygen': f"{self.oxygen:.1f}%",
-            'buildings': len(self.buildings)
-        }
+        return PlanetStatus(status, habitability, self.temperature, self.pressure,
+                            self.oxygen, len(self.buildings))
     
     def to_dict(self) -> Dict:
         """
@@ -244,7 +433,7 @@ class Planet:
             'base_pressure': self.base_pressure,
             'base_oxygen': self.base_oxygen,
             'buildings': self.buildings.copy(),
-            'history': self.history.copy()
+            'history': {key: list(values) for key, values in self.history.items()}
         }
     
     @classmethod
@@ -255,7 +444,7 @@ class Planet:
         Args:
             data: Données de sauvegarde
             planet_data: Données de base de la planète
-            
+        
         Returns:
             Instance de Planet
         """
@@ -263,10 +452,79 @@ class Planet:
         planet.temperature = data.get('temperature', planet.temperature)
         planet.pressure = data.get('pressure', planet.pressure)
         planet.oxygen = data.get('oxygen', planet.oxygen)
-        planet.buildings = data.get('buildings', {})
-        planet.history = data.get('history', planet.history)
+        # Interner les types de bâtiments lus depuis le JSON pour que les
+        # recherches avec les littéraux du code se résolvent par identité
+        planet.buildings = {sys.intern(building_type): count
+                            for building_type, count in data.get('buildings', {}).items()}
+        if 'history' in data:
+            planet.history = {key: deque(values, maxlen=HISTORY_LENGTH)
+                              for key, values in data['history'].items()}
         
         # Recalculer les modificateurs
+        planet._sync_building_counts()
         planet._update_modifiers()
         
-        return planet
\ No newline at end of file
+        return planet
+
+class PlanetPool:
+    """
+    Groupe de planètes mises à jour ensemble
+    Les paramètres de toutes les planètes sont rassemblés en colonnes NumPy,
+    si bien qu'un tick coûte quelques opérations vectorisées quel que soit
+    le nombre de planètes
+    """
+    
+    __slots__ = ('planets',)
+    
+    def __init__(self, planets: Optional[List[Planet]] = None):
+        """
+        Initialise le groupe de planètes
+        
+        Args:
+            planets: Planètes à regrouper
+        """
+        self.planets = list(planets) if planets else []
+    
+    def add(self, planet: Planet):
+        """
+        Ajoute une planète au groupe
+        
+        Args:
+            planet: Planète à ajouter
+        """
+        self.planets.append(planet)
+    
+    def remove(self, planet: Planet):
+        """
+        Retire une planète du groupe
+        
+        Args:
+            planet: Planète à retirer
+        """
+        self.planets.remove(planet)
+    
+    def update(self, delta_time: float):
+        """
+        Met à jour toutes les planètes du groupe
+        
+        Args:
+            delta_time: Temps écoulé depuis la dernière mise à jour (en secondes)
+        """
+        planets = self.planets
+        if not planets:
+            return
+        
+        # Colonnes (N, 3): température, pression, oxygène
+        bases = np.array([(planet.base_temperature, planet.base_pressure, planet.base_oxygen)
+                          for planet in planets], dtype=np.float64)
+        modifiers = np.array([(planet.temperature_modifier, planet.pressure_modifier,
+                               planet.oxygen_modifier) for planet in planets], dtype=np.float64)
+        
+        values = np.add(bases, modifiers, out=bases)
+        np.clip(values, _LOWER_LIMITS, _UPPER_LIMITS, out=values)
+        habitabilities = habitability_array(values)
+        
+        now = time.monotonic()
+        for planet, (temperature, pressure, oxygen), habitability in zip(
+                planets, values.tolist(), habitabilities.tolist()):
+            planet._apply_tick(temperature, pressure, oxygen, habitability, now)
@@ -2,8 +2,62 @@
 Gestionnaire des ressources du jeu (crédits, énergie, science)
 """
 
-from typing import Dict, Optional
-from config.constants import INITIAL_CREDITS, INITIAL_ENERGY, INITIAL_SCIENCE
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from config.constants import INITIAL_CREDITS, INITIAL_ENERGY, INITIAL_SCIENCE, HISTORY_LENGTH
+from .planet import BUILDING_INDEX
+from ._resource_kernels import production_kernel, resource_tick_kernel
+
+# Ordre des lignes du tampon d'historique
+_HISTORY_KEYS = ('credits', 'energy', 'science')
+
+# Production et consommation par bâtiment (lecture seule)
+_BUILDING_EFFECTS = MappingProxyType({
+    'solar_panel': MappingProxyType({
+        'energy_production': 5.0,
+        'credits_production': 0.5
+    }),
+    'research_lab': MappingProxyType({
+        'science_production': 2.0,
+        'energy_consumption': 3.0
+    }),
+    'mining_facility': MappingProxyType({
+        'credits_production': 3.0,
+        'energy_consumption': 2.0
+    }),
+    'heater': MappingProxyType({
+        'energy_consumption': 4.0
+    }),
+    'cooler': MappingProxyType({
+        'energy_consumption': 4.0
+    }),
+    'atmosphere_processor': MappingProxyType({
+        'energy_consumption': 6.0,
+        'credits_production': 1.0
+    }),
+    'oxygen_generator': MappingProxyType({
+        'energy_consumption': 5.0
+    }),
+    'greenhouse': MappingProxyType({
+        'energy_consumption': 2.0,
+        'science_production': 1.0
+    })
+})
+
+# Colonnes de la matrice de production
+_PRODUCTION_KEYS = ('credits_production', 'energy_production',
+                    'science_production', 'energy_consumption')
+
+# Même table en matrice (bâtiments × colonnes) alignée sur BUILDING_INDEX,
+# pour calculer toute la production en un seul produit
+_PRODUCTION_MATRIX = np.zeros((len(BUILDING_INDEX), len(_PRODUCTION_KEYS)), dtype=np.float64)
+for _building_type, _effects in _BUILDING_EFFECTS.items():
+    _PRODUCTION_MATRIX[BUILDING_INDEX[_building_type]] = [
+        _effects.get(key, 0.0) for key in _PRODUCTION_KEYS]
+_PRODUCTION_MATRIX.flags.writeable = False
 
 class ResourceManager:
     """
@@ -27,17 +81,34 @@ class ResourceManager:
         # Consommation par seconde
         self.energy_consumption = 0.0
         
+        # Taux nets (crédits, énergie, science) figés par calculate_production,
+        # passés tels quels au noyau à chaque tick
+        self._tick_rates = (0.0, 0.0, 0.0)
+        
         # Capacités maximales
         self.max_energy = 1000
         self.max_science = 10000
         # Les crédits n'ont pas de limite
         
-        # Historique pour les graphiques
-        self.history = {
-            'credits': [self.credits],
-            'energy': [self.energy],
-            'science': [self.science]
-        }
+        # Historique pour les graphiques: tampon circulaire préalloué
+        # (une ligne par ressource, les plus anciennes valeurs sont écrasées)
+        self._history = np.zeros((len(_HISTORY_KEYS), HISTORY_LENGTH), dtype=np.float32)
+        self._history_idx = 0
+        self._history_len = 0
+        self._record_history(self.credits, self.energy, self.science)
+        
+        # Compteur incrémenté à chaque changement visible de l'état
+        self.epoch = 0
+        
+        # Dernier résumé formaté et clé de l'état qui l'a produit
+        self._summary_key = None
+        self._summary = None
+    
+    def reset(self):
+        """
+        Réinitialise les ressources pour une nouvelle partie
+        """
+        self.__init__()
     
     def update(self, delta_time: float):
         """
@@ -46,29 +117,65 @@ class ResourceManager:
         Args:
             delta_time: Temps écoulé depuis la dernière mise à jour (en secondes)
         """
-        # Calculer les changements
-        credits_change = self.credits_per_second * delta_time
-        energy_change = (self.energy_per_second - self.energy_consumption) * delta_time
-        science_change = self.science_per_second * delta_time
+        # Appliquer la production et les limites en un seul appel au noyau
+        credits, energy, science = resource_tick_kernel(
+            self.credits, self.energy, self.science, *self._tick_rates,
+            self.max_energy, self.max_science, delta_time
+        )
         
-        # Appliquer les changements
-        self.credits += credits_change
-        self.energy += energy_change
-        self.science += science_change
+        if (credits, energy, science) != (self.credits, self.energy, self.science):
+            self.epoch += 1
         
-        # Appliquer les limites
-        self.credits = max(0, self.credits)  # Les crédits ne peuvent pas être négatifs
-        self.energy = max(0, min(self.max_energy, self.energy))
-        self.science = max(0, min(self.max_science, self.science))
+        self.credits = credits
+        self.energy = energy
+        self.science = science
+        
+        # Ajouter à l'historique (limité à HISTORY_LENGTH entrées) en une seule écriture
+        self._record_history(credits, energy, science)
+    
+    def _record_history(self, credits: float, energy: float, science: float):
+        """
+        Écrit des valeurs de ressources dans le tampon d'historique
+        
+        Args:
+            credits: Crédits
+            energy: Énergie
+            science: Science
+        """
+        idx = self._history_idx
+        self._history[:, idx] = (credits, energy, science)
+        self._history_idx = (idx + 1) % HISTORY_LENGTH
+        if self._history_len < HISTORY_LENGTH:
+            self._history_len += 1
+    
+    def history_view(self) -> np.ndarray:
+        """
+        Retourne l'historique dans l'ordre chronologique
         
-        # Ajouter à l'historique (limiter à 100 entrées)
-        if len(self.history['credits']) >= 100:
-            for key in self.history:
-                self.history[key].pop(0)
+        Returns:
+            Tableau (3, N) des crédits, de l'énergie et de la science
+        """
+        if self._history_len < HISTORY_LENGTH:
+            # Le tampon n'a pas encore fait le tour: les valeurs sont déjà dans l'ordre
+            return self._history[:, :self._history_len].copy()
+        return np.roll(self._history, -self._history_idx, axis=1)
+    
+    @property
+    def history(self) -> Dict[str, list]:
+        """
+        Historique par ressource, sous forme de listes
+        Le résultat est une copie indépendante du tampon: les ticks suivants ne le modifient pas
         
-        self.history['credits'].append(self.credits)
-        self.history['energy'].append(self.energy)
-        self.history['science'].append(self.science)
+        Returns:
+            Dictionnaire {ressource: [valeurs]}
+        """
+        if self._history_len < HISTORY_LENGTH:
+            rows = self._history[:, :self._history_len].tolist()
+        else:
+            # Remettre dans l'ordre chronologique sur les listes, sans tableau intermédiaire
+            idx = self._history_idx
+            rows = [row[idx:] + row[:idx] for row in self._history.tolist()]
+        return dict(zip(_HISTORY_KEYS, rows))
     
     def can_afford(self, cost: Dict[str, float]) -> bool:
         """
@@ -76,7 +183,7 @@ class ResourceManager:
         
         Args:
             cost: Dictionnaire des coûts {'credits': X, 'energy': Y, 'science': Z}
-            
+        
         Returns:
             True si le joueur peut se permettre le coût
         """
@@ -94,16 +201,31 @@ class ResourceManager:
         
         Args:
             cost: Dictionnaire des coûts
-            
+        
         Returns:
             True si les ressources ont été dépensées
         """
-        if not self.can_afford(cost):
+        return self.spend(cost.get('credits', 0), cost.get('energy', 0), cost.get('science', 0))
+    
+    def spend(self, credits: float, energy: float = 0, science: float = 0) -> bool:
+        """
+        Dépense des montants donnés si possible, sans passer par un dictionnaire
+        
+        Args:
+            credits: Crédits à dépenser
+            energy: Énergie à dépenser
+            science: Science à dépenser
+        
+        Returns:
+            True si les ressources ont été dépensées
+        """
+        if self.credits < credits or self.energy < energy or self.science < science:
             return False
         
-        self.credits -= cost.get('credits', 0)
-        self.energy -= cost.get('energy', 0)
-        self.science -= cost.get('science', 0)
+        self.credits -= credits
+        self.energy -= energy
+        self.science -= science
+        self.epoch += 1
         
         return True
     
@@ -122,6 +244,7 @@ class ResourceManager:
         self.credits = max(0, self.credits)
         self.energy = max(0, min(self.max_energy, self.energy))
         self.science = max(0, min(self.max_science, self.science))
+        self.epoch += 1
     
     def calculate_production(self, planet, buildings: Dict[str, int]):
         """
@@ -131,78 +254,49 @@ class ResourceManager:
             planet: Planète actuelle
             buildings: Dictionnaire des bâtiments {type: count}
         """
-        # Réinitialiser la production
-        self.credits_per_second = 0.0
-        self.energy_per_second = 0.0
-        self.science_per_second = 0.0
-        self.energy_consumption = 0.0
+        previous = (self.credits_per_second, self.energy_per_second,
+                    self.science_per_second, self.energy_consumption)
         
-        # Production de base (revenus passifs)
-        self.credits_per_second += 1.0  # 1 crédit par seconde de base
-        
-        # Effets des bâtiments
-        building_effects = {
-            'solar_panel': {
-                'energy_production': 5.0,
-                'credits_production': 0.5
-            },
-            'research_lab': {
-                'science_production': 2.0,
-                'energy_consumption': 3.0
-            },
-            'mining_facility': {
-                'credits_production': 3.0,
-                'energy_consumption': 2.0
-            },
-            'heater': {
-                'energy_consumption': 4.0
-            },
-            'cooler': {
-                'energy_consumption': 4.0
-            },
-            'atmosphere_processor': {
-                'energy_consumption': 6.0,
-                'credits_production': 1.0
-            },
-            'oxygen_generator': {
-                'energy_consumption': 5.0
-            },
-            'greenhouse': {
-                'energy_consumption': 2.0,
-                'science_production': 1.0
-            }
-        }
+        # Nombre de bâtiments par type, aligné sur BUILDING_INDEX
+        # (la planète maintient déjà ce vecteur pour ses propres bâtiments)
+        if buildings is planet.buildings:
+            counts = planet.building_counts
+        else:
+            counts = np.zeros(len(BUILDING_INDEX), dtype=np.int32)
+            for building_type, count in buildings.items():
+                index = BUILDING_INDEX.get(building_type)
+                if index is not None:
+                    counts[index] = count
+        
+        # Calculer les effets de tous les bâtiments en un seul produit
+        credits, energy, science, consumption = (counts @ _PRODUCTION_MATRIX).tolist()
+        
+        # Bonus basés sur l'habitabilité de la planète (valeur en cache si à jour)
+        habitability = planet.habitability_cached
+        if habitability is None:
+            habitability = planet._refresh_habitability()
+        
+        # Production de base et bonus d'habitabilité
+        (self.credits_per_second, self.energy_per_second,
+         self.science_per_second, self.energy_consumption) = production_kernel(
+            credits, energy, science, consumption, habitability)
         
-        # Calculer les effets de tous les bâtiments
-        for building_type, count in buildings.items():
-            if building_type in building_effects:
-                effects = building_effects[building_type]
-                
-                self.credits_per_second += effects.get('credits_production', 0) * count
-                self.energy_per_second += effects.get('energy_production', 0) * count
-                self.science_per_second += effects.get('science_production', 0) * count
-                self.energy_consumption += effects.get('energy_consumption', 0) * count
-        
-        # Bonus basés sur l'habitabilité de la planète
-        habitability = planet.calculate_habitability()
-        habitability_bonus = habitability / 100.0
-        
-        # Plus la planète est habitable, plus elle génère de revenus
-        self.credits_per_second *= (1.0 + habitability_bonus * 0.5)
-        self.science_per_second *= (1.0 + habitability_bonus * 0.3)
+        self._tick_rates = (self.credits_per_second,
+                            self.energy_per_second - self.energy_consumption,
+                            self.science_per_second)
+        
+        if (self.credits_per_second, self.energy_per_second,
+                self.science_per_second, self.energy_consumption) != previous:
+            self.epoch += 1
     
-    def get_net_production(self) -> Dict[str, float]:
+    def get_net_production(self) -> Tuple[float, float, float]:
         """
         Retourne la production nette par seconde
         
         Returns:
-            Dictionnaire avec la production nette
+            Tuple (crédits, énergie, science), recalculé seulement par calculate_production
         """
-        return {
-            'credits': self.credits_per_second,
-            'energy': self.energy_per_second - self.energy_consumption,
-            'science': self.science_per_second
-        }
+        return self._tick_rates
     
     def get_status_summary(self) -> Dict[str, str]:
         """
@@ -211,20 +305,27 @@ class ResourceManager:
         Returns:
             Dictionnaire avec les informations formatées
         """
-        net_production = self.get_net_production()
+        # Réutiliser le résumé précédent tant que l'état n'a pas changé
+        key = (self.epoch, self.max_energy, self.max_science)
+        if key == self._summary_key:
+            return self._summary
         
-        return {
-            'credits': f"{self.credits:.0f} (+{net_production['credits']:.1f}/s)",
-            'energy': f"{self.energy:.0f}/{self.max_energy} ({net_production['energy']:+.1f}/s)",
-            'science': f"{self.science:.0f}/{self.max_science} (+{net_production['science']:.1f}/s)"
+        self._summary_key = key
+        self._summary = {
+            'credits': "%.0f (+%.1f/s)" % (self.credits, self.credits_per_second),
+            'energy': "%.0f/%s (%+.1f/s)" % (self.energy, self.max_energy,
+                                             self.energy_per_second - self.energy_consumption),
+            'science': "%.0f/%s (+%.1f/s)" % (self.science, self.max_science, self.science_per_second)
         }
+        return self._summary
     
     def to_dict(self) -> Dict:
         """
         Convertit les ressources en dictionnaire pour la sauvegarde
         
         Returns:
-            Dictionnaire représentant les ressources
+            Dictionnaire représentant les ressources (instantané, sérialisable
+            après coup sans interférence avec la boucle de mise à jour)
         """
         return {
             'credits': self.credits,
@@ -232,9 +333,25 @@ class ResourceManager:
             'science': self.science,
             'max_energy': self.max_energy,
             'max_science': self.max_science,
-            'history': self.history.copy()
+            'history': self.history
         }
     
+    def _load_history(self, history: Dict[str, list]):
+        """
+        Remplit le tampon d'historique depuis une sauvegarde
+        
+        Args:
+            history: Dictionnaire {ressource: [valeurs]}
+        """
+        rows = [history.get(key, [])[-HISTORY_LENGTH:] for key in _HISTORY_KEYS]
+        length = min(len(row) for row in rows)
+        self._history.fill(0.0)
+        for row_index, row in enumerate(rows):
+            if length:
+                self._history[row_index, :length] = row[len(row) - length:]
+        self._history_len = length
+        self._history_idx = length % HISTORY_LENGTH
+    
     @classmethod
     def from_dict(cls, data: Dict):
         """
@@ -242,7 +359,7 @@ class ResourceManager:
         
         Args:
             data: Données de sauvegarde
-            
+        
         Returns:
             Instance de ResourceManager
         """
@@ -252,6 +369,7 @@ class ResourceManager:
         manager.science = data.get('science', INITIAL_SCIENCE)
         manager.max_energy = data.get('max_energy', 1000)
         manager.max_science = data.get('max_science', 10000)
-        manager.history = data.get('history', manager.history)
+        if 'history' in data:
+            manager._load_history(data['history'])
         
         return manager
\ No newline at end of file
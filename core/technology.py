@@ -3,14 +3,23 @@ Système d'arbre technologique pour TerraGenesis PC
 """
 
 import json
+import logging
 from typing import Dict, List, Set, Optional
 from config.constants import TECHNOLOGIES_DATA_FILE
+from utils import json_io
+from .planet import BUILDING_INDEX
+
+logger = logging.getLogger(__name__)
 
 class Technology:
     """
     Classe représentant une technologie individuelle
     """
     
+    __slots__ = ('id', 'name', 'description', 'icon', 'cost', 'prerequisites', 'unlocks',
+                 'is_researched', 'is_available', 'research_progress', 'progress_rate',
+                 'bit', 'prereq_mask')
+    
     def __init__(self, tech_id: str, tech_data: Dict):
         """
         Initialise une technologie
@@ -31,12 +40,23 @@ class Technology:
         self.is_researched = False
         self.is_available = len(self.prerequisites) == 0  # Disponible si pas de prérequis
         self.research_progress = 0.0  # Progression de la recherche (0-100)
+        
+        # Progression (%) par point de science (1 point de science = 100/coût %)
+        science_cost = self.cost.get('science', 100)
+        self.progress_rate = 100.0 / science_cost if science_cost > 0 else 0.0
+        
+        # Encodage en bits, attribué par l'arbre au chargement
+        self.bit = 0           # Bit propre à cette technologie
+        self.prereq_mask = 0   # Union des bits des prérequis
 
 class TechnologyTree:
     """
     Gestionnaire de l'arbre technologique
     """
     
+    # Données brutes des technologies, lues une seule fois par processus
+    _tech_data: Optional[Dict] = None
+    
     def __init__(self):
         """
         Initialise l'arbre technologique
@@ -46,6 +66,25 @@ class TechnologyTree:
         self.current_research: Optional[str] = None
         self.research_progress = 0.0
         
+        # Bâtiments débloqués: bit BUILDING_INDEX[type] à 1 si le bâtiment est
+        # débloqué par une technologie recherchée
+        self.unlocked_mask = 0
+        self._unlocked_buildings: Set[str] = set()  # Tous les déblocages, bâtiments ou non
+        self._unlocked_list: Optional[List[str]] = None  # Liste construite à la demande
+        
+        # Index inverse des prérequis: technologie -> technologies qui en dépendent
+        self._dependents: Dict[str, List[str]] = {}
+        
+        # Union des bits des technologies recherchées
+        self._researched_mask = 0
+        
+        # Listes tenues à jour au fil des recherches (lecture seule pour l'appelant)
+        self._available_techs: List[Technology] = []
+        self._researched_techs: List[Technology] = []
+        
+        # Compteur incrémenté à chaque changement visible de l'état
+        self.epoch = 0
+        
         # Charger les technologies depuis le fichier JSON
         self.load_technologies()
         
@@ -57,20 +96,53 @@ class TechnologyTree:
         Charge les technologies depuis le fichier JSON
         """
         try:
-            with open(TECHNOLOGIES_DATA_FILE, 'r', encoding='utf-8') as f:
-                tech_data = json.load(f)
+            tech_data = self._load_static_data()
             
             for tech_id, data in tech_data.items():
                 self.technologies[tech_id] = Technology(tech_id, data)
             
-            print(f"Chargé {len(self.technologies)} technologies")
+            # Un bit par technologie; un prérequis inconnu reçoit un bit qui ne
+            # sera jamais recherché, la technologie reste alors indisponible
+            for index, tech in enumerate(self.technologies.values()):
+                tech.bit = 1 << index
+            unknown_bit = 1 << len(self.technologies)
+            for tech in self.technologies.values():
+                for prerequisite in tech.prerequisites:
+                    prerequisite_tech = self.technologies.get(prerequisite)
+                    tech.prereq_mask |= prerequisite_tech.bit if prerequisite_tech else unknown_bit
+            
+            self._dependents = {tech_id: [] for tech_id in self.technologies}
+            for tech_id, tech in self.technologies.items():
+                for prerequisite in tech.prerequisites:
+                    self._dependents.setdefault(prerequisite, []).append(tech_id)
+            
+            logger.debug("Chargé %d technologies", len(self.technologies))
             
         except FileNotFoundError:
-            print(f"Fichier {TECHNOLOGIES_DATA_FILE} non trouvé")
+            logger.error("Fichier %s non trouvé", TECHNOLOGIES_DATA_FILE)
         except json.JSONDecodeError as e:
-            print(f"Erreur de décodage JSON: {e}")
+            logger.error("Erreur de décodage JSON: %s", e)
         except Exception as e:
-            print(f"Erreur lors du chargement des technologies: {e}")
+            logger.error("Erreur lors du chargement des technologies: %s", e)
+    
+    @classmethod
+    def _load_static_data(cls) -> Dict:
+        """
+        Lit le fichier des technologies au premier appel puis réutilise le résultat
+        
+        Returns:
+            Dictionnaire des données de technologies
+        """
+        if cls._tech_data is None:
+            # orjson si disponible (ses erreurs héritent de json.JSONDecodeError)
+            cls._tech_data = json_io.load_file(TECHNOLOGIES_DATA_FILE)
+        return cls._tech_data
+    
+    def reset(self):
+        """
+        Réinitialise l'arbre pour une nouvelle partie, sans relire le fichier
+        """
+        self.__init__()
     
     def start_research(self, tech_id: str) -> bool:
         """
@@ -98,6 +170,11 @@ class TechnologyTree:
         self.current_research = tech_id
         self.research_progress = 0.0
         tech.research_progress = 0.0
+        self.epoch += 1
+        
+        # Une technologie gratuite est acquise immédiatement
+        if not tech.progress_rate:
+            self.complete_research(tech_id)
         
         return True
     
@@ -109,18 +186,16 @@ class TechnologyTree:
             science_points: Points de science disponibles
             delta_time: Temps écoulé depuis la dernière mise à jour
         """
-        if not self.current_research:
+        # Rien à faire sans recherche en cours ou sans science produite
+        if not self.current_research or science_points <= 0 or delta_time <= 0:
             return
         
         tech = self.technologies[self.current_research]
-        science_cost = tech.cost.get('science', 100)
-        
-        # Calculer la progression (1 point de science = 1% de progression)
-        progress_per_second = science_points / science_cost * 100
-        progress_increase = progress_per_second * delta_time
         
-        tech.research_progress += progress_increase
+        # Calculer la progression
+        tech.research_progress += science_points * tech.progress_rate * delta_time
         self.research_progress = tech.research_progress
+        self.epoch += 1
         
         # Vérifier si la recherche est terminée
         if tech.research_progress >= 100.0:
@@ -137,59 +212,93 @@ class TechnologyTree:
             return
         
         tech = self.technologies[tech_id]
+        if tech.is_researched:
+            return
+        
         tech.is_researched = True
         tech.research_progress = 100.0
+        if tech.is_available:
+            self._available_techs.remove(tech)
+        self._researched_techs.append(tech)
         self.researched_technologies.add(tech_id)
+        self._researched_mask |= tech.bit
+        self.unlocked_mask |= self._unlocks_mask(tech)
+        self._unlocked_buildings.update(tech.unlocks)
+        self._unlocked_list = None
+        self.epoch += 1
         
         # Réinitialiser la recherche actuelle
         if self.current_research == tech_id:
             self.current_research = None
             self.research_progress = 0.0
         
-        # Mettre à jour la disponibilité des autres technologies
-        self._update_availability()
+        # Mettre à jour la disponibilité des technologies qui en dépendent
+        for dependent_id in self._dependents.get(tech_id, ()):
+            self._recheck(self.technologies[dependent_id])
         
-        print(f"Technologie '{tech.name}' recherchée avec succès!")
+        logger.debug("Technologie '%s' recherchée avec succès!", tech.name)
+    
+    def _recheck(self, tech: Technology):
+        """
+        Réévalue la disponibilité d'une technologie
+        
+        Args:
+            tech: Technologie à réévaluer
+        """
+        if not tech.is_researched:
+            # Une technologie est disponible si tous ses prérequis sont recherchés
+            is_available = (tech.prereq_mask & self._researched_mask) == tech.prereq_mask
+            if is_available != tech.is_available:
+                tech.is_available = is_available
+                if is_available:
+                    self._available_techs.append(tech)
+                else:
+                    self._available_techs.remove(tech)
     
     def _update_availability(self):
         """
-        Met à jour la disponibilité des technologies basée sur les prérequis
+        Met à jour la disponibilité de toutes les technologies basée sur les prérequis
+        (chargement initial et restauration d'une sauvegarde)
         """
-        for tech in self.technologies.values():
+        technologies = self.technologies.values()
+        for tech in technologies:
             if not tech.is_researched:
-                # Une technologie est disponible si tous ses prérequis sont recherchés
-                tech.is_available = tech.prerequisites.issubset(self.researched_technologies)
+                tech.is_available = (tech.prereq_mask & self._researched_mask) == tech.prereq_mask
+        
+        # Reconstruire les listes dans l'ordre du fichier
+        self._available_techs = [tech for tech in technologies
+                                 if tech.is_available and not tech.is_researched]
+        self._researched_techs = [tech for tech in technologies if tech.is_researched]
     
     def get_available_technologies(self) -> List[Technology]:
         """
         Retourne la liste des technologies disponibles pour la recherche
         
         Returns:
-            Liste des technologies disponibles
+            Liste des technologies disponibles (à ne pas modifier)
         """
-        return [tech for tech in self.technologies.values() 
-                if tech.is_available and not tech.is_researched]
+        return self._available_techs
     
     def get_researched_technologies(self) -> List[Technology]:
         """
         Retourne la liste des technologies déjà recherchées
         
         Returns:
-            Liste des technologies recherchées
+            Liste des technologies recherchées (à ne pas modifier)
         """
-        return [tech for tech in self.technologies.values() if tech.is_researched]
+        return self._researched_techs
     
     def get_unlocked_buildings(self) -> List[str]:
         """
         Retourne la liste des bâtiments débloqués par les technologies recherchées
         
         Returns:
-            Liste des bâtiments disponibles
+            Liste des bâtiments disponibles (à ne pas modifier)
         """
-        unlocked = []
-        for tech in self.get_researched_technologies():
-            unlocked.extend(tech.unlocks)
-        return list(set(unlocked))  # Supprimer les doublons
+        # Reconstruite seulement après une recherche terminée
+        if self._unlocked_list is None:
+            self._unlocked_list = list(self._unlocked_buildings)
+        return self._unlocked_list
     
     def is_building_unlocked(self, building_type: str) -> bool:
         """
@@ -201,7 +310,29 @@ class TechnologyTree:
         Returns:
             True si le bâtiment est débloqué
         """
-        return building_type in self.get_unlocked_buildings()
+        index = BUILDING_INDEX.get(building_type)
+        if index is None:
+            # Débloqué par une technologie mais pas encore constructible
+            return building_type in self._unlocked_buildings
+        return bool(self.unlocked_mask >> index & 1)
+    
+    @staticmethod
+    def _unlocks_mask(tech: Technology) -> int:
+        """
+        Calcule le masque des bâtiments débloqués par une technologie
+        
+        Args:
+            tech: Technologie
+            
+        Returns:
+            Masque de bits indexé par BUILDING_INDEX
+        """
+        mask = 0
+        for building_type in tech.unlocks:
+            index = BUILDING_INDEX.get(building_type)
+            if index is not None:
+                mask |= 1 << index
+        return mask
     
     def get_research_status(self) -> Dict:
         """
@@ -214,7 +345,7 @@ class TechnologyTree:
             'current_research': None,
             'progress': 0.0,
             'researched_count': len(self.researched_technologies),
-            'available_count': len(self.get_available_technologies()),
+            'available_count': len(self._available_techs),
             'total_count': len(self.technologies)
         }
         
@@ -264,6 +395,10 @@ class TechnologyTree:
         for tech_id in tree.researched_technologies:
             if tech_id in tree.technologies:
                 tree.technologies[tech_id].is_researched = True
+                tree._researched_mask |= tree.technologies[tech_id].bit
+                tree.unlocked_mask |= cls._unlocks_mask(tree.technologies[tech_id])
+                tree._unlocked_buildings.update(tree.technologies[tech_id].unlocks)
+        tree._unlocked_list = None
         
         # Restaurer la recherche actuelle
         tree.current_research = data.get('current_research')
@@ -1,9 +1,25 @@
 """
 Module d'interface graphique pour TerraGenesis PC
+Les classes sont importées à la demande (PEP 562) pour alléger l'import du paquet
 """
 
-from .main_window import MainWindow
-from .planet_selection import PlanetSelectionDialog
-from .game_interface import GameInterface
+import importlib
+
+_LAZY_IMPORTS = {
+    'MainWindow': '.main_window',
+    'PlanetSelectionDialog': '.planet_selection',
+    'GameInterface': '.game_interface'
+}
 
 __all__ = ['MainWindow', 'PlanetSelectionDialog', 'GameInterface']
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
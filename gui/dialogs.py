@@ -2,35 +2,377 @@
 Boîtes de dialogue utilitaires pour TerraGenesis PC
 """
 
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget, 
-                            QListWidgetItem, QLabel, QPushButton,
+import os
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListView, 
+                            QLabel, QPushButton, QStyledItemDelegate,
                             QTextEdit, QGroupBox, QGridLayout, QMessageBox)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import (Qt, QAbstractListModel, QModelIndex, QObject, QRunnable,
+                          QThreadPool, QTimer, pyqtSignal)
+from PyQt5.QtGui import QFont, QColor, QPalette
 
 from utils.helpers import format_time, format_number
+from utils.save_manager import SaveManager
+
+# Feuilles de style des boîtes de dialogue, assemblées une seule fois à l'import
+_DIALOG_STYLE = """
+            QDialog {
+                background-color: #1e1e1e;
+                color: #ffffff;
+            }
+            QLabel {
+                color: #ffffff;
+            }
+"""
+
+_LIST_STYLE = """
+            QListView {
+                background-color: #2d2d2d;
+                border: 1px solid #555555;
+                color: #ffffff;
+                selection-background-color: #0078d4;
+            }
+"""
+
+_TEXT_STYLE = """
+            QTextEdit {
+                background-color: #2d2d2d;
+                border: 1px solid #555555;
+                color: #ffffff;
+                padding: 8px;
+            }
+"""
+
+_GROUP_STYLE = """
+            QGroupBox {
+                color: #ffffff;
+                border: 1px solid #555555;
+                border-radius: 4px;
+                margin-top: 8px;
+                padding-top: 8px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 8px;
+                padding: 0 4px 0 4px;
+            }
+"""
+
+_BUTTON_STYLE = """
+            QPushButton {
+                background-color: #0078d4;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 4px;
+            }
+            QPushButton:hover {
+                background-color: #106ebe;
+            }
+"""
+
+_BUTTON_DISABLED_STYLE = """
+            QPushButton:disabled {
+                background-color: #555555;
+                color: #999999;
+            }
+"""
+
+_LOAD_GAME_STYLE = _DIALOG_STYLE + _LIST_STYLE + _GROUP_STYLE + _BUTTON_STYLE + _BUTTON_DISABLED_STYLE
+_TECHNOLOGY_STYLE = _DIALOG_STYLE + _TEXT_STYLE + _GROUP_STYLE + _BUTTON_STYLE
+_EVENT_STYLE = _DIALOG_STYLE + _TEXT_STYLE + _BUTTON_STYLE
+
+# Polices des titres, partagées par toutes les boîtes de dialogue
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(14)
+_TITLE_FONT.setBold(True)
+
+_NAME_FONT = QFont()
+_NAME_FONT.setPointSize(16)
+_NAME_FONT.setBold(True)
+
+# Couleur du nom d'un événement selon son type, et la règle de style correspondante
+_EVENT_TYPE_COLORS = {
+    'positive': '#00FF00',
+    'negative': '#FF0000',
+    'mixed': '#FFFF00',
+    'neutral': '#FFFFFF'
+}
+_EVENT_TYPE_STYLES = {event_type: f"color: {color};" for event_type, color in _EVENT_TYPE_COLORS.items()}
+
+def _display_strings(save_data: dict) -> dict:
+    """
+    Calcule une fois les textes affichés pour une sauvegarde et les garde dans ses données
+    
+    Args:
+        save_data: Données de la sauvegarde (métadonnées immuables)
+    
+    Returns:
+        Les mêmes données, complétées des clés '_display_text', '_habitability_str',
+        '_credits_str' et '_science_str'
+    """
+    if '_display_text' not in save_data:
+        planet_name = save_data['planet_name']
+        save_time = save_data['save_time_formatted']
+        if save_data['is_autosave']:
+            save_data['_display_text'] = f"[AUTO] {planet_name} - {save_time}"
+        else:
+            save_data['_display_text'] = f"{planet_name} - {save_time}"
+        save_data['_habitability_str'] = f"{save_data['habitability']:.1f}%"
+        save_data['_credits_str'] = format_number(save_data['credits'])
+        save_data['_science_str'] = format_number(save_data['science'])
+    return save_data
+
+# Textes des détails par technologie (données de jeu immuables)
+_TECHNOLOGY_TEXTS = {}
+
+def _technology_texts(technology) -> tuple:
+    """
+    Retourne les textes de coût, prérequis et déblocages d'une technologie,
+    calculés à la première ouverture de ses détails
+    
+    Args:
+        technology: Objet Technology
+    
+    Returns:
+        Tuple (coût, prérequis, déblocages)
+    """
+    texts = _TECHNOLOGY_TEXTS.get(technology.id)
+    if texts is None:
+        cost_text = ", ".join(f"{resource}: {amount}"
+                              for resource, amount in technology.cost.items())
+        prereq_text = ", ".join(technology.prerequisites) or "Aucun"
+        unlocks_text = ", ".join(technology.unlocks) or "Rien"
+        texts = _TECHNOLOGY_TEXTS[technology.id] = (cost_text, prereq_text, unlocks_text)
+    return texts
+
+class _DeleteSaveSignals(QObject):
+    """
+    Signaux de la suppression d'une sauvegarde (un QRunnable ne peut pas en émettre)
+    """
+    
+    failed = pyqtSignal(int, object)
+
+class _DeleteSaveJob(QRunnable):
+    """
+    Suppression d'un fichier de sauvegarde dans un thread du pool, hors du thread de l'interface
+    """
+    
+    def __init__(self, save_manager: SaveManager, row: int, save_data: dict):
+        """
+        Initialise la tâche de suppression
+        
+        Args:
+            save_manager: Gestionnaire de sauvegarde
+            row: Ligne qu'occupait la sauvegarde dans la liste
+            save_data: Données de la sauvegarde à supprimer
+        """
+        super().__init__()
+        self.save_manager = save_manager
+        self.row = row
+        self.save_data = save_data
+        self.signals = _DeleteSaveSignals()
+    
+    def run(self):
+        """
+        Supprime le fichier via le gestionnaire de sauvegarde
+        """
+        filename = self.save_data['filename']
+        if self.save_manager.delete_save(filename):
+            return
+        
+        # Un fichier déjà absent n'a pas à revenir dans la liste
+        if os.path.exists(os.path.join(self.save_manager.saves_directory, filename)):
+            self.signals.failed.emit(self.row, self.save_data)
+
+class _SaveScanSignals(QObject):
+    """
+    Signaux de la recherche des sauvegardes (un QRunnable ne peut pas en émettre)
+    """
+    
+    finished = pyqtSignal(list)
+
+class _SaveScanJob(QRunnable):
+    """
+    Lecture des métadonnées des sauvegardes dans un thread du pool
+    """
+    
+    def __init__(self, loader):
+        """
+        Initialise la tâche de recherche
+        
+        Args:
+            loader: Fonction retournant la liste des fichiers de sauvegarde
+        """
+        super().__init__()
+        self.loader = loader
+        self.signals = _SaveScanSignals()
+    
+    def run(self):
+        """
+        Parcourt les sauvegardes et transmet le résultat au thread de l'interface
+        """
+        try:
+            save_files = self.loader()
+        except Exception as e:
+            print(f"Erreur lors de la recherche des sauvegardes: {e}")
+            save_files = []
+        
+        # Émis depuis le pool, le signal est livré dans le thread de l'interface
+        self.signals.finished.emit(save_files)
+
+class SaveListModel(QAbstractListModel):
+    """
+    Modèle de la liste des sauvegardes
+    Les textes ne sont calculés que pour les lignes affichées
+    """
+    
+    def __init__(self, save_files: list, parent=None):
+        """
+        Initialise le modèle
+        
+        Args:
+            save_files: Liste des fichiers de sauvegarde
+            parent: Objet parent
+        """
+        super().__init__(parent)
+        self.save_files = list(save_files)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """
+        Retourne le nombre de sauvegardes
+        """
+        return 0 if parent.isValid() else len(self.save_files)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Retourne la donnée d'une ligne pour un rôle
+        
+        Args:
+            index: Index de la ligne
+            role: Rôle demandé par la vue
+        
+        Returns:
+            Texte ou données de la sauvegarde selon le rôle
+        """
+        if not index.isValid():
+            return None
+        
+        save_data = self.save_files[index.row()]
+        
+        if role == Qt.DisplayRole:
+            return _display_strings(save_data)['_display_text']
+        
+        if role == Qt.UserRole:
+            return save_data
+        
+        return None
+    
+    def append_saves(self, save_files: list):
+        """
+        Ajoute des sauvegardes à la fin de la liste
+        
+        Args:
+            save_files: Liste des fichiers de sauvegarde
+        """
+        if not save_files:
+            return
+        
+        row = len(self.save_files)
+        self.beginInsertRows(QModelIndex(), row, row + len(save_files) - 1)
+        self.save_files.extend(save_files)
+        self.endInsertRows()
+    
+    def insert_save(self, row: int, save_data: dict):
+        """
+        Insère une sauvegarde dans la liste
+        
+        Args:
+            row: Ligne d'insertion (bornée à la taille de la liste)
+            save_data: Données de la sauvegarde
+        """
+        row = max(0, min(row, len(self.save_files)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.save_files.insert(row, save_data)
+        self.endInsertRows()
+    
+    def removeRows(self, row: int, count: int, parent=QModelIndex()) -> bool:
+        """
+        Retire une plage contiguë de sauvegardes en une seule notification
+        
+        Args:
+            row: Première ligne à retirer
+            count: Nombre de lignes
+            parent: Index parent (invalide pour une liste)
+        
+        Returns:
+            True si les lignes ont été retirées
+        """
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self.save_files):
+            return False
+        
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self.save_files[row:row + count]
+        self.endRemoveRows()
+        return True
+
+class AutosaveDelegate(QStyledItemDelegate):
+    """
+    Délégué de la liste des sauvegardes, affiche les sauvegardes automatiques en jaune
+    """
+    
+    AUTOSAVE_COLOR = QColor(Qt.yellow)
+    
+    def initStyleOption(self, option, index):
+        """
+        Prépare les options de dessin d'une ligne
+        
+        Args:
+            option: Options de style à compléter
+            index: Index de la ligne dessinée
+        """
+        super().initStyleOption(option, index)
+        
+        # Couleur selon le type
+        if index.model().save_files[index.row()]['is_autosave']:
+            option.palette.setColor(QPalette.Text, self.AUTOSAVE_COLOR)
 
 class LoadGameDialog(QDialog):
     """
     Boîte de dialogue pour charger une partie sauvegardée
     """
     
-    def __init__(self, save_files: list, parent=None):
+    # Gestionnaire de sauvegarde partagé, créé à la première suppression
+    _save_manager = None
+    
+    def __init__(self, save_files, parent=None):
         """
         Initialise la boîte de dialogue
         
         Args:
-            save_files: Liste des fichiers de sauvegarde
+            save_files: Liste des fichiers de sauvegarde, ou fonction qui la
+                retourne (appelée dans un thread du pool, la liste se remplit
+                une fois la recherche terminée)
             parent: Widget parent
         """
         super().__init__(parent)
         
-        self.save_files = save_files
+        loader = save_files if callable(save_files) else None
+        self.save_files = [] if loader else save_files
         self.selected_save = None
+        self._scan_job = None
+        self._confirm_box = None  # Boîte de confirmation, créée à la première suppression
+        
+        # Regroupe les changements de sélection d'un même geste en une seule mise à jour
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.timeout.connect(self._apply_selection)
         
         self.setup_ui()
         self.setup_style()
         self.populate_saves()
+        
+        if loader:
+            self.start_scan(loader)
     
     def setup_ui(self):
         """
@@ -43,17 +385,15 @@ class LoadGameDialog(QDialog):
         layout = QVBoxLayout(self)
         
         # Titre
-        title_label = QLabel("Sélectionnez une sauvegarde à charger")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
+        self.title_label = QLabel("Sélectionnez une sauvegarde à charger")
+        self.title_label.setFont(_TITLE_FONT)
+        layout.addWidget(self.title_label)
         
         # Liste des sauvegardes
-        self.saves_list = QListWidget()
-        self.saves_list.itemSelectionChanged.connect(self.on_selection_changed)
-        self.saves_list.itemDoubleClicked.connect(self.on_double_click)
+        self.saves_list = QListView()
+        self.saves_list.setUniformItemSizes(True)
+        self.saves_list.setItemDelegate(AutosaveDelegate(self.saves_list))
+        self.saves_list.doubleClicked.connect(self.on_double_click)
         layout.addWidget(self.saves_list)
         
         # Zone d'informations détaillées
@@ -107,81 +447,70 @@ class LoadGameDialog(QDialog):
         """
         Configure le style
         """
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QListWidget {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                color: #ffffff;
-                selection-background-color: #0078d4;
-            }
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #999999;
-            }
-        """)
+        self.setStyleSheet(_LOAD_GAME_STYLE)
     
     def populate_saves(self):
         """
         Remplit la liste des sauvegardes
         """
-        for save_data in self.save_files:
-            item = QListWidgetItem()
-            
-            # Texte principal
-            planet_name = save_data['planet_name']
-            save_time = save_data['save_time_formatted']
-            game_time = save_data['game_time_formatted']
-            
-            if save_data['is_autosave']:
-                text = f"[AUTO] {planet_name} - {save_time}"
+        # La vue ne demande au modèle que les lignes visibles
+        self.saves_model = SaveListModel(self.save_files, self)
+        self.saves_list.setModel(self.saves_model)
+        self.saves_list.selectionModel().currentChanged.connect(self.on_selection_changed)
+    
+    def start_scan(self, loader):
+        """
+        Lance la recherche des sauvegardes dans le pool de threads
+        
+        Args:
+            loader: Fonction retournant la liste des fichiers de sauvegarde
+        """
+        self.title_label.setText("Recherche des sauvegardes...")
+        self._scan_job = _SaveScanJob(loader)
+        self._scan_job.signals.finished.connect(self.on_scan_finished)
+        QThreadPool.globalInstance().start(self._scan_job)
+    
+    def on_scan_finished(self, save_files: list):
+        """
+        Appelé quand la recherche des sauvegardes est terminée
+        
+        Args:
+            save_files: Liste des fichiers de sauvegarde
+        """
+        self._scan_job = None
+        self.save_files = save_files
+        
+        # Un seul rafraîchissement pour l'insertion et le changement de titre
+        self.setUpdatesEnabled(False)
+        try:
+            self.saves_model.append_saves(save_files)
+            if save_files:
+                self.title_label.setText("Sélectionnez une sauvegarde à charger")
             else:
-                text = f"{planet_name} - {save_time}"
-            
-            item.setText(text)
-            item.setData(Qt.UserRole, save_data)
-            
-            # Couleur selon le type
-            if save_data['is_autosave']:
-                item.setForeground(Qt.yellow)
-            
-            self.saves_list.addItem(item)
+                self.title_label.setText("Aucune sauvegarde trouvée")
+        finally:
+            self.setUpdatesEnabled(True)
     
-    def on_selection_changed(self):
+    def on_selection_changed(self, current=None, previous=None):
         """
-        Appelé quand la sélection change
+        Appelé quand la sélection change, la mise à jour est faite au retour
+        dans la boucle d'événements
+        
+        Args:
+            current: Index de la nouvelle ligne courante
+            previous: Index de l'ancienne ligne courante
         """
-        current_item = self.saves_list.currentItem()
-        if current_item:
-            save_data = current_item.data(Qt.UserRole)
+        self._selection_timer.start(0)
+    
+    def _apply_selection(self):
+        """
+        Met à jour la sauvegarde sélectionnée et les détails affichés
+        """
+        self._selection_timer.stop()
+        current = self.saves_list.currentIndex()
+        if current.isValid():
+            # Lecture directe dans le modèle, sans passer par un QVariant
+            save_data = self.saves_model.save_files[current.row()]
             self.selected_save = save_data
             self.update_info_display(save_data)
             self.ok_button.setEnabled(True)
@@ -192,14 +521,14 @@ class LoadGameDialog(QDialog):
             self.ok_button.setEnabled(False)
             self.delete_button.setEnabled(False)
     
-    def on_double_click(self, item):
+    def on_double_click(self, index):
         """
         Appelé lors d'un double-clic
         
         Args:
-            item: Item cliqué
+            index: Index de la ligne cliquée
         """
-        if item:
+        if index.isValid():
             self.accept()
     
     def update_info_display(self, save_data: dict):
@@ -209,12 +538,13 @@ class LoadGameDialog(QDialog):
         Args:
             save_data: Données de la sauvegarde
         """
+        _display_strings(save_data)
         self.planet_label.setText(save_data['planet_name'])
         self.date_label.setText(save_data['save_time_formatted'])
         self.time_label.setText(save_data['game_time_formatted'])
-        self.habitability_label.setText(f"{save_data['habitability']:.1f}%")
-        self.credits_label.setText(format_number(save_data['credits']))
-        self.science_label.setText(format_number(save_data['science']))
+        self.habitability_label.setText(save_data['_habitability_str'])
+        self.credits_label.setText(save_data['_credits_str'])
+        self.science_label.setText(save_data['_science_str'])
     
     def clear_info_display(self):
         """
@@ -229,25 +559,38 @@ class LoadGameDialog(QDialog):
         """
         Supprime la sauvegarde sélectionnée
         """
+        if self._selection_timer.isActive():
+            self._apply_selection()
         if not self.selected_save:
             return
         
-        reply = QMessageBox.question(
-            self,
-            "Confirmer la suppression",
-            f"Êtes-vous sûr de vouloir supprimer la sauvegarde '{self.selected_save['filename']}'?",
-            QMessageBox.Yes | QMessageBox.No
-        )
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(QMessageBox.Question, "Confirmer la suppression", "",
+                                            QMessageBox.Yes | QMessageBox.No, self)
+        self._confirm_box.setText(
+            f"Êtes-vous sûr de vouloir supprimer la sauvegarde '{self.selected_save['filename']}'?")
+        reply = self._confirm_box.exec_()
         
         if reply == QMessageBox.Yes:
-            # Supprimer de la liste
-            current_row = self.saves_list.currentRow()
-            self.saves_list.takeItem(current_row)
+            save_data = self.selected_save
+            row = self.saves_list.currentIndex().row()
             
-            # Supprimer le fichier (sera fait par le gestionnaire de sauvegarde)
-            from utils.save_manager import SaveManager
-            save_manager = SaveManager()
-            save_manager.delete_save(self.selected_save['filename'])
+            # Supprimer de la liste sans attendre le disque, sans réagir au
+            # déplacement de la ligne courante (la sélection est réinitialisée juste après)
+            selection_model = self.saves_list.selectionModel()
+            selection_model.blockSignals(True)
+            try:
+                self.saves_model.removeRow(row)
+                selection_model.clear()
+            finally:
+                selection_model.blockSignals(False)
+            
+            # Supprimer le fichier dans le pool de threads, sans bloquer l'interface
+            if LoadGameDialog._save_manager is None:
+                LoadGameDialog._save_manager = SaveManager()
+            job = _DeleteSaveJob(LoadGameDialog._save_manager, row, save_data)
+            job.signals.failed.connect(self.on_delete_failed)
+            QThreadPool.globalInstance().start(job)
             
             # Réinitialiser la sélection
             self.selected_save = None
@@ -255,6 +598,18 @@ class LoadGameDialog(QDialog):
             self.ok_button.setEnabled(False)
             self.delete_button.setEnabled(False)
     
+    def on_delete_failed(self, row: int, save_data: dict):
+        """
+        Appelé quand la suppression d'un fichier a échoué: la sauvegarde revient dans la liste
+        
+        Args:
+            row: Ligne qu'occupait la sauvegarde
+            save_data: Données de la sauvegarde
+        """
+        self.saves_model.insert_save(row, save_data)
+        QMessageBox.warning(self, "Erreur",
+                            f"Impossible de supprimer la sauvegarde '{save_data['filename']}'")
+    
     def get_selected_save(self):
         """
         Retourne la sauvegarde sélectionnée
@@ -262,6 +617,9 @@ class LoadGameDialog(QDialog):
         Returns:
             Données de la sauvegarde sélectionnée
         """
+        # Appliquer un changement de sélection encore en attente
+        if self._selection_timer.isActive():
+            self._apply_selection()
         return self.selected_save
 
 class TechnologyDetailsDialog(QDialog):
@@ -280,25 +638,35 @@ class TechnologyDetailsDialog(QDialog):
         super().__init__(parent)
         
         self.technology = technology
-        self.setup_ui()
-        self.setup_style()
+        self.setWindowTitle(f"Technologie: {self.technology.name}")
+        self.setModal(True)
+        self.resize(400, 300)
+        
+        # Les widgets ne sont construits qu'au premier affichage
+        self._built = False
+    
+    def showEvent(self, event):
+        """
+        Construit l'interface au premier affichage
+        
+        Args:
+            event: Événement d'affichage
+        """
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+            self.setup_style()
+        super().showEvent(event)
     
     def setup_ui(self):
         """
         Configure l'interface
         """
-        self.setWindowTitle(f"Technologie: {self.technology.name}")
-        self.setModal(True)
-        self.resize(400, 300)
-        
         layout = QVBoxLayout(self)
         
         # Nom de la technologie
         name_label = QLabel(self.technology.name)
-        name_font = QFont()
-        name_font.setPointSize(16)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
+        name_label.setFont(_NAME_FONT)
         layout.addWidget(name_label)
         
         # Description
@@ -312,25 +680,17 @@ class TechnologyDetailsDialog(QDialog):
         info_group = QGroupBox("Informations")
         info_layout = QGridLayout(info_group)
         
+        cost_text, prereq_text, unlocks_text = _technology_texts(self.technology)
+        
         # Coût
-        cost_text = ", ".join([f"{resource}: {amount}" 
-                              for resource, amount in self.technology.cost.items()])
         info_layout.addWidget(QLabel("Coût:"), 0, 0)
         info_layout.addWidget(QLabel(cost_text), 0, 1)
         
         # Prérequis
-        if self.technology.prerequisites:
-            prereq_text = ", ".join(self.technology.prerequisites)
-        else:
-            prereq_text = "Aucun"
         info_layout.addWidget(QLabel("Prérequis:"), 1, 0)
         info_layout.addWidget(QLabel(prereq_text), 1, 1)
         
         # Débloque
-        if self.technology.unlocks:
-            unlocks_text = ", ".join(self.technology.unlocks)
-        else:
-            unlocks_text = "Rien"
         info_layout.addWidget(QLabel("Débloque:"), 2, 0)
         info_layout.addWidget(QLabel(unlocks_text), 2, 1)
         
@@ -366,43 +726,7 @@ class TechnologyDetailsDialog(QDialog):
         """
         Configure le style
         """
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                color: #ffffff;
-                padding: 8px;
-            }
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """)
+        self.setStyleSheet(_TECHNOLOGY_STYLE)
 
 class EventDetailsDialog(QDialog):
     """
@@ -420,35 +744,39 @@ class EventDetailsDialog(QDialog):
         super().__init__(parent)
         
         self.event_info = event_info
-        self.setup_ui()
-        self.setup_style()
+        self.setWindowTitle(f"Événement: {self.event_info['name']}")
+        self.setModal(True)
+        self.resize(400, 250)
+        
+        # Les widgets ne sont construits qu'au premier affichage
+        self._built = False
+    
+    def showEvent(self, event):
+        """
+        Construit l'interface au premier affichage
+        
+        Args:
+            event: Événement d'affichage
+        """
+        if not self._built:
+            self._built = True
+            self.setup_ui()
+            self.setup_style()
+        super().showEvent(event)
     
     def setup_ui(self):
         """
         Configure l'interface
         """
-        self.setWindowTitle(f"Événement: {self.event_info['name']}")
-        self.setModal(True)
-        self.resize(400, 250)
-        
         layout = QVBoxLayout(self)
         
         # Nom de l'événement
         name_label = QLabel(self.event_info['name'])
-        name_font = QFont()
-        name_font.setPointSize(16)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
+        name_label.setFont(_NAME_FONT)
         
         # Couleur selon le type
         event_type = self.event_info.get('type', 'neutral')
-        type_colors = {
-            'positive': '#00FF00',
-            'negative': '#FF0000',
-            'mixed': '#FFFF00',
-            'neutral': '#FFFFFF'
-        }
-        name_label.setStyleSheet(f"color: {type_colors.get(event_type, '#FFFFFF')};")
+        name_label.setStyleSheet(_EVENT_TYPE_STYLES.get(event_type, _EVENT_TYPE_STYLES['neutral']))
         layout.addWidget(name_label)
         
         # Description
@@ -483,28 +811,4 @@ class EventDetailsDialog(QDialog):
         """
         Configure le style
         """
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                color: #ffffff;
-                padding: 8px;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """)
\ No newline at end of file
+        self.setStyleSheet(_EVENT_STYLE)
\ No newline at end of file
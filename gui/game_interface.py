@@ -2,16 +2,311 @@
 Interface principale du jeu TerraGenesis PC
 """
 
+import logging
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                             QLabel, QPushButton, QProgressBar, QTabWidget,
-                            QScrollArea, QFrame, QGroupBox, QListWidget,
-                            QListWidgetItem, QTextEdit, QSlider, QSpinBox)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QFont, QPalette, QColor
+                            QScrollArea, QFrame, QGroupBox, QListView,
+                            QPlainTextEdit, QSlider, QSpinBox, QStyledItemDelegate)
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QPalette
 
 from utils.helpers import (format_number, format_temperature, format_pressure, 
                           format_percentage, get_habitability_color)
 
+logger = logging.getLogger(__name__)
+
+# Feuille de style de l'interface de jeu, appliquée une seule fois à GameInterface.
+# Les widgets enfants sont ciblés par leur objectName plutôt que par leur propre feuille
+_GAME_INTERFACE_STYLE = """
+            QWidget {
+                background-color: #1e1e1e;
+                color: #ffffff;
+            }
+            QTabWidget::pane {
+                border: 1px solid #555555;
+                background-color: #2d2d2d;
+            }
+            QTabBar::tab {
+                background-color: #404040;
+                color: #ffffff;
+                padding: 8px 16px;
+                margin-right: 2px;
+            }
+            QTabBar::tab:selected {
+                background-color: #0078d4;
+            }
+            QTabBar::tab:hover {
+                background-color: #555555;
+            }
+            QGroupBox {
+                color: #ffffff;
+                border: 1px solid #555555;
+                border-radius: 4px;
+                margin-top: 8px;
+                padding-top: 8px;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 8px;
+                padding: 0 4px 0 4px;
+            }
+            QListView {
+                background-color: #2d2d2d;
+                border: 1px solid #555555;
+                color: #ffffff;
+            }
+            QPlainTextEdit {
+                background-color: #2d2d2d;
+                border: 1px solid #555555;
+                color: #ffffff;
+            }
+            QPushButton {
+                background-color: #0078d4;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 4px;
+            }
+            QPushButton:hover {
+                background-color: #106ebe;
+            }
+            QSlider::groove:horizontal {
+                border: 1px solid #555555;
+                height: 8px;
+                background: #404040;
+                border-radius: 4px;
+            }
+            QSlider::handle:horizontal {
+                background: #0078d4;
+                border: 1px solid #555555;
+                width: 18px;
+                margin: -2px 0;
+                border-radius: 3px;
+            }
+            QFrame#ResourceWidget, QFrame#ResourceWidget QFrame,
+            QFrame#BuildingWidget, QFrame#BuildingWidget QFrame {
+                background-color: #2d2d2d;
+                border: 1px solid #555555;
+                border-radius: 4px;
+            }
+            QFrame#ResourceWidget QLabel, QFrame#BuildingWidget QLabel {
+                color: #ffffff;
+                border: none;
+            }
+            QFrame#BuildingWidget QPushButton {
+                background-color: #0078d4;
+                color: white;
+                border: none;
+                padding: 4px 8px;
+                border-radius: 2px;
+            }
+            QFrame#BuildingWidget QPushButton:hover {
+                background-color: #106ebe;
+            }
+            QFrame#BuildingWidget QPushButton:disabled {
+                background-color: #555555;
+                color: #999999;
+            }
+            QFrame#BuildingWidget QSpinBox {
+                background-color: #404040;
+                color: white;
+                border: 1px solid #555555;
+                padding: 2px;
+            }
+            QGroupBox#PlanetStatusWidget QProgressBar {
+                border: 1px solid #555555;
+                border-radius: 2px;
+                text-align: center;
+            }
+            QGroupBox#PlanetStatusWidget QProgressBar::chunk {
+                background-color: #0078d4;
+                border-radius: 2px;
+            }
+"""
+
+# Couleur du remplissage de la barre d'habitabilité, choisie par la propriété habColor
+_GAME_INTERFACE_STYLE += "".join(f"""
+            QGroupBox#PlanetStatusWidget QProgressBar[habColor="{color}"]::chunk {{
+                background-color: {color};
+            }}
+""" for color in ("#00FF00", "#80FF00", "#FFFF00", "#FF8000", "#FF0000"))
+
+# Polices partagées par les widgets de l'interface
+_BOLD_FONT = QFont()
+_BOLD_FONT.setBold(True)
+
+_VALUE_FONT = QFont()
+_VALUE_FONT.setPointSize(14)
+
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(18)
+_TITLE_FONT.setBold(True)
+
+# Libellés de vitesse, indexés par la valeur du slider (0.5x par cran)
+_SPEED_LABELS = tuple(f"{value * 0.5}x" for value in range(11))
+
+# Couleurs des événements actifs selon leur type
+_EVENT_COLORS = {
+    'positive': QColor('#00FF00'),
+    'negative': QColor('#FF0000'),
+    'mixed': QColor('#FFFF00')
+}
+
+@lru_cache(maxsize=None)
+def _cost_text(cost_items: tuple) -> str:
+    """
+    Formate le coût d'un bâtiment, une seule fois par coût
+    
+    Args:
+        cost_items: Couples (ressource, montant) du coût, dans l'ordre d'affichage
+    
+    Returns:
+        Coût formaté (ex: "credits: 100, energy: 10")
+    """
+    return ", ".join(f"{resource}: {amount}" for resource, amount in cost_items)
+
+class KeyedListModel(QAbstractListModel):
+    """
+    Modèle de liste à lignes (clé, texte), mis à jour par différence
+    La clé est exposée dans Qt.UserRole
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialise le modèle
+        
+        Args:
+            parent: Objet parent
+        """
+        super().__init__(parent)
+        self.rows = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """
+        Retourne le nombre de lignes
+        """
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Retourne la donnée d'une ligne pour un rôle
+        
+        Args:
+            index: Index de la ligne
+            role: Rôle demandé par la vue
+        
+        Returns:
+            Texte ou clé de la ligne selon le rôle
+        """
+        if not index.isValid():
+            return None
+        
+        key, text = self.rows[index.row()]
+        
+        if role == Qt.DisplayRole:
+            return text
+        
+        if role == Qt.UserRole:
+            return key
+        
+        return None
+    
+    def set_rows(self, rows: list):
+        """
+        Remplace les lignes en ne notifiant la vue que des différences
+        
+        Args:
+            rows: Couples (clé, texte) à afficher, dans l'ordre
+        """
+        if rows == self.rows:
+            return
+        
+        # Retirer les lignes disparues, en partant de la fin
+        keys = {key for key, _ in rows}
+        for row in range(len(self.rows) - 1, -1, -1):
+            if self.rows[row][0] not in keys:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.rows[row]
+                self.endRemoveRows()
+        
+        # Ajouter les nouvelles lignes et replacer ou renommer les autres
+        for row, (key, text) in enumerate(rows):
+            if row < len(self.rows) and self.rows[row][0] == key:
+                if self.rows[row][1] != text:
+                    self.rows[row] = (key, text)
+                    changed = self.index(row)
+                    self.dataChanged.emit(changed, changed, [Qt.DisplayRole])
+                continue
+            
+            index = next((i for i in range(row + 1, len(self.rows)) if self.rows[i][0] == key), None)
+            if index is None:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.rows.insert(row, (key, text))
+                self.endInsertRows()
+            else:
+                self.beginMoveRows(QModelIndex(), index, index, QModelIndex(), row)
+                del self.rows[index]
+                self.rows.insert(row, (key, text))
+                self.endMoveRows()
+                changed = self.index(row)
+                self.dataChanged.emit(changed, changed, [Qt.DisplayRole])
+
+class EventListModel(KeyedListModel):
+    """
+    Modèle de la liste des événements actifs
+    Le type de chaque événement est exposé dans EVENT_TYPE_ROLE
+    """
+    
+    EVENT_TYPE_ROLE = Qt.UserRole + 1
+    
+    def __init__(self, parent=None):
+        """
+        Initialise le modèle
+        
+        Args:
+            parent: Objet parent
+        """
+        super().__init__(parent)
+        self.event_types = {}
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Retourne la donnée d'une ligne, avec le type de l'événement
+        
+        Args:
+            index: Index de la ligne
+            role: Rôle demandé par la vue
+        
+        Returns:
+            Texte, clé ou type de l'événement selon le rôle
+        """
+        if role == self.EVENT_TYPE_ROLE and index.isValid():
+            return self.event_types.get(self.rows[index.row()][0])
+        
+        return super().data(index, role)
+
+class EventDelegate(QStyledItemDelegate):
+    """
+    Délégué de la liste des événements, colore chaque ligne selon le type de l'événement
+    """
+    
+    def initStyleOption(self, option, index):
+        """
+        Prépare les options de dessin d'une ligne
+        
+        Args:
+            option: Options de style à compléter
+            index: Index de la ligne dessinée
+        """
+        super().initStyleOption(option, index)
+        
+        # Couleur selon le type
+        color = _EVENT_COLORS.get(index.data(EventListModel.EVENT_TYPE_ROLE))
+        if color is not None:
+            option.palette.setColor(QPalette.Text, color)
+
 class ResourceWidget(QFrame):
     """
     Widget d'affichage des ressources
@@ -30,6 +325,10 @@ class ResourceWidget(QFrame):
         self.resource_name = resource_name
         self.resource_type = resource_type
         
+        # Dernières valeurs affichées, pour ne pas réécrire des libellés inchangés
+        self._last_values = None
+        self._last_sign = None
+        
         self.setup_ui()
         self.setup_style()
     
@@ -43,17 +342,13 @@ class ResourceWidget(QFrame):
         
         # Nom de la ressource
         self.name_label = QLabel(self.resource_name)
-        name_font = QFont()
-        name_font.setBold(True)
-        self.name_label.setFont(name_font)
+        self.name_label.setFont(_BOLD_FONT)
         self.name_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.name_label)
         
         # Valeur actuelle
         self.value_label = QLabel("0")
-        value_font = QFont()
-        value_font.setPointSize(14)
-        self.value_label.setFont(value_font)
+        self.value_label.setFont(_VALUE_FONT)
         self.value_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.value_label)
         
@@ -66,19 +361,10 @@ class ResourceWidget(QFrame):
         """
         Configure le style du widget
         """
+        # Règles portées par la feuille de style de GameInterface
+        self.setObjectName("ResourceWidget")
         self.setFrameStyle(QFrame.Box)
         self.setLineWidth(1)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                border-radius: 4px;
-            }
-            QLabel {
-                color: #ffffff;
-                border: none;
-            }
-        """)
     
     def update_values(self, current: float, production: float, max_value: float = None):
         """
@@ -89,17 +375,26 @@ class ResourceWidget(QFrame):
             production: Production par seconde
             max_value: Valeur maximale (optionnel)
         """
+        values = (current, production, max_value)
+        if values == self._last_values:
+            return
+        self._last_values = values
+        
         if max_value:
             self.value_label.setText(f"{format_number(current)}/{format_number(max_value)}")
         else:
             self.value_label.setText(format_number(current))
         
-        if production >= 0:
+        positive = production >= 0
+        if positive:
             self.production_label.setText(f"+{format_number(production)}/s")
-            self.production_label.setStyleSheet("color: #00FF00;")
         else:
             self.production_label.setText(f"{format_number(production)}/s")
-            self.production_label.setStyleSheet("color: #FF0000;")
+        
+        # La feuille de style n'est réanalysée que lorsque le signe change
+        if positive != self._last_sign:
+            self._last_sign = positive
+            self.production_label.setStyleSheet("color: #00FF00;" if positive else "color: #FF0000;")
 
 class PlanetStatusWidget(QGroupBox):
     """
@@ -148,32 +443,10 @@ class PlanetStatusWidget(QGroupBox):
         """
         Configure le style
         """
-        self.setStyleSheet("""
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 2px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 2px;
-            }
-        """)
+        # Règles portées par la feuille de style de GameInterface
+        self.setObjectName("PlanetStatusWidget")
+        self._habitability_color = None
+        self._last_status = None
     
     def update_status(self, planet):
         """
@@ -184,18 +457,25 @@ class PlanetStatusWidget(QGroupBox):
         """
         habitability = planet.calculate_habitability()
         
+        # Rien à réécrire si les paramètres affichés n'ont pas bougé
+        status = (habitability, planet.temperature, planet.pressure, planet.oxygen)
+        if status == self._last_status:
+            return
+        self._last_status = status
+        
         # Habitabilité
         self.habitability_label.setText(f"{habitability:.1f}%")
         self.habitability_progress.setValue(int(habitability))
         
-        # Couleur de la barre selon l'habitabilité
+        # Couleur de la barre selon l'habitabilité: la règle est choisie par une
+        # propriété, le style n'est réappliqué que lorsque la couleur change
         color = get_habitability_color(habitability)
-        self.habitability_progress.setStyleSheet(f"""
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 2px;
-            }}
-        """)
+        if color != self._habitability_color:
+            self._habitability_color = color
+            progress = self.habitability_progress
+            progress.setProperty("habColor", color)
+            progress.style().unpolish(progress)
+            progress.style().polish(progress)
         
         # Autres paramètres
         self.temperature_label.setText(format_temperature(planet.temperature))
@@ -223,6 +503,7 @@ class BuildingWidget(QFrame):
         self.building_type = building_type
         self.building_name = building_name
         self.building_cost = building_cost
+        self._last_count = 0
         
         self.setup_ui()
         self.setup_style()
@@ -237,16 +518,12 @@ class BuildingWidget(QFrame):
         
         # Nom du bâtiment
         name_label = QLabel(self.building_name)
-        name_font = QFont()
-        name_font.setBold(True)
-        name_label.setFont(name_font)
+        name_label.setFont(_BOLD_FONT)
         name_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(name_label)
         
         # Coût
-        cost_text = ", ".join([f"{resource}: {amount}" 
-                              for resource, amount in self.building_cost.items()])
-        cost_label = QLabel(f"Coût: {cost_text}")
+        cost_label = QLabel(f"Coût: {_cost_text(tuple(self.building_cost.items()))}")
         cost_label.setWordWrap(True)
         layout.addWidget(cost_label)
         
@@ -256,6 +533,9 @@ class BuildingWidget(QFrame):
         self.count_spinbox = QSpinBox()
         self.count_spinbox.setRange(1, 100)
         self.count_spinbox.setValue(1)
+        # valueChanged seulement à la validation de la saisie, flèches accélérées si maintenues
+        self.count_spinbox.setKeyboardTracking(False)
+        self.count_spinbox.setAccelerated(True)
         controls_layout.addWidget(self.count_spinbox)
         
         build_button = QPushButton("Construire")
@@ -272,39 +552,10 @@ class BuildingWidget(QFrame):
         """
         Configure le style
         """
+        # Règles portées par la feuille de style de GameInterface
+        self.setObjectName("BuildingWidget")
         self.setFrameStyle(QFrame.Box)
         self.setLineWidth(1)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                border-radius: 4px;
-            }
-            QLabel {
-                color: #ffffff;
-                border: none;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 2px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #999999;
-            }
-            QSpinBox {
-                background-color: #404040;
-                color: white;
-                border: 1px solid #555555;
-                padding: 2px;
-            }
-        """)
     
     def request_building(self):
         """
@@ -320,7 +571,9 @@ class BuildingWidget(QFrame):
         Args:
             count: Nombre actuel
         """
-        self.current_label.setText(f"Actuel: {count}")
+        if count != self._last_count:
+            self._last_count = count
+            self.current_label.setText(f"Actuel: {count}")
 
 class GameInterface(QWidget):
     """
@@ -340,14 +593,23 @@ class GameInterface(QWidget):
         self.resource_widgets = {}
         self.building_widgets = {}
         
+        # Vrai si un rafraîchissement a été sauté pendant que l'interface était cachée
+        self._stale = False
+        
+        # Modèles des listes, mis à jour par différence
+        self._tech_model = KeyedListModel(self)
+        self._events_model = EventListModel(self)
+        
+        # Listes des onglets construits à la première ouverture
+        self.tech_list = None
+        self.events_list = None
+        
         self.setup_ui()
         self.setup_style()
         self.setup_connections()
         
-        # Timer pour les mises à jour d'affichage
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_displays)
-        self.update_timer.start(1000)  # Mise à jour chaque seconde
+        # Affichage initial; la suite est poussée par les signaux du moteur
+        self.update_displays()
     
     def setup_ui(self):
         """
@@ -376,17 +638,18 @@ class GameInterface(QWidget):
         planet_tab = self.create_planet_tab()
         self.tab_widget.addTab(planet_tab, "Planète")
         
-        # Onglet Construction
-        building_tab = self.create_building_tab()
-        self.tab_widget.addTab(building_tab, "Construction")
-        
-        # Onglet Recherche
-        research_tab = self.create_research_tab()
-        self.tab_widget.addTab(research_tab, "Recherche")
-        
-        # Onglet Événements
-        events_tab = self.create_events_tab()
-        self.tab_widget.addTab(events_tab, "Événements")
+        # Les autres onglets ne sont construits qu'à leur première ouverture
+        self._tab_builders = {}
+        for title, builder, refresh in (
+                ("Construction", self.create_building_tab, self.update_building_counts),
+                ("Recherche", self.create_research_tab, self.update_technology_display),
+                ("Événements", self.create_events_tab, self.update_events_display)):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            index = self.tab_widget.addTab(placeholder, title)
+            self._tab_builders[index] = (builder, refresh)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         
         layout.addWidget(self.tab_widget)
         
@@ -403,6 +666,7 @@ class GameInterface(QWidget):
         self.speed_slider.setRange(1, 10)  # 0.5x à 5x
         self.speed_slider.setValue(2)  # 1x par défaut
         self.speed_slider.valueChanged.connect(self.change_speed)
+        self.speed_slider.sliderReleased.connect(self.apply_speed)
         controls_layout.addWidget(self.speed_slider)
         
         self.speed_label = QLabel("1x")
@@ -425,10 +689,7 @@ class GameInterface(QWidget):
         # Nom de la planète
         if self.game_engine.current_planet:
             planet_name = QLabel(self.game_engine.current_planet.name)
-            planet_font = QFont()
-            planet_font.setPointSize(18)
-            planet_font.setBold(True)
-            planet_name.setFont(planet_font)
+            planet_name.setFont(_TITLE_FONT)
             planet_name.setAlignment(Qt.AlignCenter)
             layout.addWidget(planet_name)
         
@@ -440,13 +701,14 @@ class GameInterface(QWidget):
         info_group = QGroupBox("Informations")
         info_layout = QVBoxLayout(info_group)
         
-        self.planet_description = QTextEdit()
+        self.planet_description = QPlainTextEdit()
         self.planet_description.setReadOnly(True)
+        self.planet_description.setUndoRedoEnabled(False)
         self.planet_description.setMaximumHeight(100)
         if self.game_engine.current_planet:
             planet_data = self.game_engine.available_planets.get(
                 self.game_engine.current_planet.name, {})
-            self.planet_description.setText(planet_data.get('description', ''))
+            self.planet_description.setPlainText(planet_data.get('description', ''))
         info_layout.addWidget(self.planet_description)
         
         layout.addWidget(info_group)
@@ -560,8 +822,11 @@ class GameInterface(QWidget):
         available_group = QGroupBox("Technologies disponibles")
         available_layout = QVBoxLayout(available_group)
         
-        self.tech_list = QListWidget()
-        self.tech_list.itemDoubleClicked.connect(self.start_research)
+        self.tech_list = QListView()
+        self.tech_list.setUniformItemSizes(True)
+        self.tech_list.setEditTriggers(QListView.NoEditTriggers)
+        self.tech_list.setModel(self._tech_model)
+        self.tech_list.doubleClicked.connect(self.start_research)
         available_layout.addWidget(self.tech_list)
         
         layout.addWidget(available_group)
@@ -582,7 +847,11 @@ class GameInterface(QWidget):
         active_group = QGroupBox("Événements actifs")
         active_layout = QVBoxLayout(active_group)
         
-        self.events_list = QListWidget()
+        self.events_list = QListView()
+        self.events_list.setUniformItemSizes(True)
+        self.events_list.setEditTriggers(QListView.NoEditTriggers)
+        self.events_list.setModel(self._events_model)
+        self.events_list.setItemDelegate(EventDelegate(self.events_list))
         active_layout.addWidget(self.events_list)
         
         layout.addWidget(active_group)
@@ -591,8 +860,9 @@ class GameInterface(QWidget):
         history_group = QGroupBox("Historique")
         history_layout = QVBoxLayout(history_group)
         
-        self.events_history = QTextEdit()
+        self.events_history = QPlainTextEdit()
         self.events_history.setReadOnly(True)
+        self.events_history.setUndoRedoEnabled(False)
         self.events_history.setMaximumHeight(150)
         history_layout.addWidget(self.events_history)
         
@@ -600,83 +870,85 @@ class GameInterface(QWidget):
         
         return widget
     
+    def _materialize_tab(self, index: int):
+        """
+        Construit le contenu d'un onglet lors de sa première ouverture
+        
+        Args:
+            index: Index de l'onglet affiché
+        """
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+        
+        builder, refresh = entry
+        self.tab_widget.widget(index).layout().addWidget(builder())
+        refresh()
+        
+        if not self._tab_builders:
+            self.tab_widget.currentChanged.disconnect(self._materialize_tab)
+    
+    def showEvent(self, event):
+        """
+        Rattrape les rafraîchissements sautés pendant que l'interface était cachée
+        
+        Args:
+            event: Événement d'affichage
+        """
+        super().showEvent(event)
+        if self._stale:
+            self._stale = False
+            self.update_displays()
+    
+    def _skip_hidden(self) -> bool:
+        """
+        Indique si un rafraîchissement peut être sauté, l'interface étant cachée
+        
+        Returns:
+            True si l'interface n'est pas visible (le rafraîchissement sera fait à l'affichage)
+        """
+        if self.isVisible():
+            return False
+        self._stale = True
+        return True
+    
     def setup_style(self):
         """
         Configure le style de l'interface
         """
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #2d2d2d;
-            }
-            QTabBar::tab {
-                background-color: #404040;
-                color: #ffffff;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-            }
-            QTabBar::tab:hover {
-                background-color: #555555;
-            }
-            QGroupBox {
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-            }
-            QListWidget {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                color: #ffffff;
-            }
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #555555;
-                height: 8px;
-                background: #404040;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #0078d4;
-                border: 1px solid #555555;
-                width: 18px;
-                margin: -2px 0;
-                border-radius: 3px;
-            }
-        """)
+        self.setStyleSheet(_GAME_INTERFACE_STYLE)
     
     def setup_connections(self):
         """
         Configure les connexions de signaux
+        (planète, ressources et technologies sont rafraîchies par la fenêtre principale)
+        """
+        self.game_engine.tick_completed.connect(self.on_tick_completed)
+        self.game_engine.building_count_changed.connect(self.on_building_count_changed)
+    
+    def on_building_count_changed(self, building_type: str, count: int):
         """
-        pass
+        Met à jour le compteur d'un seul type de bâtiment
+        
+        Args:
+            building_type: Type de bâtiment construit ou détruit
+            count: Nouveau nombre de bâtiments de ce type
+        """
+        widget = self.building_widgets.get(building_type)
+        if widget is not None:
+            widget.update_current_count(count)
+    
+    def on_tick_completed(self, changed: int):
+        """
+        Appelé après chaque tick qui a modifié l'état du jeu
+        
+        Args:
+            changed: Masque des composants modifiés (GameEngine.CHANGED_*)
+        """
+        # Les événements modifient la planète; leur temps restant défile tant qu'ils sont actifs
+        planet = self.game_engine.current_planet
+        if changed & self.game_engine.CHANGED_PLANET or (planet and planet.active_events):
+            self.update_events_display()
     
     def toggle_pause(self):
         """
@@ -695,9 +967,17 @@ class GameInterface(QWidget):
         Args:
             value: Valeur du slider (1-10)
         """
-        speed = value * 0.5  # 0.5x à 5x
-        self.game_engine.set_simulation_speed(speed)
-        self.speed_label.setText(f"{speed}x")
+        self.speed_label.setText(_SPEED_LABELS[value])
+        
+        # Pendant un glissement, la vitesse n'est appliquée qu'au relâchement
+        if not self.speed_slider.isSliderDown():
+            self.game_engine.set_simulation_speed(value * 0.5)  # 0.5x à 5x
+    
+    def apply_speed(self):
+        """
+        Applique la vitesse choisie une fois le slider relâché
+        """
+        self.game_engine.set_simulation_speed(self.speed_slider.value() * 0.5)
     
     def build_structure(self, building_type: str, count: int):
         """
@@ -708,20 +988,23 @@ class GameInterface(QWidget):
             count: Nombre à construire
         """
         if self.game_engine.build_structure(building_type, count):
-            print(f"Construit {count} {building_type}")
+            logger.debug("Construit %d %s", count, building_type)
+            # Rafraîchir tout de suite, même simulation en pause
+            self.update_planet_display()
+            self.update_resources_display()
         else:
-            print(f"Impossible de construire {count} {building_type}")
+            logger.debug("Impossible de construire %d %s", count, building_type)
     
-    def start_research(self, item):
+    def start_research(self, index):
         """
         Démarre une recherche
         
         Args:
-            item: Item de la liste sélectionné
+            index: Index de la technologie double-cliquée
         """
-        tech_id = item.data(Qt.UserRole)
-        if tech_id:
-            self.game_engine.start_research(tech_id)
+        tech_id = index.data(Qt.UserRole)
+        if tech_id and self.game_engine.start_research(tech_id):
+            self.update_technology_display()
     
     def update_displays(self):
         """
@@ -736,32 +1019,44 @@ class GameInterface(QWidget):
         """
         Met à jour l'affichage de la planète
         """
+        if self._skip_hidden():
+            return
+        
         if self.game_engine.current_planet:
             self.planet_status.update_status(self.game_engine.current_planet)
-            
-            # Mettre à jour les compteurs de bâtiments
+    
+    def update_building_counts(self):
+        """
+        Met à jour tous les compteurs de bâtiments, à la construction de l'onglet
+        (ensuite, seuls les compteurs modifiés sont mis à jour par on_building_count_changed)
+        """
+        planet = self.game_engine.current_planet
+        if planet:
             for building_type, widget in self.building_widgets.items():
-                count = self.game_engine.current_planet.buildings.get(building_type, 0)
-                widget.update_current_count(count)
+                widget.update_current_count(planet.buildings.get(building_type, 0))
     
     def update_resources_display(self):
         """
         Met à jour l'affichage des ressources
         """
+        if self._skip_hidden():
+            return
+        
         rm = self.game_engine.resource_manager
-        net_production = rm.get_net_production()
+        credits_rate, energy_rate, science_rate = rm.get_net_production()
+        widgets = self.resource_widgets
         
-        self.resource_widgets['credits'].update_values(
-            rm.credits, net_production['credits'])
-        self.resource_widgets['energy'].update_values(
-            rm.energy, net_production['energy'], rm.max_energy)
-        self.resource_widgets['science'].update_values(
-            rm.science, net_production['science'], rm.max_science)
+        widgets['credits'].update_values(rm.credits, credits_rate)
+        widgets['energy'].update_values(rm.energy, energy_rate, rm.max_energy)
+        widgets['science'].update_values(rm.science, science_rate, rm.max_science)
     
     def update_technology_display(self):
         """
         Met à jour l'affichage des technologies
         """
+        if self.tech_list is None or self._skip_hidden():
+            return
+        
         tech_tree = self.game_engine.technology_tree
         
         # Recherche actuelle
@@ -774,36 +1069,28 @@ class GameInterface(QWidget):
             self.research_progress.setValue(0)
         
         # Technologies disponibles
-        self.tech_list.clear()
-        for tech in tech_tree.get_available_technologies():
-            item = QListWidgetItem(tech.name)
-            item.setData(Qt.UserRole, tech.id)
-            self.tech_list.addItem(item)
+        rows = [(tech.id, tech.name) for tech in tech_tree.get_available_technologies()]
+        self._tech_model.set_rows(rows)
     
     def update_events_display(self):
         """
         Met à jour l'affichage des événements
         """
+        if self.events_list is None or self._skip_hidden():
+            return
+        
         if self.game_engine.current_planet:
-            self.events_list.clear()
-            
             events_summary = self.game_engine.event_manager.get_active_events_summary(
                 self.game_engine.current_planet)
             
+            rows = []
             for event_info in events_summary:
                 item_text = f"{event_info['name']}"
                 if event_info['duration'] > 0:
                     remaining = event_info['remaining_time']
                     item_text += f" ({remaining:.0f}s restant)"
                 
-                item = QListWidgetItem(item_text)
-                
-                # Couleur selon le type
-                if event_info['type'] == 'positive':
-                    item.setForeground(QColor('#00FF00'))
-                elif event_info['type'] == 'negative':
-                    item.setForeground(QColor('#FF0000'))
-                elif event_info['type'] == 'mixed':
-                    item.setForeground(QColor('#FFFF00'))
-                
-                self.events_list.addItem(item)
\ No newline at end of file
+                rows.append((event_info['id'], item_text))
+                self._events_model.event_types[event_info['id']] = event_info['type']
+            
+            self._events_model.set_rows(rows)
@@ -2,20 +2,23 @@
 Fenêtre principale de TerraGenesis PC
 """
 
+import os
 import sys
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QMenuBar, QMenu, QAction, QStatusBar, QMessageBox,
-                            QFileDialog, QDialog)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+                            QFileDialog, QDialog, QLabel)
+from PyQt5.QtCore import Qt, QTimer, QEvent, pyqtSignal
 from PyQt5.QtGui import QIcon, QKeySequence
 
 from .planet_selection import PlanetSelectionDialog
-from .game_interface import GameInterface
 from core.game_engine import GameEngine
 from utils.save_manager import SaveManager
 from config.settings import GameSettings
 from config.constants import *
 
+# Vitesses proposées dans le menu Simulation: (libellé, multiplicateur)
+_SIMULATION_SPEEDS = (('0.5x', 0.5), ('1x', 1.0), ('2x', 2.0), ('3x', 3.0), ('5x', 5.0))
+
 class MainWindow(QMainWindow):
     """
     Fenêtre principale de l'application
@@ -32,9 +35,14 @@ class MainWindow(QMainWindow):
         self.save_manager = SaveManager()
         self.settings = GameSettings()
         
+        # Dossier proposé par la boîte de sauvegarde, résolu une seule fois: un
+        # chemin absolu évite que la boîte parcoure le répertoire courant
+        self._save_dir = os.path.abspath(self.save_manager.saves_directory)
+        
         # Interface
         self.game_interface = None
-        self.status_timer = QTimer()
+        self._planet_dialog = None  # Construite à la première ouverture
+        self._pending_save = None  # Sauvegarde manuelle en cours d'écriture
         
         # Configuration de la fenêtre
         self.setup_window()
@@ -59,9 +67,6 @@ class MainWindow(QMainWindow):
         # Widget central vide au démarrage
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        
-        # Appliquer le style sombre
-        self.apply_dark_theme()
     
     def center_window(self):
         """
@@ -72,43 +77,6 @@ class MainWindow(QMainWindow):
         window.moveCenter(screen.center())
         self.move(window.topLeft())
     
-    def apply_dark_theme(self):
-        """
-        Applique un thème sombre à l'interface
-        """
-        dark_style = """
-        QMainWindow {
-            background-color: #1e1e1e;
-            color: #ffffff;
-        }
-        QMenuBar {
-            background-color: #2d2d2d;
-            color: #ffffff;
-            border-bottom: 1px solid #555555;
-        }
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 4px 8px;
-        }
-        QMenuBar::item:selected {
-            background-color: #404040;
-        }
-        QMenu {
-            background-color: #2d2d2d;
-            color: #ffffff;
-            border: 1px solid #555555;
-        }
-        QMenu::item:selected {
-            background-color: #404040;
-        }
-        QStatusBar {
-            background-color: #2d2d2d;
-            color: #ffffff;
-            border-top: 1px solid #555555;
-        }
-        """
-        self.setStyleSheet(dark_style)
-    
     def setup_menu(self):
         """
         Configure la barre de menu
@@ -165,11 +133,12 @@ class MainWindow(QMainWindow):
         # Vitesses de simulation
         speed_menu = sim_menu.addMenu('&Vitesse')
         
-        speeds = [('0.5x', 0.5), ('1x', 1.0), ('2x', 2.0), ('3x', 3.0), ('5x', 5.0)]
-        for name, speed in speeds:
+        # La vitesse est portée par l'action, un seul slot pour tout le menu
+        for name, speed in _SIMULATION_SPEEDS:
             action = QAction(name, self)
-            action.triggered.connect(lambda checked, s=speed: self.set_simulation_speed(s))
+            action.setData(speed)
             speed_menu.addAction(action)
+        speed_menu.triggered.connect(self.on_speed_action)
         
         # Menu Affichage
         view_menu = menubar.addMenu('&Affichage')
@@ -195,28 +164,52 @@ class MainWindow(QMainWindow):
         Configure la barre de statut
         """
         self.status_bar = self.statusBar()
-        self.status_bar.showMessage('Prêt')
         
-        # Timer pour mettre à jour la barre de statut
-        self.status_timer.timeout.connect(self.update_status_bar)
-        self.status_timer.start(1000)  # Mise à jour chaque seconde
+        # Texte affiché dans un QLabel: showMessage repeint la barre de façon
+        # synchrone, alors que setText est regroupé avec les autres mises à jour
+        self._status_label = QLabel('Prêt')
+        self._status_label.setIndent(4)
+        self._last_status_text = 'Prêt'
+        self.status_bar.addWidget(self._status_label, 1)
+        
+        # Notification temporaire (sauvegarde), masquée après quelques secondes
+        self._notice_label = QLabel()
+        self._notice_label.hide()
+        self.status_bar.addPermanentWidget(self._notice_label)
+        self._notice_timer = QTimer(self)
+        self._notice_timer.setSingleShot(True)
+        self._notice_timer.timeout.connect(self._notice_label.hide)
+        
+        # Mise à jour différée après un tick qui modifie la planète: les ticks
+        # d'une même seconde ne produisent qu'un seul affichage
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(1000)
+        self._status_flush_timer.timeout.connect(self.update_status_bar)
     
     def setup_connections(self):
         """
         Configure les connexions de signaux
         """
-        # Connexions du moteur de jeu
-        self.game_engine.planet_updated.connect(self.on_planet_updated)
-        self.game_engine.resources_updated.connect(self.on_resources_updated)
-        self.game_engine.technology_updated.connect(self.on_technology_updated)
+        # Connexions du moteur de jeu: un seul signal par tick pour tous les affichages
+        self.game_engine.tick_completed.connect(self.on_tick_completed)
         self.game_engine.event_triggered.connect(self.on_event_triggered)
         self.game_engine.game_saved.connect(self.on_game_saved)
+        self.game_engine.save_failed.connect(self.on_save_failed)
+        self.game_engine.game_loaded.connect(self.on_game_loaded)
     
     def show_planet_selection(self):
         """
         Affiche la boîte de dialogue de sélection de planète
         """
-        dialog = PlanetSelectionDialog(self.game_engine.available_planets, self)
+        # La boîte de dialogue et ses cartes sont construites une seule fois
+        dialog = self._planet_dialog
+        if dialog is None:
+            dialog = PlanetSelectionDialog(self.game_engine.available_planets, self)
+            self._planet_dialog = dialog
+        else:
+            dialog.reset()
+        
         if dialog.exec_() == QDialog.Accepted:
             selected_planet = dialog.get_selected_planet()
             if selected_planet:
@@ -230,7 +223,8 @@ class MainWindow(QMainWindow):
             planet_name: Nom de la planète sélectionnée
         """
         if self.game_engine.start_new_game(planet_name):
-            # Créer l'interface de jeu
+            # Créer l'interface de jeu (importée seulement quand une partie commence)
+            from .game_interface import GameInterface
             self.game_interface = GameInterface(self.game_engine)
             self.setCentralWidget(self.game_interface)
             
@@ -238,7 +232,7 @@ class MainWindow(QMainWindow):
             self.setWindowTitle(f"{GAME_TITLE} - {planet_name}")
             
             # Mettre à jour la barre de statut
-            self.status_bar.showMessage(f"Nouvelle partie démarrée sur {planet_name}")
+            self._set_status(f"Nouvelle partie démarrée sur {planet_name}")
             
             print(f"Nouvelle partie démarrée sur {planet_name}")
         else:
@@ -258,7 +252,7 @@ class MainWindow(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(
             self, 
             "Sauvegarder la partie",
-            f"save_{self.game_engine.current_planet.name.lower()}.json",
+            os.path.join(self._save_dir, f"save_{self.game_engine.current_planet.name.lower()}.json"),
             "Fichiers de sauvegarde (*.json)"
         )
         
@@ -268,12 +262,11 @@ class MainWindow(QMainWindow):
                 filename += '.json'
             
             # Extraire juste le nom du fichier
-            import os
             filename = os.path.basename(filename)
             
-            if self.game_engine.save_game(filename):
-                QMessageBox.information(self, "Succès", 
-                                      f"Partie sauvegardée: {filename}")
+            # Écriture en arrière-plan, le résultat arrive par game_saved ou save_failed
+            if self.game_engine.save_game(filename, background=True):
+                self._pending_save = filename
             else:
                 QMessageBox.critical(self, "Erreur", 
                                    "Erreur lors de la sauvegarde")
@@ -282,30 +275,17 @@ class MainWindow(QMainWindow):
         """
         Charge une partie sauvegardée
         """
-        saves = self.save_manager.get_save_files()
-        
-        if not saves:
-            QMessageBox.information(self, "Information", 
-                                  "Aucune sauvegarde trouvée")
-            return
-        
-        # Créer une liste des sauvegardes pour la sélection
+        # La liste des sauvegardes est lue en arrière-plan, la boîte de dialogue
+        # s'ouvre sans attendre et se remplit à la fin de la recherche
         from .dialogs import LoadGameDialog
-        dialog = LoadGameDialog(saves, self)
+        dialog = LoadGameDialog(self.save_manager.get_save_files, self)
         
         if dialog.exec_() == QDialog.Accepted:
             selected_save = dialog.get_selected_save()
-            if selected_save and self.game_engine.load_game(selected_save['filename']):
-                # Créer l'interface de jeu
-                self.game_interface = GameInterface(self.game_engine)
-                self.setCentralWidget(self.game_interface)
-                
-                # Mettre à jour le titre
-                planet_name = self.game_engine.current_planet.name
-                self.setWindowTitle(f"{GAME_TITLE} - {planet_name}")
-                
-                QMessageBox.information(self, "Succès", 
-                                      f"Partie chargée: {selected_save['filename']}")
+            if selected_save:
+                # Lecture en arrière-plan, la suite se fait dans on_game_loaded
+                self.game_engine.load_game(selected_save['filename'], background=True)
+                self._set_status(f"Chargement de {selected_save['filename']}...")
             else:
                 QMessageBox.critical(self, "Erreur", 
                                    "Erreur lors du chargement")
@@ -320,10 +300,10 @@ class MainWindow(QMainWindow):
             # Mettre à jour le texte de l'action
             if self.game_engine.is_paused:
                 self.pause_action.setText('&Reprendre')
-                self.status_bar.showMessage('Simulation en pause')
+                self._set_status('Simulation en pause')
             else:
                 self.pause_action.setText('&Pause')
-                self.status_bar.showMessage('Simulation en cours')
+                self._set_status('Simulation en cours')
     
     def set_simulation_speed(self, speed: float):
         """
@@ -333,7 +313,16 @@ class MainWindow(QMainWindow):
             speed: Multiplicateur de vitesse
         """
         self.game_engine.set_simulation_speed(speed)
-        self.status_bar.showMessage(f'Vitesse de simulation: {speed}x')
+        self._set_status(f'Vitesse de simulation: {speed}x')
+    
+    def on_speed_action(self, action: QAction):
+        """
+        Appelé quand une vitesse est choisie dans le menu Simulation
+        
+        Args:
+            action: Action du menu déclenchée
+        """
+        self.set_simulation_speed(action.data())
     
     def toggle_fullscreen(self):
         """
@@ -370,37 +359,63 @@ class MainWindow(QMainWindow):
         """
         Met à jour la barre de statut
         """
-        if self.game_engine.current_planet and not self.game_engine.is_paused:
-            status = self.game_engine.get_game_status()
-            planet_status = status.get('planet', {})
-            habitability = planet_status.get('habitability', '0%')
-            
-            message = f"Habitabilité: {habitability}"
-            if self.game_engine.simulation_speed != 1.0:
-                message += f" | Vitesse: {self.game_engine.simulation_speed}x"
+        # Rien à afficher tant que la fenêtre n'est pas visible
+        if not self.isVisible() or self.isMinimized():
+            return
+        
+        engine = self.game_engine
+        planet = engine.current_planet
+        if planet and not engine.is_paused:
+            # Valeur en cache de la planète, sans construire le résumé complet
+            message = f"Habitabilité: {planet.calculate_habitability():.1f}%"
+            if engine.simulation_speed != 1.0:
+                message += f" | Vitesse: {engine.simulation_speed}x"
             
-            self.status_bar.showMessage(message)
+            self._set_status(message)
     
-    def on_planet_updated(self):
+    def _set_status(self, message: str):
         """
-        Appelé quand la planète est mise à jour
+        Affiche un message dans la barre de statut s'il a changé
+        
+        Args:
+            message: Texte à afficher
         """
-        if self.game_interface:
-            self.game_interface.update_planet_display()
+        if message == self._last_status_text:
+            return
+        
+        self._last_status_text = message
+        self._status_label.setText(message)
     
-    def on_resources_updated(self):
+    def changeEvent(self, event):
         """
-        Appelé quand les ressources sont mises à jour
+        Rattrape la barre de statut, ignorée tant que la fenêtre était réduite
+        
+        Args:
+            event: Événement de changement d'état
         """
-        if self.game_interface:
-            self.game_interface.update_resources_display()
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self.update_status_bar()
+        
+        super().changeEvent(event)
     
-    def on_technology_updated(self):
-        """
-        Appelé quand les technologies sont mises à jour
+    def on_tick_completed(self, changed: int):
         """
-        if self.game_interface:
-            self.game_interface.update_technology_display()
+        Appelé à la fin d'un tick de simulation ayant modifié l'état du jeu
+        
+        Args:
+            changed: Masque des composants modifiés (GameEngine.CHANGED_*)
+        """
+        game_interface = self.game_interface
+        if game_interface:
+            if changed & GameEngine.CHANGED_PLANET:
+                game_interface.update_planet_display()
+            if changed & GameEngine.CHANGED_RESOURCES:
+                game_interface.update_resources_display()
+            if changed & GameEngine.CHANGED_TECHNOLOGY:
+                game_interface.update_technology_display()
+        
+        if changed & GameEngine.CHANGED_PLANET and not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
     
     def on_event_triggered(self, name: str, description: str):
         """
@@ -413,11 +428,60 @@ class MainWindow(QMainWindow):
         # Afficher une notification
         QMessageBox.information(self, f"Événement: {name}", description)
     
-    def on_game_saved(self):
+    def on_game_saved(self, filename: str):
         """
         Appelé quand le jeu est sauvegardé
+        
+        Args:
+            filename: Nom du fichier de sauvegarde
+        """
+        self._notice_label.setText("Jeu sauvegardé")
+        self._notice_label.show()
+        self._notice_timer.start(3000)
+        
+        if filename == self._pending_save:
+            self._pending_save = None
+            QMessageBox.information(self, "Succès", 
+                                  f"Partie sauvegardée: {filename}")
+    
+    def on_save_failed(self, filename: str):
+        """
+        Appelé quand l'écriture d'une sauvegarde en arrière-plan a échoué
+        
+        Args:
+            filename: Nom du fichier de sauvegarde
         """
-        self.status_bar.showMessage("Jeu sauvegardé", 3000)
+        if filename == self._pending_save:
+            self._pending_save = None
+            QMessageBox.critical(self, "Erreur", 
+                               "Erreur lors de la sauvegarde")
+    
+    def on_game_loaded(self, success: bool, filename: str):
+        """
+        Appelé à la fin d'un chargement en arrière-plan
+        
+        Args:
+            success: True si la partie a été chargée
+            filename: Nom du fichier de sauvegarde
+        """
+        if not success:
+            self._set_status('Prêt')
+            QMessageBox.critical(self, "Erreur", 
+                               "Erreur lors du chargement")
+            return
+        
+        # Créer l'interface de jeu
+        from .game_interface import GameInterface
+        self.game_interface = GameInterface(self.game_engine)
+        self.setCentralWidget(self.game_interface)
+        
+        # Mettre à jour le titre
+        planet_name = self.game_engine.current_planet.name
+        self.setWindowTitle(f"{GAME_TITLE} - {planet_name}")
+        self._set_status(f"Partie chargée: {filename}")
+        
+        QMessageBox.information(self, "Succès", 
+                              f"Partie chargée: {filename}")
     
     def closeEvent(self, event):
         """
@@ -451,7 +515,10 @@ class MainWindow(QMainWindow):
         
         self.settings.save_settings()
         
-        # Arrêter le moteur de jeu
+        # Arrêter le moteur de jeu et attendre la fin des écritures en cours;
+        # la fenêtre se ferme, aucun message de résultat n'est plus affiché
         self.game_engine.stop_simulation()
+        self.game_engine.save_pool.waitForDone()
+        self._pending_save = None
         
         event.accept()
\ No newline at end of file
@@ -5,11 +5,68 @@ Boîte de dialogue de sélection de planète
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
                             QLabel, QPushButton, QScrollArea, QWidget, QFrame,
                             QTextEdit)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QPixmap, QPalette
+from PyQt5.QtCore import Qt, QRectF, pyqtSignal
+from PyQt5.QtGui import (QFont, QPixmap, QPalette, QPixmapCache, QPainter, QPen,
+                         QColor, QGuiApplication)
 
 from utils.helpers import format_temperature, format_pressure, format_percentage
 
+PLANET_IMAGE_SIZE = 120
+DESCRIPTION_MAX_LENGTH = 100  # Longueur maximale de la description d'une carte
+
+# Polices partagées par les cartes et la boîte de dialogue
+_NAME_FONT = QFont()
+_NAME_FONT.setPointSize(14)
+_NAME_FONT.setBold(True)
+
+_IMAGE_FONT = QFont()
+_IMAGE_FONT.setPointSize(36)
+_IMAGE_FONT.setBold(True)
+
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(18)
+_TITLE_FONT.setBold(True)
+
+def _get_planet_pixmap(name: str) -> QPixmap:
+    """
+    Retourne l'image de remplacement d'une planète (cercle et initiale)
+    Elle n'est dessinée qu'une fois puis conservée dans QPixmapCache
+    
+    Args:
+        name: Nom de la planète
+        
+    Returns:
+        Image de la planète
+    """
+    key = f"planet:{name}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+    
+    ratio = QGuiApplication.primaryScreen().devicePixelRatio()
+    size = PLANET_IMAGE_SIZE
+    pixmap = QPixmap(round(size * ratio), round(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    
+    # Disque avec bordure, comme l'ancien QLabel arrondi
+    painter.setPen(QPen(QColor("#606060"), 2))
+    painter.setBrush(QColor("#404040"))
+    painter.drawEllipse(QRectF(1, 1, size - 2, size - 2))
+    
+    # Première lettre comme placeholder
+    painter.setFont(_IMAGE_FONT)
+    painter.setPen(QColor("#ffffff"))
+    painter.drawText(QRectF(0, 0, size, size), Qt.AlignCenter, name[:1])
+    painter.end()
+    
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
 class PlanetCard(QFrame):
     """
     Carte représentant une planète sélectionnable
@@ -44,69 +101,43 @@ class PlanetCard(QFrame):
         
         # Nom de la planète
         name_label = QLabel(self.planet_name)
-        name_font = QFont()
-        name_font.setPointSize(14)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
+        name_label.setFont(_NAME_FONT)
         name_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(name_label)
         
-        # Image de la planète (placeholder pour l'instant)
+        # Image de la planète (placeholder pré-rendu et partagé)
         image_label = QLabel()
-        image_label.setFixedSize(120, 120)
-        image_label.setAlignment(Qt.AlignCenter)
-        image_label.setStyleSheet("""
-            QLabel {
-                background-color: #404040;
-                border: 2px solid #606060;
-                border-radius: 60px;
-                color: #ffffff;
-            }
-        """)
-        image_label.setText(self.planet_name[0])  # Première lettre comme placeholder
-        image_font = QFont()
-        image_font.setPointSize(36)
-        image_font.setBold(True)
-        image_label.setFont(image_font)
+        image_label.setObjectName("planetImage")
+        image_label.setFixedSize(PLANET_IMAGE_SIZE, PLANET_IMAGE_SIZE)
+        image_label.setPixmap(_get_planet_pixmap(self.planet_name))
         layout.addWidget(image_label, 0, Qt.AlignCenter)
         
         # Informations de la planète
         info_layout = QVBoxLayout()
         info_layout.setSpacing(4)
         
-        # Température
-        temp_label = QLabel(f"Température: {format_temperature(self.planet_data['initial_temperature'])}")
-        info_layout.addWidget(temp_label)
-        
-        # Pression
-        pressure_label = QLabel(f"Pression: {format_pressure(self.planet_data['initial_pressure'])}")
-        info_layout.addWidget(pressure_label)
-        
-        # Oxygène
-        oxygen_label = QLabel(f"Oxygène: {format_percentage(self.planet_data['initial_oxygen'])}")
-        info_layout.addWidget(oxygen_label)
+        planet_data = self.planet_data
+        rows = (
+            ("Température", format_temperature(planet_data['initial_temperature'])),
+            ("Pression", format_pressure(planet_data['initial_pressure'])),
+            ("Oxygène", format_percentage(planet_data['initial_oxygen']))
+        )
+        for label, value in rows:
+            info_layout.addWidget(QLabel(f"{label}: {value}"))
         
         # Difficulté
-        difficulty = self.planet_data.get('difficulty', 'normal')
-        difficulty_colors = {
-            'easy': '#00FF00',
-            'normal': '#FFFF00', 
-            'hard': '#FF0000'
-        }
+        difficulty = planet_data.get('difficulty', 'normal')
         difficulty_label = QLabel(f"Difficulté: {difficulty.title()}")
-        difficulty_label.setStyleSheet(f"color: {difficulty_colors.get(difficulty, '#FFFFFF')};")
+        difficulty_label.setObjectName("planetDifficulty")
+        difficulty_label.setProperty("difficulty", difficulty)  # Couleur choisie par la feuille de style
         info_layout.addWidget(difficulty_label)
         
         layout.addLayout(info_layout)
         
-        # Description (tronquée)
-        description = self.planet_data.get('description', '')
-        if len(description) > 100:
-            description = description[:97] + "..."
-        
-        desc_label = QLabel(description)
+        # Description (tronquée une fois pour toutes par la boîte de dialogue)
+        desc_label = QLabel(planet_data['_short_description'])
+        desc_label.setObjectName("planetDesc")
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #CCCCCC; font-size: 10px;")
         layout.addWidget(desc_label)
         
         # Bouton de sélection
@@ -121,58 +152,22 @@ class PlanetCard(QFrame):
         self.setFrameStyle(QFrame.Box)
         self.setLineWidth(2)
         self.setFixedSize(200, 350)
-        self.update_style()
+        
+        # Les règles des deux états sont dans la feuille de style de l'application
+        self.setProperty("selected", False)
     
     def update_style(self):
         """
         Met à jour le style selon l'état de sélection
+        Les règles déjà analysées sont réappliquées, sans nouvelle feuille de style
         """
-        if self.is_selected:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2a4a2a;
-                    border: 2px solid #00FF00;
-                    border-radius: 8px;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #00AA00;
-                    color: white;
-                    border: none;
-                    padding: 8px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #00CC00;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: 2px solid #555555;
-                    border-radius: 8px;
-                }
-                QFrame:hover {
-                    border-color: #777777;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #0078d4;
-                    color: white;
-                    border: none;
-                    padding: 8px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #106ebe;
-                }
-            """)
+        self.setProperty("selected", self.is_selected)
+        
+        # Les règles des enfants dépendent aussi de la propriété de la carte
+        style = self.style()
+        for widget in [self] + self.findChildren(QWidget):
+            style.unpolish(widget)
+            style.polish(widget)
     
     def select_planet(self):
         """
@@ -187,6 +182,10 @@ class PlanetCard(QFrame):
         Args:
             selected: True si la planète est sélectionnée
         """
+        # Pas de nouvelle correspondance des règles si l'état ne change pas
+        if selected == self.is_selected:
+            return
+        
         self.is_selected = selected
         self.update_style()
 
@@ -195,6 +194,8 @@ class PlanetSelectionDialog(QDialog):
     Boîte de dialogue pour sélectionner une planète
     """
     
+    _INFO_PLACEHOLDER = "Sélectionnez une planète pour voir les détails..."
+    
     def __init__(self, available_planets: dict, parent=None):
         """
         Initialise la boîte de dialogue
@@ -209,8 +210,15 @@ class PlanetSelectionDialog(QDialog):
         self.selected_planet = None
         self.planet_cards = {}
         
+        # Descriptions des cartes tronquées une seule fois par planète
+        for planet_data in available_planets.values():
+            if '_short_description' not in planet_data:
+                description = planet_data.get('description', '')
+                if len(description) > DESCRIPTION_MAX_LENGTH:
+                    description = description[:DESCRIPTION_MAX_LENGTH - 3] + "..."
+                planet_data['_short_description'] = description
+        
         self.setup_ui()
-        self.setup_style()
     
     def setup_ui(self):
         """
@@ -224,10 +232,7 @@ class PlanetSelectionDialog(QDialog):
         
         # Titre
         title_label = QLabel("Choisissez une planète à terraformer")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_TITLE_FONT)
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
@@ -265,7 +270,7 @@ class PlanetSelectionDialog(QDialog):
         self.info_text = QTextEdit()
         self.info_text.setMaximumHeight(120)
         self.info_text.setReadOnly(True)
-        self.info_text.setText("Sélectionnez une planète pour voir les détails...")
+        self.info_text.setText(self._INFO_PLACEHOLDER)
         layout.addWidget(self.info_text)
         
         # Boutons
@@ -284,43 +289,17 @@ class PlanetSelectionDialog(QDialog):
         
         layout.addLayout(button_layout)
     
-    def setup_style(self):
+    def reset(self):
         """
-        Configure le style de la boîte de dialogue
+        Remet la boîte de dialogue dans son état initial avant une nouvelle ouverture
         """
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 1px solid #555555;
-                color: #ffffff;
-                padding: 8px;
-            }
-            QScrollArea {
-                background-color: #1e1e1e;
-                border: none;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #999999;
-            }
-        """)
+        if self.selected_planet is None:
+            return
+        
+        self.planet_cards[self.selected_planet].set_selected(False)
+        self.selected_planet = None
+        self.ok_button.setEnabled(False)
+        self.info_text.setText(self._INFO_PLACEHOLDER)
     
     def on_planet_selected(self, planet_name: str):
         """
@@ -0,0 +1,142 @@
+"""
+Feuille de style de l'application TerraGenesis PC
+Appliquée une seule fois sur QApplication au démarrage
+"""
+
+# Thème sombre de la fenêtre principale
+_MAIN_WINDOW_STYLE = """
+QMainWindow {
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+QMenuBar {
+    background-color: #2d2d2d;
+    color: #ffffff;
+    border-bottom: 1px solid #555555;
+}
+QMenuBar::item {
+    background-color: transparent;
+    padding: 4px 8px;
+}
+QMenuBar::item:selected {
+    background-color: #404040;
+}
+QMenu {
+    background-color: #2d2d2d;
+    color: #ffffff;
+    border: 1px solid #555555;
+}
+QMenu::item:selected {
+    background-color: #404040;
+}
+QStatusBar {
+    background-color: #2d2d2d;
+    color: #ffffff;
+    border-top: 1px solid #555555;
+}
+QStatusBar QLabel {
+    color: #ffffff;
+}
+"""
+
+# Boîte de dialogue de sélection de planète
+_PLANET_SELECTION_STYLE = """
+PlanetSelectionDialog {
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+PlanetSelectionDialog QLabel {
+    color: #ffffff;
+}
+PlanetSelectionDialog QTextEdit {
+    background-color: #2d2d2d;
+    border: 1px solid #555555;
+    color: #ffffff;
+    padding: 8px;
+}
+PlanetSelectionDialog QScrollArea {
+    background-color: #1e1e1e;
+    border: none;
+}
+PlanetSelectionDialog QPushButton {
+    background-color: #0078d4;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+}
+PlanetSelectionDialog QPushButton:hover {
+    background-color: #106ebe;
+}
+PlanetSelectionDialog QPushButton:disabled {
+    background-color: #555555;
+    color: #999999;
+}
+"""
+
+# Cartes de planète, selon leur propriété "selected". Placées après les règles
+# de la boîte de dialogue pour l'emporter sur elles à spécificité égale
+_PLANET_CARD_STYLE = """
+PlanetCard[selected="false"], PlanetCard[selected="false"] QFrame {
+    background-color: #2d2d2d;
+    border: 2px solid #555555;
+    border-radius: 8px;
+}
+PlanetCard[selected="false"]:hover, PlanetCard[selected="false"] QFrame:hover {
+    border-color: #777777;
+}
+PlanetCard[selected="false"] QLabel {
+    color: #ffffff;
+}
+PlanetCard[selected="false"] QPushButton {
+    background-color: #0078d4;
+    color: white;
+    border: none;
+    padding: 8px;
+    border-radius: 4px;
+}
+PlanetCard[selected="false"] QPushButton:hover {
+    background-color: #106ebe;
+}
+PlanetCard[selected="true"], PlanetCard[selected="true"] QFrame {
+    background-color: #2a4a2a;
+    border: 2px solid #00FF00;
+    border-radius: 8px;
+}
+PlanetCard[selected="true"] QLabel {
+    color: #ffffff;
+}
+PlanetCard[selected="true"] QPushButton {
+    background-color: #00AA00;
+    color: white;
+    border: none;
+    padding: 8px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+PlanetCard[selected="true"] QPushButton:hover {
+    background-color: #00CC00;
+}
+PlanetCard QLabel#planetImage {
+    background: transparent;
+    border: none;
+}
+PlanetCard QLabel#planetDesc {
+    color: #CCCCCC;
+    font-size: 10px;
+}
+PlanetCard QLabel#planetDifficulty {
+    color: #FFFFFF;
+}
+PlanetCard QLabel#planetDifficulty[difficulty="easy"] {
+    color: #00FF00;
+}
+PlanetCard QLabel#planetDifficulty[difficulty="normal"] {
+    color: #FFFF00;
+}
+PlanetCard QLabel#planetDifficulty[difficulty="hard"] {
+    color: #FF0000;
+}
+"""
+
+APP_STYLE = _MAIN_WINDOW_STYLE + _PLANET_SELECTION_STYLE + _PLANET_CARD_STYLE
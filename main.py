@@ -8,22 +8,40 @@ Version: 1.0.0
 """
 
 import sys
-import os
+import argparse
+import logging
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 
-# Ajouter le répertoire racine au path pour les imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from gui.main_window import MainWindow
+from gui.style import APP_STYLE
 from utils.audio_manager import AudioManager
 from config.settings import GameSettings
 
+def parse_arguments(argv):
+    """
+    Lit les options de la ligne de commande
+    Les options inconnues (dont celles de Qt) sont ignorées
+    
+    Args:
+        argv: Arguments de la ligne de commande, sans le nom du programme
+        
+    Returns:
+        Options reconnues
+    """
+    parser = argparse.ArgumentParser(description="TerraGenesis PC")
+    parser.add_argument("--audio-buffer", type=int, default=None,
+                        help="taille du tampon audio en échantillons (remplace le paramètre audio_buffer)")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
 def main():
     """
     Fonction principale - Lance l'application TerraGenesis
     """
+    args = parse_arguments(sys.argv[1:])
+    
     # Créer l'application Qt
     app = QApplication(sys.argv)
     app.setApplicationName("TerraGenesis PC")
@@ -33,12 +51,21 @@ def main():
     app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     
+    # Feuille de style de l'application, analysée une seule fois
+    app.setStyleSheet(APP_STYLE)
+    
     # Initialiser les paramètres du jeu
     settings = GameSettings()
     
+    # Journalisation: les messages d'information ne sont formatés qu'en mode debug
+    logging.basicConfig(
+        level=logging.INFO if settings.debug_mode else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s"
+    )
+    
     # Initialiser le gestionnaire audio
     audio_manager = AudioManager()
-    audio_manager.initialize()
+    audio_manager.initialize(args.audio_buffer or settings.audio_buffer)
     
     # Créer et afficher la fenêtre principale
     main_window = MainWindow()
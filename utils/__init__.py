@@ -4,6 +4,10 @@ Module utilitaires pour TerraGenesis PC
 
 from .audio_manager import AudioManager
 from .save_manager import SaveManager
-from .helpers import *
+from .helpers import (format_time, format_number, format_percentage, format_temperature,
+                      format_pressure, clamp, lerp, calculate_distance, calculate_distance_sq,
+                      distances_sq, get_color_for_value, get_color_for_value_batch, rgb_to_hex,
+                      hex_to_rgb, get_habitability_color, get_resource_color,
+                      calculate_building_efficiency, generate_planet_description)
 
 __all__ = ['AudioManager', 'SaveManager', 'format_time', 'format_number']
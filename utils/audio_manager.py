@@ -2,10 +2,31 @@
 Gestionnaire audio pour TerraGenesis PC
 """
 
-import pygame
 import os
-from typing import Dict, Optional
-from config.constants import DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Optional
+from config.constants import (DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME, DEFAULT_AUDIO_BUFFER,
+                              SFX_CHANNELS)
+
+if TYPE_CHECKING:
+    import pygame
+else:
+    pygame = None  # Importé par AudioManager.initialize: SDL n'est chargé qu'avec l'audio
+
+# Effets sonores par défaut du jeu: nom -> fichier
+_DEFAULT_SOUNDS = MappingProxyType({
+    'button_click': 'button_click.wav',
+    'building_built': 'building_built.wav',
+    'research_complete': 'research_complete.wav',
+    'event_positive': 'event_positive.wav',
+    'event_negative': 'event_negative.wav',
+    'notification': 'notification.wav'
+})
+
+# Effet joué sur le canal réservé, pour que le retour des clics ne soit jamais coupé
+_UI_SOUND = 'button_click'
 
 class AudioManager:
     """
@@ -20,24 +41,51 @@ class AudioManager:
         self.music_volume = DEFAULT_MUSIC_VOLUME
         self.sfx_volume = DEFAULT_SFX_VOLUME
         self.current_music = None
-        self.sound_effects: Dict[str, pygame.mixer.Sound] = {}
+        self.sound_effects: Dict[str, 'pygame.mixer.Sound'] = {}
+        
+        # Effets enregistrés avant l'initialisation, chargés par initialize: nom -> fichier
+        self._sound_registry: Dict[str, str] = {}
+        
+        # Décodage des effets dans un thread, hors de la boucle d'événements Qt
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio")
+        self._pending: Dict[str, Future] = {}
+        
+        # Canaux du mixeur attribués à tour de rôle (créés par initialize)
+        self._ui_channel = None
+        self._channel_cycle = None
         
         # Chemins des fichiers audio
         self.music_path = "assets/sounds/"
         self.sfx_path = "assets/sounds/"
     
-    def initialize(self) -> bool:
+    def initialize(self, buffer: int = DEFAULT_AUDIO_BUFFER) -> bool:
         """
         Initialise le système audio
         
+        Args:
+            buffer: Taille du tampon du mixeur en échantillons
+        
         Returns:
             True si l'initialisation a réussi
         """
+        global pygame
+        
         try:
-            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+            import pygame
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=buffer)
             pygame.mixer.init()
+            
+            # Canaux fixes: pas de recherche d'un canal libre à chaque lecture
+            pygame.mixer.set_num_channels(SFX_CHANNELS)
+            pygame.mixer.set_reserved(1)
+            self._ui_channel = pygame.mixer.Channel(0)
+            self._channel_cycle = itertools.cycle(
+                [pygame.mixer.Channel(i) for i in range(1, SFX_CHANNELS)])
+            
             self.is_initialized = True
             print("Système audio initialisé")
+            
+            self._load_registered_sounds()
             return True
         except Exception as e:
             print(f"Erreur lors de l'initialisation audio: {e}")
@@ -57,14 +105,10 @@ class AudioManager:
         if not self.is_initialized:
             return False
         
+        music_file = os.path.join(self.music_path, filename)
+        
         try:
-            music_file = os.path.join(self.music_path, filename)
-            
-            # Vérifier si le fichier existe
-            if not os.path.exists(music_file):
-                print(f"Fichier musical non trouvé: {music_file}")
-                return False
-            
+            # Pas de vérification préalable: un fichier absent fait échouer load()
             pygame.mixer.music.load(music_file)
             pygame.mixer.music.set_volume(self.music_volume)
             pygame.mixer.music.play(-1 if loop else 0)
@@ -73,6 +117,9 @@ class AudioManager:
             print(f"Musique lancée: {filename}")
             return True
             
+        except (FileNotFoundError, pygame.error) as e:
+            print(f"Fichier musical non trouvé ou illisible: {music_file} ({e})")
+            return False
         except Exception as e:
             print(f"Erreur lors de la lecture de la musique: {e}")
             return False
@@ -112,35 +159,51 @@ class AudioManager:
     
     def load_sound_effect(self, name: str, filename: str) -> bool:
         """
-        Charge un effet sonore
+        Lance le chargement d'un effet sonore en arrière-plan
+        L'effet est disponible dès que son décodage est terminé
         
         Args:
             name: Nom de l'effet sonore
             filename: Nom du fichier
             
         Returns:
-            True si le chargement a réussi
+            True si le chargement a été lancé
         """
         if not self.is_initialized:
             return False
         
-        try:
-            sound_file = os.path.join(self.sfx_path, filename)
-            
-            if not os.path.exists(sound_file):
-                print(f"Fichier sonore non trouvé: {sound_file}")
-                return False
-            
-            sound = pygame.mixer.Sound(sound_file)
-            sound.set_volume(self.sfx_volume)
-            self.sound_effects[name] = sound
-            
-            print(f"Effet sonore chargé: {name}")
-            return True
+        # Un fichier absent est signalé à la récupération de l'effet
+        sound_file = os.path.join(self.sfx_path, filename)
+        self._pending[name] = self._executor.submit(pygame.mixer.Sound, sound_file)
+        return True
+    
+    def _collect_sound_effect(self, name: str) -> Optional['pygame.mixer.Sound']:
+        """
+        Récupère un effet sonore dont le décodage est terminé
+        
+        Args:
+            name: Nom de l'effet sonore
             
+        Returns:
+            L'effet sonore, ou None s'il n'est pas (encore) disponible
+        """
+        future = self._pending.get(name)
+        if future is None or not future.done():
+            return None
+        
+        del self._pending[name]
+        try:
+            sound = future.result()
+        except FileNotFoundError as e:
+            print(f"Fichier sonore non trouvé: {e}")
+            return None
         except Exception as e:
             print(f"Erreur lors du chargement de l'effet sonore: {e}")
-            return False
+            return None
+        
+        self.sound_effects[name] = sound
+        print(f"Effet sonore chargé: {name}")
+        return sound
     
     def play_sound_effect(self, name: str) -> bool:
         """
@@ -152,11 +215,23 @@ class AudioManager:
         Returns:
             True si l'effet a été joué
         """
-        if not self.is_initialized or name not in self.sound_effects:
+        if not self.is_initialized:
             return False
         
+        sound = self.sound_effects.get(name)
+        if sound is None:
+            # Décodage lancé au chargement des effets; s'il n'est pas encore
+            # terminé, l'effet est ignoré plutôt que d'attendre
+            sound = self._collect_sound_effect(name)
+            if sound is None:
+                return False
+        
+        # Tourniquet: le canal le plus anciennement utilisé est repris
+        channel = self._ui_channel if name == _UI_SOUND else next(self._channel_cycle)
+        
         try:
-            self.sound_effects[name].play()
+            channel.set_volume(self.sfx_volume)
+            channel.play(sound)
             return True
         except Exception as e:
             print(f"Erreur lors de la lecture de l'effet sonore: {e}")
@@ -169,35 +244,45 @@ class AudioManager:
         Args:
             volume: Volume entre 0.0 et 1.0
         """
+        # Appliqué au canal à chaque lecture: les effets chargés ne sont pas modifiés
         self.sfx_volume = max(0.0, min(1.0, volume))
-        
-        # Mettre à jour le volume de tous les effets chargés
-        for sound in self.sound_effects.values():
-            sound.set_volume(self.sfx_volume)
     
     def load_default_sounds(self):
         """
-        Charge les effets sonores par défaut du jeu
+        Lance le décodage en arrière-plan des effets sonores par défaut du jeu,
+        pour qu'ils soient prêts avant leur première lecture
+        Avant l'initialisation, ils sont seulement enregistrés et chargés par initialize
         """
-        default_sounds = {
-            'button_click': 'button_click.wav',
-            'building_built': 'building_built.wav',
-            'research_complete': 'research_complete.wav',
-            'event_positive': 'event_positive.wav',
-            'event_negative': 'event_negative.wav',
-            'notification': 'notification.wav'
-        }
+        for name, filename in _DEFAULT_SOUNDS.items():
+            if name not in self.sound_effects and name not in self._pending:
+                self._sound_registry[name] = filename
         
-        for name, filename in default_sounds.items():
+        if self.is_initialized:
+            self._load_registered_sounds()
+    
+    def _load_registered_sounds(self):
+        """
+        Lance le décodage de tous les effets enregistrés
+        """
+        registry = self._sound_registry
+        self._sound_registry = {}
+        for name, filename in registry.items():
             self.load_sound_effect(name, filename)
     
     def cleanup(self):
         """
         Nettoie les ressources audio
         """
+        # Les décodages en attente sont annulés, celui en cours est attendu
+        # pour ne pas fermer le mixeur sous lui
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+        
         if self.is_initialized:
             pygame.mixer.music.stop()
             pygame.mixer.quit()
+            self._ui_channel = None
+            self._channel_cycle = None
             self.is_initialized = False
             print("Système audio fermé")
     
@@ -3,8 +3,67 @@ Fonctions utilitaires pour TerraGenesis PC
 """
 
 import math
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Union
 
+import numpy as np
+
+# Taille du cache de formatage: les libellés rafraîchis à chaque tick
+# reprennent presque toujours des valeurs déjà vues une fois arrondies
+_FORMAT_CACHE_SIZE = 4096
+
+_NUMBER_SUFFIXES = ('', 'K', 'M', 'B', 'T', 'P')
+
+# Composantes hexadécimales précalculées pour rgb_to_hex
+_HEX2_TABLE = tuple(f"{i:02x}" for i in range(256))
+
+# Tranches de generate_planet_description: seuils croissants et une phrase de plus
+# que de seuils (la phrase i couvre les valeurs sous le seuil i)
+_HABITABILITY_THRESHOLDS = (50, 80)
+_HABITABILITY_PHRASES = ("reste hostile à la vie",
+                         "progresse vers l'habitabilité",
+                         "est maintenant une planète habitable")
+
+_TEMPERATURE_THRESHOLDS = (-50, 0, 30, 60)
+_TEMPERATURE_PHRASES = ("avec des températures glaciales",
+                        "avec des températures froides",
+                        "avec des températures modérées",
+                        "avec des températures chaudes",
+                        "avec des températures extrêmes")
+
+_PRESSURE_THRESHOLDS = (0.1, 0.5, 2.0)
+_PRESSURE_PHRASES = ("et une atmosphère très fine",
+                     "et une atmosphère légère",
+                     "et une atmosphère dense",
+                     "et une atmosphère très dense")
+
+_RESOURCE_COLORS = {
+    'credits': "#FFD700",  # Or
+    'energy': "#00BFFF",   # Bleu ciel
+    'science': "#9370DB"   # Violet
+}
+
+def _format_fixed(value: float, precision: int, suffix: str) -> str:
+    """
+    Formate une valeur à virgule fixe, arrondie à la précision affichée
+    avant de consulter le cache
+    
+    Args:
+        value: Valeur à formater
+        precision: Nombre de décimales
+        suffix: Unité ou suffixe ajouté au nombre
+        
+    Returns:
+        Valeur formatée
+    """
+    # + 0.0 ramène -0.0 sur 0.0, que le cache confondrait de toute façon
+    return _format_rounded(round(value, precision) + 0.0, precision, suffix)
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _format_rounded(value: float, precision: int, suffix: str) -> str:
+    return f"{value:.{precision}f}{suffix}"
+
 def format_time(seconds: float) -> str:
     """
     Formate un temps en secondes en format lisible
@@ -47,16 +106,29 @@ def format_number(number: Union[int, float], precision: int = 1) -> str:
         if isinstance(number, int):
             return str(number)
         else:
-            return f"{number:.{precision}f}"
+            return _format_fixed(number, precision, '')
+    
+    number, magnitude = _scale_number(number)
+    return _format_fixed(number, precision, _NUMBER_SUFFIXES[magnitude])
+
+def _scale_number(number: float) -> tuple:
+    """
+    Ramène un nombre sous 1000 en le divisant par puissances de mille
     
-    suffixes = ['', 'K', 'M', 'B', 'T', 'P']
+    Args:
+        number: Nombre à réduire
+        
+    Returns:
+        Tuple (nombre réduit, indice du suffixe)
+    """
     magnitude = 0
+    max_magnitude = len(_NUMBER_SUFFIXES) - 1
     
-    while abs(number) >= 1000 and magnitude < len(suffixes) - 1:
+    while abs(number) >= 1000 and magnitude < max_magnitude:
         number /= 1000
         magnitude += 1
     
-    return f"{number:.{precision}f}{suffixes[magnitude]}"
+    return number, magnitude
 
 def format_percentage(value: float, precision: int = 1) -> str:
     """
@@ -69,7 +141,7 @@ def format_percentage(value: float, precision: int = 1) -> str:
     Returns:
         Pourcentage formaté (ex: "75.5%")
     """
-    return f"{value:.{precision}f}%"
+    return _format_fixed(value, precision, '%')
 
 def format_temperature(celsius: float) -> str:
     """
@@ -81,7 +153,7 @@ def format_temperature(celsius: float) -> str:
     Returns:
         Température formatée (ex: "-60.5°C")
     """
-    return f"{celsius:.1f}°C"
+    return _format_fixed(celsius, 1, '°C')
 
 def format_pressure(atm: float) -> str:
     """
@@ -94,11 +166,11 @@ def format_pressure(atm: float) -> str:
         Pression formatée (ex: "0.006 atm")
     """
     if atm < 0.001:
-        return f"{atm:.6f} atm"
+        return _format_fixed(atm, 6, ' atm')
     elif atm < 0.1:
-        return f"{atm:.3f} atm"
+        return _format_fixed(atm, 3, ' atm')
     else:
-        return f"{atm:.2f} atm"
+        return _format_fixed(atm, 2, ' atm')
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """
@@ -126,7 +198,12 @@ def lerp(start: float, end: float, t: float) -> float:
     Returns:
         Valeur interpolée
     """
-    return start + (end - start) * clamp(t, 0.0, 1.0)
+    # Bornage en ligne: appelé pour chaque composante de couleur
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    return start + (end - start) * t
 
 def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """
@@ -139,7 +216,38 @@ def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
     Returns:
         Distance entre les points
     """
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return math.sqrt(calculate_distance_sq(x1, y1, x2, y2))
+
+def calculate_distance_sq(x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Calcule le carré de la distance entre deux points
+    Suffit pour ordonner des distances ou les comparer à un rayon (d² < r²)
+    
+    Args:
+        x1, y1: Coordonnées du premier point
+        x2, y2: Coordonnées du second point
+        
+    Returns:
+        Carré de la distance entre les points
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
+def distances_sq(xs: np.ndarray, ys: np.ndarray, x0: float, y0: float) -> np.ndarray:
+    """
+    Calcule le carré des distances entre un ensemble de points et un point
+    
+    Args:
+        xs, ys: Tableaux des coordonnées des points
+        x0, y0: Coordonnées du point de référence
+        
+    Returns:
+        Tableau des carrés des distances
+    """
+    dx = xs - x0
+    dy = ys - y0
+    return dx * dx + dy * dy
 
 def get_color_for_value(value: float, min_val: float, max_val: float, 
                        color_low: tuple, color_high: tuple) -> tuple:
@@ -161,11 +269,40 @@ def get_color_for_value(value: float, min_val: float, max_val: float,
     
     t = clamp((value - min_val) / (max_val - min_val), 0.0, 1.0)
     
-    r = int(lerp(color_low[0], color_high[0], t))
-    g = int(lerp(color_low[1], color_high[1], t))
-    b = int(lerp(color_low[2], color_high[2], t))
+    # t est déjà borné: interpolation directe, sans repasser par lerp
+    r0, g0, b0 = color_low[:3]
+    r1, g1, b1 = color_high[:3]
+    
+    return (int(r0 + (r1 - r0) * t),
+            int(g0 + (g1 - g0) * t),
+            int(b0 + (b1 - b0) * t))
+
+def get_color_for_value_batch(values: np.ndarray, min_val: float, max_val: float,
+                             color_low: tuple, color_high: tuple) -> np.ndarray:
+    """
+    Version vectorisée de get_color_for_value pour colorer une grille entière
+    
+    Args:
+        values: Tableau de valeurs (de préférence float32 contigu)
+        min_val: Valeur minimale
+        max_val: Valeur maximale
+        color_low: Couleur RGB pour la valeur minimale
+        color_high: Couleur RGB pour la valeur maximale
+        
+    Returns:
+        Tableau uint8 de forme (N, 3), une couleur RGB par valeur
+    """
+    values = np.ravel(values)
+    low = np.asarray(color_low[:3], dtype=np.float32)
+    
+    if max_val == min_val:
+        return np.broadcast_to(low.astype(np.uint8), (values.size, 3)).copy()
+    
+    high = np.asarray(color_high[:3], dtype=np.float32)
+    t = np.clip((values - min_val) / (max_val - min_val), 0.0, 1.0).astype(np.float32, copy=False)
     
-    return (r, g, b)
+    # La conversion tronque comme int() dans la version scalaire
+    return (low + (high - low) * t[:, None]).astype(np.uint8)
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """
@@ -177,8 +314,9 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     Returns:
         Couleur en format hexadécimal (ex: "#FF0000")
     """
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#" + _HEX2_TABLE[r] + _HEX2_TABLE[g] + _HEX2_TABLE[b]
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> tuple:
     """
     Convertit une couleur hexadécimale en RGB
@@ -223,12 +361,7 @@ def get_resource_color(resource_type: str) -> str:
     Returns:
         Couleur en format hexadécimal
     """
-    colors = {
-        'credits': "#FFD700",  # Or
-        'energy': "#00BFFF",   # Bleu ciel
-        'science': "#9370DB"   # Violet
-    }
-    return colors.get(resource_type, "#FFFFFF")
+    return _RESOURCE_COLORS.get(resource_type, "#FFFFFF")
 
 def calculate_building_efficiency(planet_habitability: float) -> float:
     """
@@ -260,36 +393,9 @@ def generate_planet_description(planet_name: str, habitability: float,
     Returns:
         Description textuelle de l'état de la planète
     """
-    descriptions = []
-    
-    # État général
-    if habitability >= 80:
-        descriptions.append(f"{planet_name} est maintenant une planète habitable")
-    elif habitability >= 50:
-        descriptions.append(f"{planet_name} progresse vers l'habitabilité")
-    else:
-        descriptions.append(f"{planet_name} reste hostile à la vie")
-    
-    # Température
-    if temperature < -50:
-        descriptions.append("avec des températures glaciales")
-    elif temperature < 0:
-        descriptions.append("avec des températures froides")
-    elif temperature < 30:
-        descriptions.append("avec des températures modérées")
-    elif temperature < 60:
-        descriptions.append("avec des températures chaudes")
-    else:
-        descriptions.append("avec des températures extrêmes")
-    
-    # Atmosphère
-    if pressure < 0.1:
-        descriptions.append("et une atmosphère très fine")
-    elif pressure < 0.5:
-        descriptions.append("et une atmosphère légère")
-    elif pressure < 2.0:
-        descriptions.append("et une atmosphère dense")
-    else:
-        descriptions.append("et une atmosphère très dense")
+    # État général, température et atmosphère: une recherche par tranche
+    state = _HABITABILITY_PHRASES[bisect_right(_HABITABILITY_THRESHOLDS, habitability)]
+    climate = _TEMPERATURE_PHRASES[bisect_right(_TEMPERATURE_THRESHOLDS, temperature)]
+    atmosphere = _PRESSURE_PHRASES[bisect_right(_PRESSURE_THRESHOLDS, pressure)]
     
-    return ", ".join(descriptions) + "."
\ No newline at end of file
+    return f"{planet_name} {state}, {climate}, {atmosphere}."
\ No newline at end of file
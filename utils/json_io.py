@@ -0,0 +1,116 @@
+"""
+Lecture et écriture JSON pour TerraGenesis PC
+Utilise orjson lorsqu'il est installé, sinon le module json standard
+"""
+
+import json
+import mmap
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel
+    orjson = None
+
+def loads(data) -> Any:
+    """
+    Décode un document JSON
+    
+    Args:
+        data: Contenu JSON (bytes ou str)
+    
+    Returns:
+        Objet Python décodé
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """
+    Encode un objet en JSON UTF-8
+    
+    Args:
+        obj: Objet à encoder
+        indent: Si True, indente le document pour qu'il reste lisible
+    
+    Returns:
+        Document JSON encodé en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def load_file(path: str) -> Any:
+    """
+    Charge un fichier JSON
+    
+    Args:
+        path: Chemin du fichier
+    
+    Returns:
+        Objet Python décodé
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+def load_mapped_file(path: str) -> Any:
+    """
+    Charge un fichier JSON en lecture seule via mmap
+    Avec orjson, le document est parsé directement depuis le cache de pages
+    sans copie intermédiaire dans un tampon Python
+    
+    Args:
+        path: Chemin du fichier
+    
+    Returns:
+        Objet Python décodé
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return loads(b'')  # mmap refuse les fichiers vides
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+
+def dump_file(obj: Any, path: str, indent: bool = True, atomic: bool = False):
+    """
+    Écrit un objet dans un fichier JSON
+    
+    Args:
+        obj: Objet à écrire
+        path: Chemin du fichier
+        indent: Si True, indente le document
+        atomic: Si True, écrit dans un fichier temporaire puis le renomme,
+            pour ne jamais laisser un fichier à moitié écrit
+    """
+    write_file(dumps(obj, indent), path, atomic)
+
+def write_file(data: bytes, path: str, atomic: bool = False):
+    """
+    Écrit un document JSON déjà encodé dans un fichier
+    
+    Args:
+        data: Document JSON encodé en UTF-8
+        path: Chemin du fichier
+        atomic: Si True, écrit dans un fichier temporaire puis le renomme,
+            pour ne jamais laisser un fichier à moitié écrit
+    """
+    if not atomic:
+        with open(path, 'wb') as f:
+            f.write(data)
+        return
+    
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -5,8 +5,221 @@ Gestionnaire de sauvegarde pour TerraGenesis PC
 import os
 import json
 import time
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from config.constants import SAVES_DIRECTORY
+from config.constants import SAVES_DIRECTORY, SAVES_INDEX_FILE
+
+from . import json_io
+
+# Marqueur d'une section identique à celle de la sauvegarde précédente
+UNCHANGED_MARKER = {'__unchanged__': True}
+
+# Préfixe du fichier précédent d'une sauvegarde automatique différentielle
+PREVIOUS_AUTOSAVE_PREFIX = 'autosave_prev_'
+
+# Suffixe d'une sauvegarde différentielle complète, en attente de la rotation des fichiers
+PENDING_SAVE_SUFFIX = '.next'
+
+# Taille au-delà de laquelle un fichier n'est pas considéré comme une sauvegarde
+MAX_SAVE_FILE_SIZE = 64 * 1024 * 1024
+
+# Nombre maximal de sauvegardes lues en parallèle lors d'une recherche
+_MAX_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+# Clé de l'en-tête écrit au début des sauvegardes, et taille lue pour le trouver
+SAVE_HEADER_KEY = 'header'
+SAVE_HEADER_READ_SIZE = 4096
+
+_header_decoder = json.JSONDecoder()
+
+def build_save_header(save_data: Dict) -> Dict:
+    """
+    Construit le résumé d'une sauvegarde, écrit en tête du fichier pour que
+    la liste des sauvegardes n'ait pas à lire le fichier entier
+    
+    Args:
+        save_data: Données complètes de la sauvegarde
+        
+    Returns:
+        Dictionnaire des informations affichées dans la liste des sauvegardes
+    """
+    planet = save_data.get('planet') or {}
+    resources = save_data.get('resources') or {}
+    return {
+        'planet_name': planet.get('name', 'Inconnu'),
+        'save_time': save_data.get('save_time'),
+        'game_time': save_data.get('game_time', 0),
+        'version': save_data.get('version', 'Inconnue'),
+        'temperature': planet.get('temperature'),
+        'pressure': planet.get('pressure'),
+        'oxygen': planet.get('oxygen'),
+        'credits': resources.get('credits', 0),
+        'science': resources.get('science', 0)
+    }
+
+def read_save_header(save_path: str) -> Optional[Dict]:
+    """
+    Lit l'en-tête d'une sauvegarde sans décoder le reste du fichier
+    
+    Args:
+        save_path: Chemin de la sauvegarde
+        
+    Returns:
+        En-tête de la sauvegarde, ou None si le fichier n'en a pas
+        (ancien format) ou s'il dépasse SAVE_HEADER_READ_SIZE
+    """
+    with open(save_path, 'rb') as f:
+        head = f.read(SAVE_HEADER_READ_SIZE)
+    
+    # L'en-tête doit être la première clé de l'objet racine
+    head = head.lstrip()
+    if not head.startswith(b'{'):
+        return None
+    head = head[1:].lstrip()
+    key = f'"{SAVE_HEADER_KEY}"'.encode()
+    if not head.startswith(key):
+        return None
+    head = head[len(key):].lstrip()
+    if not head.startswith(b':'):
+        return None
+    
+    try:
+        text = head[1:].decode('utf-8', errors='ignore').lstrip()
+        header, _ = _header_decoder.raw_decode(text)
+    except ValueError:
+        return None  # En-tête tronqué
+    return header if isinstance(header, dict) else None
+
+def previous_save_path(save_path: str) -> str:
+    """
+    Retourne le chemin du fichier précédent d'une sauvegarde différentielle
+    
+    Args:
+        save_path: Chemin de la sauvegarde
+        
+    Returns:
+        Chemin du fichier précédent
+    """
+    directory, filename = os.path.split(save_path)
+    if filename.startswith('autosave_'):
+        filename = filename[len('autosave_'):]
+    return os.path.join(directory, PREVIOUS_AUTOSAVE_PREFIX + filename)
+
+def write_delta_save(save_data: Dict, save_path: str, state: Dict):
+    """
+    Écrit une sauvegarde différentielle
+    Une section identique à la précédente, et écrite en entier dans celle-ci,
+    est remplacée par UNCHANGED_MARKER. L'ancien fichier devient le fichier
+    précédent, où ces sections sont relues au chargement
+    
+    Args:
+        save_data: Données de la sauvegarde
+        save_path: Chemin de la sauvegarde
+        state: État conservé entre deux appels {section: (empreinte, écrite en entier)}
+    """
+    complete_delta_save(save_path)
+    if not os.path.exists(save_path):
+        state.clear()  # Rien sur quoi s'appuyer: tout écrire
+    
+    output = {}
+    new_state = {}
+    for key, value in save_data.items():
+        # L'en-tête est toujours écrit: il doit rester lisible sans le fichier précédent
+        if not isinstance(value, dict) or key == SAVE_HEADER_KEY:
+            output[key] = value
+            continue
+        
+        digest = hashlib.blake2b(json_io.dumps(value, indent=False), digest_size=8).digest()
+        if state.get(key) == (digest, True):
+            output[key] = UNCHANGED_MARKER
+            new_state[key] = (digest, False)
+        else:
+            output[key] = value
+            new_state[key] = (digest, True)
+    
+    # Écrire le nouveau fichier à côté, puis faire tourner les deux fichiers.
+    # Le fichier en attente n'apparaît qu'une fois complet: si la rotation est
+    # interrompue, complete_delta_save la termine et la sauvegarde est rétablie
+    next_path = save_path + PENDING_SAVE_SUFFIX
+    json_io.dump_file(output, next_path, indent=False, atomic=True)
+    if os.path.exists(save_path):
+        os.replace(save_path, previous_save_path(save_path))
+    try:
+        os.replace(next_path, save_path)
+    except FileNotFoundError:
+        # Rotation terminée entre-temps par complete_delta_save
+        if not os.path.exists(save_path):
+            raise
+    
+    state.clear()
+    state.update(new_state)
+
+def complete_delta_save(save_path: str) -> bool:
+    """
+    Termine la rotation d'une sauvegarde différentielle interrompue entre le
+    renommage de l'ancien fichier en fichier précédent et celui du nouveau
+    
+    Args:
+        save_path: Chemin de la sauvegarde
+        
+    Returns:
+        True si la sauvegarde a été rétablie
+    """
+    next_path = save_path + PENDING_SAVE_SUFFIX
+    if os.path.exists(save_path) or not os.path.exists(next_path):
+        return False
+    
+    try:
+        os.replace(next_path, save_path)
+    except FileNotFoundError:
+        # Rotation terminée entre-temps par l'écriture en cours
+        return False
+    return True
+
+def _copy_file_atomic(src_path: str, dest_path: str):
+    """
+    Copie un fichier dans un fichier temporaire puis le renomme,
+    pour ne jamais laisser une copie à moitié écrite à destination
+    
+    Args:
+        src_path: Chemin du fichier source
+        dest_path: Chemin de destination
+    """
+    tmp_path = dest_path + '.tmp'
+    try:
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def resolve_delta_save(save_data: Dict, save_path: str) -> Dict:
+    """
+    Remplace les marqueurs d'une sauvegarde différentielle par les sections
+    du fichier précédent
+    
+    Args:
+        save_data: Données lues depuis la sauvegarde
+        save_path: Chemin de la sauvegarde
+        
+    Returns:
+        Données complètes de la sauvegarde
+    """
+    unchanged = [key for key, value in save_data.items() if value == UNCHANGED_MARKER]
+    if not unchanged:
+        return save_data
+    
+    previous_data = json_io.load_file(previous_save_path(save_path))
+    for key in unchanged:
+        value = previous_data.get(key)
+        if value is None or value == UNCHANGED_MARKER:
+            raise ValueError(f"Section '{key}' absente de la sauvegarde précédente")
+        save_data[key] = value
+    
+    return save_data
 
 class SaveManager:
     """
@@ -19,6 +232,9 @@ class SaveManager:
         """
         self.saves_directory = SAVES_DIRECTORY
         self._ensure_saves_directory()
+        
+        # Index des métadonnées {fichier: {'mtime', 'size', 'info'}}, lu à la première recherche
+        self._index: Optional[Dict] = None
     
     def _ensure_saves_directory(self):
         """
@@ -44,13 +260,64 @@ class SaveManager:
             return saves
         
         try:
-            for filename in os.listdir(self.saves_directory):
-                if filename.endswith('.json'):
-                    save_path = os.path.join(self.saves_directory, filename)
-                    save_info = self._get_save_info(save_path)
-                    if save_info:
-                        save_info['filename'] = filename
-                        saves.append(save_info)
+            index = self._load_index()
+            new_index = {}
+            to_read = []  # (fichier, chemin, stat) des sauvegardes à relire
+            pending = []  # Sauvegardes différentielles dont la rotation a été interrompue
+            
+            # scandir fournit le nom et les informations du fichier en un seul parcours
+            with os.scandir(self.saves_directory) as entries:
+                for dir_entry in entries:
+                    filename = dir_entry.name
+                    if filename.endswith('.json' + PENDING_SAVE_SUFFIX):
+                        pending.append(filename[:-len(PENDING_SAVE_SUFFIX)])
+                        continue
+                    
+                    # Les fichiers précédents des sauvegardes différentielles ne se chargent pas seuls
+                    if not filename.endswith('.json') or filename.startswith(PREVIOUS_AUTOSAVE_PREFIX):
+                        continue
+                    
+                    file_stats = dir_entry.stat()
+                    if file_stats.st_size > MAX_SAVE_FILE_SIZE:
+                        continue
+                    
+                    # Ne relire que les fichiers modifiés depuis la dernière recherche
+                    entry = index.get(filename)
+                    if (entry and entry['mtime'] == file_stats.st_mtime
+                            and entry['size'] == file_stats.st_size):
+                        new_index[filename] = entry
+                    else:
+                        to_read.append((filename, dir_entry.path, file_stats))
+            
+            for filename in pending:
+                save_path = os.path.join(self.saves_directory, filename)
+                if complete_delta_save(save_path):
+                    to_read.append((filename, save_path, os.stat(save_path)))
+            
+            # Les sauvegardes modifiées sont lues en parallèle
+            if len(to_read) > 1:
+                with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_WORKERS, len(to_read))) as executor:
+                    infos = list(executor.map(lambda item: self._get_save_info(item[1], item[2]), to_read))
+            else:
+                infos = [self._get_save_info(path, file_stats) for _, path, file_stats in to_read]
+            
+            changed = False
+            for (filename, _, file_stats), save_info in zip(to_read, infos):
+                if not save_info:
+                    continue
+                new_index[filename] = {
+                    'mtime': file_stats.st_mtime,
+                    'size': file_stats.st_size,
+                    'info': save_info
+                }
+                changed = True
+            
+            saves = [dict(entry['info'], filename=filename) for filename, entry in new_index.items()]
+            
+            # Réécrire l'index si des fichiers ont été relus, ajoutés ou supprimés
+            self._index = new_index
+            if changed or len(new_index) != len(index):
+                self._write_index(new_index)
             
             # Trier par date de modification (plus récent en premier)
             saves.sort(key=lambda x: x.get('save_time', 0), reverse=True)
@@ -60,38 +327,86 @@ class SaveManager:
         
         return saves
     
-    def _get_save_info(self, save_path: str) -> Optional[Dict]:
+    def _load_index(self) -> Dict:
+        """
+        Retourne l'index des métadonnées, lu depuis le disque au premier appel
+        
+        Returns:
+            Dictionnaire {fichier: {'mtime', 'size', 'info'}}
+        """
+        if self._index is None:
+            try:
+                self._index = json_io.load_file(SAVES_INDEX_FILE)
+            except (OSError, ValueError):
+                # Index absent ou illisible: toutes les sauvegardes seront relues
+                self._index = {}
+        return self._index
+    
+    def _write_index(self, index: Dict):
+        """
+        Écrit l'index des métadonnées sur le disque
+        
+        Args:
+            index: Dictionnaire {fichier: {'mtime', 'size', 'info'}}
+        """
+        try:
+            json_io.dump_file(index, SAVES_INDEX_FILE, indent=False, atomic=True)
+        except Exception as e:
+            print(f"Impossible d'écrire l'index des sauvegardes: {e}")
+    
+    def _forget_save_info(self, filename: str):
+        """
+        Retire une sauvegarde de l'index des métadonnées, pour qu'elle soit
+        relue à la prochaine recherche même si sa date et sa taille n'ont pas
+        changé (résolution grossière de certains systèmes de fichiers)
+        
+        Args:
+            filename: Nom du fichier de sauvegarde
+        """
+        if self._index is not None:
+            self._index.pop(filename, None)
+    
+    def _get_save_info(self, save_path: str, file_stats: Optional[os.stat_result] = None) -> Optional[Dict]:
         """
         Extrait les informations d'un fichier de sauvegarde
         
         Args:
             save_path: Chemin vers le fichier de sauvegarde
+            file_stats: Informations du fichier déjà obtenues, relues si None
             
         Returns:
             Dictionnaire avec les informations de la sauvegarde
         """
         try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            # Seul l'en-tête est lu; les sauvegardes sans en-tête sont lues en entier
+            header = read_save_header(save_path)
+            if header is None:
+                save_data = resolve_delta_save(json_io.load_file(save_path), save_path)
+                header = build_save_header(save_data)
             
             # Informations du fichier
-            file_stats = os.stat(save_path)
+            if file_stats is None:
+                file_stats = os.stat(save_path)
             file_size = file_stats.st_size
             
             # Extraire les informations importantes
-            planet_name = save_data.get('planet', {}).get('name', 'Inconnu')
-            save_time = save_data.get('save_time', file_stats.st_mtime)
-            game_time = save_data.get('game_time', 0)
-            version = save_data.get('version', 'Inconnue')
+            planet_name = header.get('planet_name', 'Inconnu')
+            save_time = header.get('save_time')
+            if save_time is None:
+                save_time = file_stats.st_mtime
+            game_time = header.get('game_time', 0)
+            version = header.get('version', 'Inconnue')
             
             # Informations sur l'état du jeu
-            planet_data = save_data.get('planet', {})
+            temperature = header.get('temperature')
+            pressure = header.get('pressure')
+            oxygen = header.get('oxygen')
             habitability = 0
-            if 'temperature' in planet_data and 'pressure' in planet_data and 'oxygen' in planet_data:
+            if temperature is not None and pressure is not None and oxygen is not None:
                 # Calculer approximativement l'habitabilité
-                temp_diff = abs(planet_data['temperature'] - 15.0)
-                pressure_diff = abs(planet_data['pressure'] - 1.0)
-                oxygen_diff = abs(planet_data['oxygen'] - 21.0)
+                temp_diff = abs(temperature - 15.0)
+                pressure_diff = abs(pressure - 1.0)
+                oxygen_diff = abs(oxygen - 21.0)
                 
                 temp_score = max(0, 1 - (temp_diff / 20.0))
                 pressure_score = max(0, 1 - (pressure_diff / 0.3))
@@ -99,9 +414,8 @@ class SaveManager:
                 
                 habitability = (temp_score * 0.4 + pressure_score * 0.3 + oxygen_score * 0.3) * 100
             
-            resources = save_data.get('resources', {})
-            credits = resources.get('credits', 0)
-            science = resources.get('science', 0)
+            credits = header.get('credits', 0)
+            science = header.get('science', 0)
             
             return {
                 'planet_name': planet_name,
@@ -160,6 +474,24 @@ class SaveManager:
         else:
             return f"{size_bytes / (1024 * 1024):.1f} MB"
     
+    def _write_resolved_save(self, save_path: str, dest_path: str):
+        """
+        Copie une sauvegarde en résolvant ses sections différentielles,
+        pour que la copie puisse être chargée seule
+        
+        Args:
+            save_path: Chemin de la sauvegarde source
+            dest_path: Chemin de destination
+        """
+        # Sans fichier précédent, la sauvegarde est complète: copie directe des
+        # octets (sendfile ou équivalent), sans décoder ni réencoder le JSON
+        if not os.path.exists(previous_save_path(save_path)):
+            _copy_file_atomic(save_path, dest_path)
+            return
+        
+        save_data = json_io.load_file(save_path)
+        json_io.dump_file(resolve_delta_save(save_data, save_path), dest_path, atomic=True)
+    
     def delete_save(self, filename: str) -> bool:
         """
         Supprime un fichier de sauvegarde
@@ -174,6 +506,15 @@ class SaveManager:
             save_path = os.path.join(self.saves_directory, filename)
             if os.path.exists(save_path):
                 os.remove(save_path)
+                self._forget_save_info(filename)
+                
+                # Supprimer aussi le fichier précédent d'une sauvegarde différentielle
+                previous_path = previous_save_path(save_path)
+                if filename.startswith('autosave_') and os.path.exists(previous_path):
+                    os.remove(previous_path)
+                if os.path.exists(save_path + PENDING_SAVE_SUFFIX):
+                    os.remove(save_path + PENDING_SAVE_SUFFIX)
+                
                 print(f"Sauvegarde supprimée: {filename}")
                 return True
             else:
@@ -204,10 +545,8 @@ class SaveManager:
             backup_filename = f"{name_without_ext}_backup_{timestamp}.json"
             backup_path = os.path.join(self.saves_directory, backup_filename)
             
-            # Copier le fichier
-            with open(save_path, 'r', encoding='utf-8') as src:
-                with open(backup_path, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
+            # Copier la sauvegarde complète (sections différentielles résolues)
+            self._write_resolved_save(save_path, backup_path)
             
             print(f"Backup créé: {backup_filename}")
             return True
@@ -216,6 +555,25 @@ class SaveManager:
             print(f"Erreur lors de la création du backup: {e}")
             return False
     
+    def _list_autosave_files(self) -> List[str]:
+        """
+        Liste les sauvegardes automatiques sans en lire le contenu
+        
+        Returns:
+            Noms des fichiers, du plus récent au plus ancien (date de modification)
+        """
+        autosaves = []
+        with os.scandir(self.saves_directory) as entries:
+            for dir_entry in entries:
+                filename = dir_entry.name
+                # Les fichiers précédents sont supprimés avec leur sauvegarde
+                if (filename.endswith('.json') and 'autosave' in filename.lower()
+                        and not filename.startswith(PREVIOUS_AUTOSAVE_PREFIX)):
+                    autosaves.append((dir_entry.stat().st_mtime, filename))
+        
+        autosaves.sort(reverse=True)
+        return [filename for _, filename in autosaves]
+    
     def cleanup_old_autosaves(self, max_autosaves: int = 5):
         """
         Nettoie les anciennes sauvegardes automatiques
@@ -224,14 +582,13 @@ class SaveManager:
             max_autosaves: Nombre maximum de sauvegardes automatiques à conserver
         """
         try:
-            saves = self.get_save_files()
-            autosaves = [save for save in saves if save['is_autosave']]
+            autosaves = self._list_autosave_files()
             
             if len(autosaves) > max_autosaves:
                 # Supprimer les plus anciennes
                 autosaves_to_delete = autosaves[max_autosaves:]
-                for save in autosaves_to_delete:
-                    self.delete_save(save['filename'])
+                for filename in autosaves_to_delete:
+                    self.delete_save(filename)
                 
                 print(f"Nettoyé {len(autosaves_to_delete)} anciennes sauvegardes automatiques")
                 
@@ -254,9 +611,7 @@ class SaveManager:
             if not os.path.exists(save_path):
                 return False
             
-            with open(save_path, 'r', encoding='utf-8') as src:
-                with open(export_path, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
+            self._write_resolved_save(save_path, export_path)
             
             print(f"Sauvegarde exportée vers: {export_path}")
             return True
@@ -290,18 +645,20 @@ class SaveManager:
                 dest_filename += '.json'
             
             dest_path = os.path.join(self.saves_directory, dest_filename)
+            self._forget_save_info(dest_filename)
+            
+            # Lire le fichier une seule fois et vérifier que c'est une sauvegarde
+            # valide: le décoder en entier rejette aussi les fichiers tronqués
+            with open(import_path, 'rb') as f:
+                data = f.read()
+            save_data = json_io.loads(data)
+            if (not isinstance(save_data, dict)
+                    or 'planet' not in save_data or 'resources' not in save_data):
+                print("Fichier de sauvegarde invalide")
+                return False
             
-            # Vérifier que c'est un fichier de sauvegarde valide
-            with open(import_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-                if 'planet' not in save_data or 'resources' not in save_data:
-                    print("Fichier de sauvegarde invalide")
-                    return False
-            
-            # Copier le fichier
-            with open(import_path, 'r', encoding='utf-8') as src:
-                with open(dest_path, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
+            # Écrire les octets déjà lus, sans relire le fichier source
+            json_io.write_file(data, dest_path, atomic=True)
             
             print(f"Sauvegarde importée: {dest_filename}")
             return True